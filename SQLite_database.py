@@ -1,10 +1,12 @@
-import sqlite3
 import csv
 import os
 
+from bulk_loader import bulk_insert, bulk_load, create_indexes, savepoint
+from data_access import DB_PATH
+
 def infer_sqlite_type(value):
     """Infer SQLite column type from a sample value."""
-    if value.isdigit():
+    if value.isdigit() or (value[:1] == "-" and value[1:].isdigit()):
         return "INTEGER"
     try:
         float(value)
@@ -12,56 +14,126 @@ def infer_sqlite_type(value):
     except ValueError:
         return "TEXT"
 
-def create_table_from_csv(cursor, table_name, csv_path):
+# Widening order: a column only moves right, never back.
+TYPE_ORDER = ["INTEGER", "REAL", "TEXT"]
+
+# Columns the query REPLs filter on get an index after loading.
+INDEXED_COLUMN_WORDS = ("year", "team", "champion", "most wins", "most losses")
+
+def widen_type(current, value):
+    """Return the narrowest type that fits both the column so far and value."""
+    if current == "TEXT" or value == "":
+        return current
+    if current == "INTEGER" and value.isdigit():
+        return current
+    value_type = infer_sqlite_type(value)
+    if current is None:
+        return value_type
+    return max(current, value_type, key=TYPE_ORDER.index)
+
+def infer_column_types(csv_path):
+    """Scan every row of a CSV once and pick a type and key candidate per column.
+
+    Empty cells are treated as NULL and do not affect the type; a column with
+    no values at all becomes TEXT. Returns (headers, types, key_column,
+    has_empty) where has_empty[i] tells whether column i had any empty cell.
+    """
     with open(csv_path, newline="", encoding="utf-8") as csvfile:
         reader = csv.reader(csvfile)
         headers = next(reader)
-        sample_row = next(reader, None)
-        if not sample_row:
-            raise ValueError(f"CSV file {csv_path} is empty beyond header")
-
-        # Infer column types based on sample row
-        col_types = []
-        for val in sample_row:
-            col_types.append(infer_sqlite_type(val))
-
-        # Build CREATE TABLE statement
-        columns = [
-            f'"{header}" {col_type}'
-            for header, col_type in zip(headers, col_types)
-        ]
-        create_stmt = f'CREATE TABLE IF NOT EXISTS "{table_name}" ({", ".join(columns)});'
-        cursor.execute(create_stmt)
-
-        # Insert the sample row, then the rest
-        column_names = ', '.join(f'"{h}"' for h in headers)
-        placeholders = ', '.join('?' for _ in headers)
-        insert_stmt = f'INSERT INTO "{table_name}" ({column_names}) VALUES ({placeholders});'
-        
-        cursor.execute(insert_stmt, sample_row)
+        types = [None] * len(headers)
+        has_empty = [False] * len(headers)
+        # Columns that reached TEXT cannot widen further, so stop looking at them.
+        open_columns = list(range(len(headers)))
+        # Integer columns named like a key stay candidates while their
+        # values are non-empty and distinct.
+        key_values = {
+            i: set() for i, h in enumerate(headers)
+            if h.strip().lower() == "year" or h.strip().lower().endswith("id")
+        }
+        row_count = 0
         for row in reader:
-            cursor.execute(insert_stmt, row)
+            row_count += 1
+            if len(row) < len(headers):
+                row += [""] * (len(headers) - len(row))
+            for i in open_columns:
+                value = row[i]
+                if value == "":
+                    has_empty[i] = True
+                else:
+                    types[i] = widen_type(types[i], value)
+            if "TEXT" in types:
+                open_columns = [i for i in open_columns if types[i] != "TEXT"]
+            for i in list(key_values):
+                value = row[i]
+                if value == "" or value in key_values[i]:
+                    del key_values[i]
+                else:
+                    key_values[i].add(value)
+
+    if row_count == 0:
+        raise ValueError(f"CSV file {csv_path} is empty beyond header")
+    types = [t or "TEXT" for t in types]
+    key_column = next((headers[i] for i in key_values if types[i] == "INTEGER"), None)
+    return headers, types, key_column, has_empty
+
+def indexed_columns(headers, key_column=None):
+    return [
+        h for h in headers
+        if h != key_column and any(word in h.strip().lower() for word in INDEXED_COLUMN_WORDS)
+    ]
+
+def create_table_from_csv(cursor, table_name, csv_path):
+    headers, col_types, key_column, has_empty = infer_column_types(csv_path)
+
+    # Build CREATE TABLE statement; an INTEGER PRIMARY KEY becomes the rowid,
+    # so lookups on it need no separate index.
+    columns = [
+        f'"{header}" {col_type}' + (" PRIMARY KEY" if header == key_column else "")
+        for header, col_type in zip(headers, col_types)
+    ]
+    create_stmt = f'CREATE TABLE IF NOT EXISTS "{table_name}" ({", ".join(columns)});'
+    cursor.execute(create_stmt)
+
+    # Empty numeric cells load as NULL rather than as ''.
+    null_columns = [i for i, t in enumerate(col_types) if t != "TEXT" and has_empty[i]]
+    with open(csv_path, newline="", encoding="utf-8") as csvfile:
+        reader = csv.reader(csvfile)
+        next(reader)
+        rows = reader
+        if null_columns:
+            rows = (
+                [None if i in null_columns and value == "" else value for i, value in enumerate(row)]
+                for row in reader
+            )
+        bulk_insert(cursor.connection, table_name, headers, rows)
+
+    create_indexes(cursor.connection, table_name, indexed_columns(headers, key_column))
 
 def import_csvs_to_sqlite(db_path, csv_files):
     if not csv_files:
         print("No CSV files provided to import.")
         return
 
-    with sqlite3.connect(db_path) as conn:
+    # One transaction for the whole import; each file gets a savepoint so a
+    # bad file is rolled back on its own without losing the others.
+    with bulk_load(db_path) as conn:
         cursor = conn.cursor()
         for csv_file in csv_files:
             table_name = os.path.splitext(os.path.basename(csv_file))[0]
             try:
                 print(f"Importing {csv_file} into table '{table_name}'")
-                create_table_from_csv(cursor, table_name, csv_file)
-                conn.commit()
+                with savepoint(conn, table_name):
+                    create_table_from_csv(cursor, table_name, csv_file)
                 print(f"Successfully imported {csv_file}")
             except Exception as e:
                 print(f"Error importing {csv_file}: {e}")
 
 if __name__ == "__main__":
-    # Example usage - update these paths as needed
-    database_path = "mlb_data.db"
-    csv_files_to_import = ["mlb_history_sections.csv", "mlb_stats_summary.csv"]
+    # Example usage - update these paths as needed. The raw CSV tables go next
+    # to import_to_db.py's, so query_database.py can reach both.
+    database_path = DB_PATH
+    csv_files_to_import = ["mlb_history_sections.csv", "mlb_stats_summary.csv", "mlb_team_standings.csv"]
+    csv_files_to_import = [path for path in csv_files_to_import if os.path.exists(path)]
 
     import_csvs_to_sqlite(database_path, csv_files_to_import)
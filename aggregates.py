@@ -0,0 +1,115 @@
+"""Materialized aggregate tables kept up to date by triggers.
+
+    champion_counts(champion, championships)
+    team_mentions(team, most_wins, most_losses, mentions)
+    decade_summary(decade, seasons, champions_found, team_seasons, games)
+
+They are filled from team_stats and standings with one GROUP BY each when
+the database is (re)built, and from then on every INSERT, UPDATE or DELETE
+on those tables adjusts the affected rows, so re-importing a few seasons
+never rescans history.
+"""
+
+NOT_FOUND = "Not found"
+
+AGGREGATE_TABLES = [
+    """
+    CREATE TABLE champion_counts (
+        champion TEXT PRIMARY KEY,
+        championships INTEGER NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE team_mentions (
+        team TEXT PRIMARY KEY,
+        most_wins INTEGER NOT NULL DEFAULT 0,
+        most_losses INTEGER NOT NULL DEFAULT 0,
+        mentions INTEGER GENERATED ALWAYS AS (most_wins + most_losses) VIRTUAL
+    )
+    """,
+    """
+    CREATE TABLE decade_summary (
+        decade INTEGER PRIMARY KEY,
+        seasons INTEGER NOT NULL DEFAULT 0,
+        champions_found INTEGER NOT NULL DEFAULT 0,
+        team_seasons INTEGER NOT NULL DEFAULT 0,
+        games INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+]
+
+# One pass over each base table rebuilds everything.
+REBUILD = [
+    "INSERT INTO champion_counts (champion, championships) SELECT champion, COUNT(*) FROM team_stats GROUP BY champion",
+    """
+    INSERT INTO team_mentions (team, most_wins, most_losses)
+    SELECT team, SUM(w), SUM(l) FROM (
+        SELECT most_wins AS team, 1 AS w, 0 AS l FROM team_stats
+        UNION ALL
+        SELECT most_losses, 0, 1 FROM team_stats
+    ) GROUP BY team
+    """,
+    f"""
+    INSERT INTO decade_summary (decade, seasons, champions_found)
+    SELECT year / 10 * 10, COUNT(*), SUM(champion <> '{NOT_FOUND}') FROM team_stats GROUP BY 1
+    """,
+    """
+    INSERT INTO decade_summary (decade, team_seasons, games)
+    SELECT year / 10 * 10, COUNT(*), SUM(wins + losses) FROM standings WHERE true GROUP BY 1
+    ON CONFLICT (decade) DO UPDATE SET team_seasons = excluded.team_seasons, games = excluded.games
+    """,
+]
+
+# Statement bodies shared by the triggers: add one season's contribution
+# (sign 1, using new.*) or take it away (sign -1, using old.*).
+def _team_stats_delta(row, sign):
+    return f"""
+        INSERT INTO champion_counts (champion, championships) VALUES ({row}.champion, {sign})
+            ON CONFLICT (champion) DO UPDATE SET championships = championships + {sign};
+        INSERT INTO team_mentions (team, most_wins) VALUES ({row}.most_wins, {sign})
+            ON CONFLICT (team) DO UPDATE SET most_wins = most_wins + {sign};
+        INSERT INTO team_mentions (team, most_losses) VALUES ({row}.most_losses, {sign})
+            ON CONFLICT (team) DO UPDATE SET most_losses = most_losses + {sign};
+        INSERT INTO decade_summary (decade, seasons, champions_found)
+            VALUES ({row}.year / 10 * 10, {sign}, {sign} * ({row}.champion <> '{NOT_FOUND}'))
+            ON CONFLICT (decade) DO UPDATE SET
+                seasons = seasons + excluded.seasons,
+                champions_found = champions_found + excluded.champions_found;
+    """
+
+def _standings_delta(row, sign):
+    return f"""
+        INSERT INTO decade_summary (decade, team_seasons, games)
+            VALUES ({row}.year / 10 * 10, {sign}, {sign} * ({row}.wins + {row}.losses))
+            ON CONFLICT (decade) DO UPDATE SET
+                team_seasons = team_seasons + excluded.team_seasons,
+                games = games + excluded.games;
+    """
+
+PRUNE = """
+        DELETE FROM champion_counts WHERE championships <= 0;
+        DELETE FROM team_mentions WHERE most_wins <= 0 AND most_losses <= 0;
+        DELETE FROM decade_summary WHERE seasons <= 0 AND team_seasons <= 0;
+"""
+
+TRIGGERS = [
+    f"CREATE TRIGGER team_stats_agg_insert AFTER INSERT ON team_stats BEGIN {_team_stats_delta('new', 1)} END",
+    f"CREATE TRIGGER team_stats_agg_delete AFTER DELETE ON team_stats BEGIN {_team_stats_delta('old', -1)} {PRUNE} END",
+    f"""CREATE TRIGGER team_stats_agg_update AFTER UPDATE ON team_stats BEGIN
+        {_team_stats_delta('old', -1)} {_team_stats_delta('new', 1)} {PRUNE} END""",
+    f"CREATE TRIGGER standings_agg_insert AFTER INSERT ON standings BEGIN {_standings_delta('new', 1)} END",
+    f"CREATE TRIGGER standings_agg_delete AFTER DELETE ON standings BEGIN {_standings_delta('old', -1)} {PRUNE} END",
+    f"""CREATE TRIGGER standings_agg_update AFTER UPDATE ON standings BEGIN
+        {_standings_delta('old', -1)} {_standings_delta('new', 1)} {PRUNE} END""",
+]
+
+def create_aggregates(conn):
+    """(Re)build the aggregate tables from team_stats and standings and install the triggers."""
+    for table in ("champion_counts", "team_mentions", "decade_summary"):
+        conn.execute(f"DROP TABLE IF EXISTS {table}")
+    for trigger in ("team_stats_agg_insert", "team_stats_agg_delete", "team_stats_agg_update",
+                    "standings_agg_insert", "standings_agg_delete", "standings_agg_update"):
+        conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    # Separate execute() calls: executescript() would commit the caller's transaction.
+    for statement in AGGREGATE_TABLES + REBUILD + TRIGGERS:
+        conn.execute(statement)
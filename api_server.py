@@ -0,0 +1,314 @@
+"""Read-only JSON API over the baseball database, one asyncio process.
+
+    GET /seasons    ?years=FIRST-LAST
+    GET /standings  ?years=FIRST-LAST  &team=SUBSTRING
+    GET /events     ?years=FIRST-LAST
+    GET /search     ?q=TERMS  &years=FIRST-LAST
+
+Every endpoint also takes limit (default 50, at most 500) and after, and
+answers {"data": [...], "next": CURSOR or null}. Pass next back as after for
+the following page. Pages are keyset-paginated: the cursor holds the sort
+key of the last row, so page 100 costs the same index probe as page 1,
+unlike OFFSET.
+
+Each response carries an ETag built from the database's version and the
+request. A client sending it back in If-None-Match gets 304 Not Modified
+without a query being run, until the next load commits. Bodies of recent
+responses are kept in memory for the same reason.
+
+Queries run on a small thread pool over data_access's read-only connection
+pool, so the event loop keeps accepting and answering other clients.
+
+    python api_server.py --port 8000
+    curl 'http://127.0.0.1:8000/standings?years=1950-1959&team=yankees'
+"""
+import argparse
+import asyncio
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import sqlite3
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+from data_access import DB_PATH, DEFAULT_POOL_SIZE, database_signature, read_pool
+from event_search import YEAR_RANGE, fts_query
+
+DEFAULT_LIMIT = 50
+MAX_LIMIT = 500
+MAX_HEADER_BYTES = 16 * 1024
+IDLE_TIMEOUT = 30          # seconds a keep-alive connection may sit unused
+CACHED_RESPONSES = 256
+GZIP_MIN_BYTES = 1024
+
+logger = logging.getLogger(__name__)
+
+class BadRequest(ValueError):
+    pass
+
+def encode_cursor(key):
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode().rstrip("=")
+
+def decode_cursor(text):
+    try:
+        return json.loads(base64.urlsafe_b64decode(text + "=" * (-len(text) % 4)))
+    except ValueError:
+        raise BadRequest(f"invalid cursor {text!r}")
+
+def parse_year_range(params):
+    text = params.get("years")
+    if text is None:
+        return None
+    match = YEAR_RANGE.match(text)
+    if not match:
+        raise BadRequest(f"years: expected YEAR or FIRST-LAST, got {text!r}")
+    first, last = int(match.group(1)), int(match.group(2) or match.group(1))
+    return min(first, last), max(first, last)
+
+def is_number(value, types):
+    return isinstance(value, types) and not isinstance(value, bool)
+
+def int_key(after, default):
+    if after is None:
+        return default
+    if not is_number(after, int):
+        raise BadRequest("invalid cursor")
+    return after
+
+def key_pair(after, types=(int, int)):
+    """after as a two-item cursor whose items have the given types ([-1, -1] when absent)."""
+    if after is None:
+        return [-1, -1]
+    if not (isinstance(after, list) and len(after) == 2
+            and all(is_number(value, t) for value, t in zip(after, types))):
+        raise BadRequest("invalid cursor")
+    return after
+
+def parse_limit(params):
+    text = params.get("limit", str(DEFAULT_LIMIT))
+    if not text.isdigit() or not 1 <= int(text) <= MAX_LIMIT:
+        raise BadRequest(f"limit: expected 1-{MAX_LIMIT}, got {text!r}")
+    return int(text)
+
+# Each endpoint returns (sql, params, key) for one page. The query selects
+# limit + 1 rows so we know whether there is a next page without counting;
+# key(row) is the sort key the next page continues after.
+
+def seasons_query(params, after, limit):
+    sql = "SELECT year, most_wins, most_losses, champion FROM team_stats WHERE year > ?"
+    args = [int_key(after, -1)]
+    years = parse_year_range(params)
+    if years:
+        sql += " AND year BETWEEN ? AND ?"
+        args += years
+    sql += " ORDER BY year LIMIT ?"
+    return sql, args + [limit + 1], lambda row: row["year"]
+
+def standings_query(params, after, limit):
+    # (year, team_id) is the standings primary key, so the row-value
+    # comparison is a range scan of the table itself.
+    sql = """
+        SELECT s.year, s.team_id, t.name AS team, s.wins, s.losses,
+               round(1.0 * s.wins / nullif(s.wins + s.losses, 0), 3) AS win_pct
+        FROM standings s
+        JOIN teams t ON t.team_id = s.team_id
+        WHERE (s.year, s.team_id) > (?, ?)
+    """
+    args = list(key_pair(after))
+    years = parse_year_range(params)
+    if years:
+        sql += " AND s.year BETWEEN ? AND ?"
+        args += years
+    if params.get("team"):
+        sql += " AND s.team_id IN (SELECT team_id FROM teams WHERE name LIKE ?)"
+        args.append(f"%{params['team']}%")
+    sql += " ORDER BY s.year, s.team_id LIMIT ?"
+    return sql, args + [limit + 1], lambda row: [row["year"], row["team_id"]]
+
+def events_query(params, after, limit):
+    # id is event_sections' rowid: scrape order, and part of every index entry.
+    sql = "SELECT id, year, section, content FROM event_data WHERE id > ?"
+    args = [int_key(after, 0)]
+    years = parse_year_range(params)
+    if years:
+        sql += " AND year BETWEEN ? AND ?"
+        args += years
+    sql += " ORDER BY id LIMIT ?"
+    return sql, args + [limit + 1], lambda row: row["id"]
+
+def search_query(params, after, limit):
+    terms = fts_query(params.get("q", ""))
+    if not terms:
+        raise BadRequest("q: search terms are required")
+    # Best matches first; section_id breaks ties (a text shared by several
+    # years scores the same for each) so the order is total.
+    sql = """
+        SELECT e.section_id AS id, e.year, e.section,
+               snippet(event_fts, 0, '[', ']', '...', 16) AS snippet,
+               bm25(event_fts) AS score
+        FROM event_fts
+        JOIN event_sections e ON e.text_id = event_fts.rowid
+        WHERE event_fts MATCH ?
+    """
+    args = [terms]
+    if after is not None:
+        score, section_id = key_pair(after, ((int, float), int))
+        sql += " AND (bm25(event_fts) > ? OR (bm25(event_fts) = ? AND e.section_id > ?))"
+        args += [score, score, section_id]
+    years = parse_year_range(params)
+    if years:
+        sql += " AND e.year BETWEEN ? AND ?"
+        args += years
+    sql += " ORDER BY score, id LIMIT ?"
+    return sql, args + [limit + 1], lambda row: [row["score"], row["id"]]
+
+ENDPOINTS = {
+    "/seasons": seasons_query,
+    "/standings": standings_query,
+    "/events": events_query,
+    "/search": search_query,
+}
+
+def run_page(pool, endpoint, params):
+    """One page of results for endpoint as a JSON-ready dict (runs on a worker thread)."""
+    after = decode_cursor(params["after"]) if "after" in params else None
+    limit = parse_limit(params)
+    sql, args, key = ENDPOINTS[endpoint](params, after, limit)
+    with pool.connection() as conn:
+        cursor = conn.execute(sql, args)
+        columns = [d[0] for d in cursor.description]
+        rows = [dict(zip(columns, row)) for row in cursor]
+    more = len(rows) > limit
+    rows = rows[:limit]
+    return {"data": rows, "next": encode_cursor(key(rows[-1])) if more else None}
+
+class ApiServer:
+    def __init__(self, db_path=DB_PATH, pool_size=DEFAULT_POOL_SIZE):
+        self.db_path = db_path
+        self.pool = read_pool(db_path, pool_size)
+        self.executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="query")
+        self._responses = OrderedDict()   # etag -> JSON body, most recent last
+
+    def etag(self, endpoint, params):
+        version = repr((database_signature(self.db_path), endpoint, sorted(params.items())))
+        return '"' + hashlib.sha1(version.encode()).hexdigest() + '"'
+
+    async def respond(self, method, target, headers):
+        """(status, extra headers, body bytes) for one request."""
+        if method not in ("GET", "HEAD"):
+            return error(HTTPStatus.METHOD_NOT_ALLOWED, f"{method} is not supported")
+        url = urlsplit(target)
+        if url.path not in ENDPOINTS:
+            return error(HTTPStatus.NOT_FOUND, f"no endpoint {url.path}; try {', '.join(ENDPOINTS)}")
+        params = {k: v[-1] for k, v in parse_qs(url.query).items()}
+
+        etag = self.etag(url.path, params)
+        response_headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if etag in [tag.strip() for tag in headers.get("if-none-match", "").split(",")]:
+            return HTTPStatus.NOT_MODIFIED, response_headers, b""
+        body = self._responses.get(etag)
+        if body is not None:
+            self._responses.move_to_end(etag)
+            return HTTPStatus.OK, response_headers, body
+
+        loop = asyncio.get_running_loop()
+        try:
+            page = await loop.run_in_executor(self.executor, run_page, self.pool, url.path, params)
+        except BadRequest as e:
+            return error(HTTPStatus.BAD_REQUEST, str(e))
+        except sqlite3.Error as e:
+            logger.error("%s failed: %s", target, e)
+            return error(HTTPStatus.SERVICE_UNAVAILABLE, f"database error: {e}")
+        body = json.dumps(page).encode()
+        self._responses[etag] = body
+        if len(self._responses) > CACHED_RESPONSES:
+            self._responses.popitem(last=False)
+        return HTTPStatus.OK, response_headers, body
+
+    async def handle(self, reader, writer):
+        """Serve one client connection, several requests if it keeps it alive."""
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), IDLE_TIMEOUT)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    return
+                except asyncio.LimitOverrunError:
+                    await send(writer, *error(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "headers too large"),
+                               keep_alive=False)
+                    return
+                lines = head.decode("latin-1").split("\r\n")
+                try:
+                    method, target, version = lines[0].split(" ")
+                except ValueError:
+                    await send(writer, *error(HTTPStatus.BAD_REQUEST, "malformed request line"), keep_alive=False)
+                    return
+                headers = {}
+                for line in lines[1:]:
+                    name, _, value = line.partition(":")
+                    if name:
+                        headers[name.strip().lower()] = value.strip()
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" and (version == "HTTP/1.1" or connection == "keep-alive")
+
+                status, response_headers, body = await self.respond(method, target, headers)
+                if body and len(body) >= GZIP_MIN_BYTES and "gzip" in headers.get("accept-encoding", ""):
+                    body = gzip.compress(body, compresslevel=5)
+                    response_headers["Content-Encoding"] = "gzip"
+                    response_headers["Vary"] = "Accept-Encoding"
+                await send(writer, status, response_headers, b"" if method == "HEAD" else body,
+                           keep_alive=keep_alive, length=len(body))
+                if not keep_alive:
+                    return
+        finally:
+            writer.close()
+
+    async def serve(self, host, port):
+        server = await asyncio.start_server(self.handle, host, port, limit=MAX_HEADER_BYTES)
+        logger.info("Serving %s on http://%s:%d", self.db_path, host, port)
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        self.executor.shutdown()
+        self.pool.close()
+
+def error(status, message):
+    return status, {}, json.dumps({"error": message}).encode()
+
+async def send(writer, status, headers, body, keep_alive=True, length=None):
+    lines = [f"HTTP/1.1 {status.value} {status.phrase}"]
+    if status != HTTPStatus.NOT_MODIFIED:
+        lines.append("Content-Type: application/json")
+        lines.append(f"Content-Length: {len(body) if length is None else length}")
+    lines += [f"{name}: {value}" for name, value in headers.items()]
+    lines.append("Connection: " + ("keep-alive" if keep_alive else "close"))
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+    try:
+        await writer.drain()
+    except ConnectionError:
+        pass
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--db", default=DB_PATH, help="database to serve (default: %(default)s)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--pool-size", type=int, default=DEFAULT_POOL_SIZE,
+                        help="read-only connections and query threads (default: %(default)s)")
+    args = parser.parse_args()
+    logging.basicConfig(level="INFO", format="%(asctime)s %(levelname)s %(message)s")
+    server = ApiServer(args.db, args.pool_size)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark champion extraction over the scraped section text.
+
+Compares the old per-call regex compilation and five-keyword line scan with
+champion_matcher's precompiled matcher, over every Content line of
+mlb_history_sections.csv (about 3,400 lines from a full crawl).
+
+    python bench_champion.py --repeat 5
+"""
+import argparse
+import csv
+import re
+import time
+
+from champion_matcher import TEAM_SUFFIXES, ChampionMatcher, clean_champion_text, mentions_champion
+
+LEGACY_KEYWORDS = ["world series champion", "world champion", "champion", "pennant winner", "league champion"]
+
+def legacy_extract(line):
+    # extract_champion_team as it was: both patterns rebuilt on every call.
+    suffix_pattern = "|".join(TEAM_SUFFIXES)
+    pattern = re.compile(
+        rf"champion(?:ship)?(?:\s*[\:\-–]?\s*)([A-Z][a-zA-Z\s]*?(?:{suffix_pattern}))\b",
+        re.IGNORECASE
+    )
+    match = pattern.search(line)
+    if match:
+        return clean_champion_text(match.group(1))
+    alt_pattern = re.compile(
+        rf"(?:champion|pennant winner|league champion)(?:ship)?(?:\s*[\:\-–]?\s*)([A-Z][a-zA-Z\s]*?(?:{suffix_pattern}))\b",
+        re.IGNORECASE
+    )
+    alt_match = alt_pattern.search(line)
+    if alt_match:
+        return clean_champion_text(alt_match.group(1))
+    return "Not found"
+
+def legacy(lines):
+    found = []
+    for line in lines:
+        lowered = line.lower()
+        if any(kw in lowered for kw in LEGACY_KEYWORDS):
+            found.append(legacy_extract(line))
+    return found
+
+def precompiled(lines, matcher, teams):
+    return [matcher.match(line, teams)[0] for line in lines if mentions_champion(line.lower())]
+
+def best_of(repeat, func, *args):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--csv", default="mlb_history_sections.csv")
+    parser.add_argument("--stats-csv", default="mlb_stats_summary.csv",
+                        help="team names from here are passed to the matcher as known teams")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with open(args.csv, newline="", encoding="utf-8") as f:
+        lines = [row["Content"] for row in csv.DictReader(f)]
+    matcher = ChampionMatcher()
+    with open(args.stats_csv, newline="", encoding="utf-8") as f:
+        teams = {name for row in csv.DictReader(f) for name in (row["Most Wins"], row["Most Losses"])}
+
+    legacy_time, legacy_found = best_of(args.repeat, legacy, lines)
+    new_time, new_found = best_of(args.repeat, precompiled, lines, matcher, teams)
+    agree = sum(1 for a, b in zip(legacy_found, new_found) if a == b)
+
+    print(f"{len(lines)} lines, {len(new_found)} mention a champion, best of {args.repeat}")
+    print(f"legacy      {legacy_time * 1000:8.1f} ms  {len(lines) / legacy_time:10.0f} lines/s")
+    print(f"precompiled {new_time * 1000:8.1f} ms  {len(lines) / new_time:10.0f} lines/s")
+    print(f"speedup {legacy_time / new_time:.1f}x, same team on {agree}/{len(new_found)} candidate lines")
+
+if __name__ == "__main__":
+    main()
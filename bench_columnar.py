@@ -0,0 +1,92 @@
+"""Load time and memory of the CSVs vs their Arrow/Parquet copies.
+
+Scales mlb_stats_summary.csv and mlb_history_sections.csv up by repeating
+every season (as bench_queries.py does), writes the columnar copies with
+columnar.write_columnar, then loads each file the way its consumers do:
+
+  dataframe  what dashboard_data does: pd.read_csv vs Arrow -> pandas
+  rows       what import_to_db does: csv.DictReader vs columnar.iter_rows
+  mmap       open the .arrow file and count champions without leaving Arrow
+
+Every load runs in a fresh interpreter so its RSS is not polluted by the
+previous one.
+
+    python bench_columnar.py --scale 200
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from bench_queries import write_scaled_csv
+
+def rss_mb():
+    # Current resident set from /proc (Linux); second field is resident pages.
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * resource.getpagesize() / 2**20
+
+def load(kind, path):
+    """Run one load in this process and return its timing and memory figures."""
+    import pandas as pd
+    import pyarrow.compute as pc
+
+    from bulk_loader import read_rows
+    from columnar import open_table
+
+    before = rss_mb()
+    start = time.perf_counter()
+    if kind == "dataframe":
+        loaded = pd.read_csv(path) if path.endswith(".csv") else open_table(path).to_pandas()
+        rows = len(loaded)
+    elif kind == "rows":
+        loaded = None
+        rows = sum(1 for _ in read_rows(path, lambda row: row))
+    else:
+        loaded = open_table(path)
+        column = "Champion" if "Champion" in loaded.column_names else "Section"
+        pc.value_counts(loaded[column])
+        rows = loaded.num_rows
+    seconds = time.perf_counter() - start
+    # Measured while the loaded data is still referenced.
+    return {"rows": rows, "seconds": seconds, "rss_mb": rss_mb() - before}
+
+def run_child(kind, path):
+    out = subprocess.run([sys.executable, __file__, "--load", kind, path],
+                         check=True, capture_output=True, text=True).stdout
+    return json.loads(out)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, default=100, help="copies of every season (default: 100)")
+    parser.add_argument("--load", nargs=2, metavar=("KIND", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.load:
+        print(json.dumps(load(*args.load)))
+        return
+
+    from columnar import write_columnar
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in ("mlb_stats_summary.csv", "mlb_history_sections.csv"):
+            csv_path = os.path.join(tmp, name)
+            write_scaled_csv(name, csv_path, args.scale)
+            arrow_path, parquet_path = write_columnar(csv_path)
+            print(f"\n{name} x{args.scale}: "
+                  + ", ".join(f"{os.path.splitext(p)[1]} {os.path.getsize(p) / 1e6:.1f} MB"
+                              for p in (csv_path, arrow_path, parquet_path)))
+            print(f"{'load':<10} {'file':<9} {'rows':>10} {'seconds':>9} {'RSS +MB':>8}")
+            for kind, paths in (("dataframe", (csv_path, arrow_path, parquet_path)),
+                                ("rows", (csv_path, arrow_path)),
+                                ("mmap", (arrow_path,))):
+                for path in paths:
+                    result = run_child(kind, path)
+                    print(f"{kind:<10} {os.path.splitext(path)[1]:<9} {result['rows']:>10,} "
+                          f"{result['seconds']:>9.3f} {result['rss_mb']:>8.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""Parse-throughput benchmark for the scraper, no browser or network needed.
+
+Runs over pages saved by the scraper's page cache, a directory of saved
+pages, or a corpus written by fixture_corpus.py. By default it compares the
+old table search (html.parser + get_text() on every table + a second
+row-walking pass) with page_parser's single-pass classifier. --full instead
+times everything scrape_year does after the fetch (parse, stats, champion,
+sections) and breaks it down by stage. When the pages come with an
+expected.json (fixture corpora do), --full also checks the extracted stats.
+
+    python bench_parse.py --cache-dir page_cache
+    python bench_parse.py --html-dir saved_pages --repeat 5
+    python fixture_corpus.py --size 2 --out-dir fixtures
+    python bench_parse.py --html-dir fixtures --full
+"""
+import argparse
+import glob
+import json
+import os
+import re
+import time
+from collections import defaultdict
+
+from bs4 import BeautifulSoup
+
+from page_cache import DEFAULT_CACHE_DIR, PageCache
+from page_parser import (
+    HTML_PARSER, classify_tables, extract_yearly_content, extract_yearly_stats, parse_page,
+    select_standings_table,
+)
+from scrape_metrics import YearMetrics
+
+YEAR_IN_NAME = re.compile(r"yr(\d{4})")
+
+def legacy_select_table(soup):
+    # The table search get_yearly_stats used before the one-pass classifier.
+    tables = soup.find_all("table")
+    for table in tables:
+        caption = table.find("caption")
+        caption_text = caption.get_text(strip=True).lower() if caption else ""
+        table_text = table.get_text(separator=" ").lower()
+        if "standings" in caption_text or "standings" in table_text:
+            return table
+    for table in tables:
+        rows = table.find_all("tr")
+        if len(rows) < 5:
+            continue
+        for row in rows[1:]:
+            cols = row.find_all("td")
+            if len(cols) >= 3:
+                try:
+                    int(cols[1].get_text(strip=True))
+                    int(cols[2].get_text(strip=True))
+                    return table
+                except ValueError:
+                    continue
+    return None
+
+def legacy(html):
+    return legacy_select_table(BeautifulSoup(html, "html.parser"))
+
+def single_pass(html):
+    return select_standings_table(classify_tables(parse_page(html)))
+
+class RowCounter:
+    # Stands in for the CSV writer extract_yearly_content expects.
+    rows = 0
+
+    def writerow(self, row):
+        self.rows += 1
+
+def page_year(name, default):
+    match = YEAR_IN_NAME.search(name)
+    return int(match.group(1)) if match else default
+
+def load_pages(cache_dir=None, html_dir=None):
+    """[(year, html)] from a directory (searched recursively) or the page cache."""
+    if html_dir:
+        pages = []
+        paths = sorted(glob.glob(os.path.join(html_dir, "**", "*.html"), recursive=True)
+                       + glob.glob(os.path.join(html_dir, "**", "yr*.shtml"), recursive=True))
+        for i, path in enumerate(paths):
+            with open(path, encoding="utf-8") as f:
+                pages.append((page_year(os.path.basename(path), i), f.read()))
+        return pages
+    cache = PageCache(cache_dir, offline=True)
+    pages = [(page_year(url, i), cache.get(url)) for i, url in enumerate(cache.urls())]
+    return [(year, html) for year, html in pages if html]
+
+def time_parser(func, pages, repeat):
+    best = float("inf")
+    found = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        found = sum(1 for _, html in pages if func(html) is not None)
+        best = min(best, time.perf_counter() - start)
+    return best, found
+
+def run_full(pages):
+    """Everything scrape_year does after the fetch; returns (stats by year, stage seconds, sections)."""
+    stages = defaultdict(float)
+    stats = {}
+    writer = RowCounter()
+    for year, html in pages:
+        metrics = YearMetrics(year)
+        with metrics.stage("parse"):
+            soup = parse_page(html)
+        stats[year] = extract_yearly_stats(soup, str(year), metrics)
+        extract_yearly_content(soup, year, writer, metrics)
+        for name, seconds in metrics.stages.items():
+            stages[name] += seconds
+    return stats, stages, writer.rows
+
+def check_expected(stats, expected_path):
+    with open(expected_path, encoding="utf-8") as f:
+        expected = {int(year): want for year, want in json.load(f).items()}
+    wrong = []
+    for year, want in expected.items():
+        got = stats.get(year)
+        got = got and {"most_wins": got["most_wins"], "most_losses": got["most_losses"],
+                       "champion": got["champion"], "teams": len(got["teams"])}
+        if got != want:
+            wrong.append((year, want, got))
+    print(f"checked {len(expected)} pages against {expected_path}: {len(wrong)} wrong")
+    for year, want, got in wrong[:5]:
+        print(f"  {year}: expected {want}, got {got}")
+
+def bench_full(pages, megabytes, repeat, expected_path):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        stats, stages, sections = run_full(pages)
+        elapsed = time.perf_counter() - start
+        if elapsed < best:
+            best, best_stages = elapsed, stages
+    print(f"{'full (' + HTML_PARSER + ')':<28} {best:8.3f}s  {len(pages) / best:8.1f} pages/s  "
+          f"{megabytes / best:6.2f} MB/s  sections: {sections}")
+    for name, seconds in sorted(best_stages.items(), key=lambda kv: -kv[1]):
+        print(f"  {name:<12} {seconds:8.3f}s  {seconds / best:6.1%}")
+    if expected_path and os.path.exists(expected_path):
+        check_expected(stats, expected_path)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    parser.add_argument("--html-dir", help="read *.html files from here instead of the page cache")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per parser; the best is reported")
+    parser.add_argument("--full", action="store_true",
+                        help="time the whole post-fetch pipeline per page instead of table detection")
+    args = parser.parse_args()
+
+    pages = load_pages(args.cache_dir, args.html_dir)
+    if not pages:
+        print("No pages found. Run web_scraping.py once to fill the cache, or pass --html-dir.")
+        return
+    megabytes = sum(len(html.encode("utf-8")) for _, html in pages) / 1e6
+    print(f"{len(pages)} pages, {megabytes:.1f} MB, best of {args.repeat}")
+
+    if args.full:
+        expected_path = os.path.join(args.html_dir, "expected.json") if args.html_dir else None
+        bench_full(pages, megabytes, args.repeat, expected_path)
+        return
+
+    for name, func in [("legacy (html.parser)", legacy), (f"single-pass ({HTML_PARSER})", single_pass)]:
+        elapsed, found = time_parser(func, pages, args.repeat)
+        print(f"{name:<28} {elapsed:8.3f}s  {len(pages) / elapsed:8.1f} pages/s  "
+              f"{megabytes / elapsed:6.2f} MB/s  tables found: {found}")
+
+if __name__ == "__main__":
+    main()
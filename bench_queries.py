@@ -0,0 +1,105 @@
+"""Before/after timings for the REPL query shapes on SQLite_database imports.
+
+Builds the same database twice from mlb_stats_summary.csv and
+mlb_history_sections.csv, scaled up by repeating every season under new
+year numbers:
+
+  before  column types from the first row only, no keys, no indexes
+  after   SQLite_database.import_csvs_to_sqlite (full-column types, keys, indexes)
+
+and times year and team lookups against each.
+
+    python bench_queries.py --scale 200
+"""
+import argparse
+import csv
+import os
+import sqlite3
+import tempfile
+import time
+
+from SQLite_database import import_csvs_to_sqlite, infer_sqlite_type
+
+def write_scaled_csv(src, dest, scale):
+    # Copy k of every season shifted by k * 1000 years so year lookups stay selective.
+    with open(src, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        headers = next(reader)
+        rows = list(reader)
+    with open(dest, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(headers)
+        for k in range(scale):
+            for row in rows:
+                writer.writerow([int(row[0]) + k * 1000] + row[1:])
+
+def legacy_import(db_path, csv_files):
+    # The importer as it was: first-row types, row-by-row inserts, no indexes.
+    with sqlite3.connect(db_path) as conn:
+        for csv_file in csv_files:
+            table = os.path.splitext(os.path.basename(csv_file))[0]
+            with open(csv_file, newline="", encoding="utf-8") as f:
+                reader = csv.reader(f)
+                headers = next(reader)
+                first = next(reader)
+                columns = ", ".join(f'"{h}" {infer_sqlite_type(v)}' for h, v in zip(headers, first))
+                conn.execute(f'CREATE TABLE "{table}" ({columns})')
+                insert = f'INSERT INTO "{table}" VALUES ({", ".join("?" for _ in headers)})'
+                conn.execute(insert, first)
+                for row in reader:
+                    conn.execute(insert, row)
+
+QUERIES = [
+    ("summary by year", 'SELECT * FROM mlb_stats_summary WHERE "Year" = ?', lambda y, t: (y,)),
+    ("sections by year", 'SELECT "Section", "Content" FROM mlb_history_sections WHERE "Year" = ?', lambda y, t: (y,)),
+    ("champion by team", 'SELECT "Year" FROM mlb_stats_summary WHERE "Champion" = ?', lambda y, t: (t,)),
+]
+
+def time_queries(db_path, years, teams, repeat):
+    timings = {}
+    with sqlite3.connect(db_path) as conn:
+        for name, sql, params in QUERIES:
+            start = time.perf_counter()
+            for i in range(repeat):
+                conn.execute(sql, params(years[i % len(years)], teams[i % len(teams)])).fetchall()
+            timings[name] = (time.perf_counter() - start) / repeat
+    return timings
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=int, default=100, help="copies of every season (default: 100)")
+    parser.add_argument("--repeat", type=int, default=200, help="lookups per query shape")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_files = []
+        for name in ("mlb_history_sections.csv", "mlb_stats_summary.csv"):
+            dest = os.path.join(tmp, name)
+            write_scaled_csv(name, dest, args.scale)
+            csv_files.append(dest)
+
+        with open(csv_files[1], newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        years = [int(r["Year"]) for r in rows[::7]]
+        teams = sorted({r["Champion"] for r in rows})
+
+        before_db, after_db = os.path.join(tmp, "before.db"), os.path.join(tmp, "after.db")
+        start = time.perf_counter()
+        legacy_import(before_db, csv_files)
+        before_load = time.perf_counter() - start
+        start = time.perf_counter()
+        import_csvs_to_sqlite(after_db, csv_files)
+        after_load = time.perf_counter() - start
+
+        before = time_queries(before_db, years, teams, args.repeat)
+        after = time_queries(after_db, years, teams, args.repeat)
+
+    print(f"\n{len(rows)} summary rows, scale {args.scale}")
+    print(f"{'load':<20} {before_load * 1000:10.1f} ms {after_load * 1000:10.1f} ms")
+    print(f"{'query':<20} {'before':>13} {'after':>13}")
+    for name, _, _ in QUERIES:
+        print(f"{name:<20} {before[name] * 1e6:10.1f} us {after[name] * 1e6:10.1f} us"
+              f"   {before[name] / after[name]:6.1f}x")
+
+if __name__ == "__main__":
+    main()
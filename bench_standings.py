@@ -0,0 +1,108 @@
+"""Benchmark standings_analytics.compute against per-team Python loops.
+
+Builds synthetic standings of --teams teams over --seasons seasons (each team
+sits out about one season in ten, so streaks and rolling windows see gaps),
+checks that both implementations agree, then times them. The loop version
+is what the dashboard would otherwise need: one pass per team over its
+seasons, plus one per season for games behind and rank. It is skipped above
+--loop-max-rows.
+
+    python bench_standings.py --teams 100 1000 5000 --seasons 150
+"""
+import argparse
+import time
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+
+from standings_analytics import ROLLING_SEASONS, compute
+
+def synthetic_standings(teams, seasons, seed=0):
+    rng = np.random.default_rng(seed)
+    team = np.repeat(np.arange(teams), seasons)
+    year = np.tile(np.arange(1901, 1901 + seasons), teams)
+    played = rng.random(len(team)) > 0.1
+    team, year = team[played], year[played]
+    # Each team's strength drifts from season to season.
+    strength = 0.5 + 0.08 * rng.standard_normal(teams)
+    games = rng.choice([140, 154, 162], size=len(team))
+    p = np.clip(strength[team] + 0.05 * rng.standard_normal(len(team)), 0.2, 0.8)
+    wins = rng.binomial(games, p)
+    return pd.DataFrame({
+        "year": year,
+        "team": pd.Categorical([f"Team {i}" for i in team]),
+        "wins": wins,
+        "losses": games - wins,
+    })
+
+def python_loops(df, window=ROLLING_SEASONS):
+    """The same columns as compute(), one team and one season at a time."""
+    rows = list(zip(df["year"], df["team"].astype(str), df["wins"], df["losses"]))
+    by_year = defaultdict(list)
+    by_team = defaultdict(list)
+    for row in rows:
+        by_year[row[0]].append(row)
+        by_team[row[1]].append(row)
+    out = {}
+    for year, season in by_year.items():
+        lead = max(w - l for _, _, w, l in season)
+        pcts = sorted((w / (w + l) for _, _, w, l in season), reverse=True)
+        for _, team, w, l in season:
+            pct = w / (w + l)
+            out[(year, team)] = {"win_pct": pct, "games_behind": (lead - (w - l)) / 2,
+                                 "rank": pcts.index(pct) + 1}
+    for team, seasons in by_team.items():
+        seasons.sort()
+        streak, prev_year, prev_sign = 0, None, None
+        for i, (year, _, w, l) in enumerate(seasons):
+            recent = seasons[max(0, i - window + 1):i + 1]
+            out[(year, team)]["rolling_pct"] = sum(a / (a + b) for _, _, a, b in recent) / len(recent)
+            sign = (w > l) - (w < l)
+            streak = streak + 1 if prev_year == year - 1 and sign == prev_sign else 1
+            out[(year, team)]["streak"] = streak * sign
+            prev_year, prev_sign = year, sign
+    return out
+
+def agree(analytics, loops):
+    columns = ["win_pct", "games_behind", "rank", "rolling_pct", "streak"]
+    for row in analytics.seasons[["year", "team"] + columns].itertuples(index=False):
+        expected = loops[(row.year, str(row.team))]
+        if not all(np.isclose(getattr(row, c), expected[c]) for c in columns):
+            return False
+    return True
+
+def best_of(repeat, func, *args):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--teams", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--seasons", type=int, default=150)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--loop-max-rows", type=int, default=200_000,
+                        help="skip the loop version above this many team-seasons (default: 200000)")
+    args = parser.parse_args()
+
+    # franchises={} keeps one franchise per team, as the loop version assumes.
+    check = synthetic_standings(50, 60, seed=1)
+    if not agree(compute(check, franchises={}), python_loops(check)):
+        raise SystemExit("compute() and the loop version disagree")
+
+    print(f"{'team-seasons':>12} {'vectorized':>12} {'loops':>12} {'speedup':>8}")
+    for teams in args.teams:
+        df = synthetic_standings(teams, args.seasons)
+        fast, _ = best_of(args.repeat, compute, df, ROLLING_SEASONS, {})
+        if len(df) <= args.loop_max_rows:
+            slow, _ = best_of(1, python_loops, df)
+            print(f"{len(df):>12,} {fast * 1000:10.1f}ms {slow * 1000:10.1f}ms {slow / fast:7.1f}x")
+        else:
+            print(f"{len(df):>12,} {fast * 1000:10.1f}ms {'-':>12}")
+
+if __name__ == "__main__":
+    main()
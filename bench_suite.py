@@ -0,0 +1,169 @@
+"""Ingest, query and dashboard timings on synthetic data at several sizes.
+
+For each --rows value (section rows; see synthetic_data.py) this generates a
+dataset in a temporary directory and times:
+
+  import_to_db          import_to_db.main into a fresh database
+  import_csvs_to_sqlite SQLite_database.import_csvs_to_sqlite of the same CSVs
+  query/<command>       every query_baseball_db command shape, median of --repeat
+  dashboard/<step>      dashboard_data: reading the summary and building its aggregates
+
+Results go to a JSON file. Pass an earlier file with --compare to see the
+ratio for every metric and which got slower.
+
+    python bench_suite.py --rows 1000 10000 100000 --json after.json --compare before.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import dashboard_data
+import import_to_db
+from query_baseball_db import build_query
+from SQLite_database import import_csvs_to_sqlite
+from synthetic_data import FIRST_YEAR, generate
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    # The loaders report progress with print(); keep it out of the results.
+    with contextlib.redirect_stdout(io.StringIO()):
+        fn(*args)
+    return time.perf_counter() - start
+
+def query_commands(seasons):
+    """One REPL command per query shape, aimed at years spread over the data."""
+    years = [FIRST_YEAR + seasons * k // 10 for k in range(10)]
+    last = FIRST_YEAR + seasons - 1
+    return {
+        "teams": [f"teams {y}" for y in years],
+        "events": [f"events {y}" for y in years],
+        "join": [f"join {y}" for y in years],
+        "filterteam": [f"filterteam {y} yankees" for y in years],
+        "teamhistory": ["teamhistory boston red sox", "teamhistory yankees"],
+        "search": ["search perfect game", f"search grand slam {FIRST_YEAR}-{min(last, 9999)}"],
+        "champions": ["champions"],
+        "decades": ["decades"],
+    }
+
+def time_queries(db_path, seasons, repeat):
+    timings = {}
+    with sqlite3.connect(db_path) as conn:
+        for shape, commands in query_commands(seasons).items():
+            samples = []
+            for i in range(repeat):
+                query, params = build_query(commands[i % len(commands)])
+                start = time.perf_counter()
+                conn.execute(query, params).fetchall()
+                samples.append(time.perf_counter() - start)
+            timings[shape] = statistics.median(samples)
+    return timings
+
+def time_dashboard(stats_csv, repeat):
+    start = time.perf_counter()
+    df = dashboard_data.read_summary(stats_csv)
+    read = time.perf_counter() - start
+    start = time.perf_counter()
+    dashboard_data.SummaryData(df, version="bench")
+    aggregate = time.perf_counter() - start
+    dashboard_data.load_summary(stats_csv)
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        dashboard_data.load_summary(stats_csv)
+        samples.append(time.perf_counter() - start)
+    return {"read_summary": read, "aggregates": aggregate, "cached_rerun": statistics.median(samples)}
+
+def run_scale(rows, repeat):
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        paths, counts = generate(tmp, rows)
+        result = {"rows": counts, "generate": time.perf_counter() - start}
+        db_path = os.path.join(tmp, "baseball.db")
+        result["import_to_db"] = timed(import_to_db.main, db_path, paths["stats"], paths["sections"],
+                                       paths["standings"])
+        result["import_csvs_to_sqlite"] = timed(import_csvs_to_sqlite, os.path.join(tmp, "generic.db"),
+                                                [paths["stats"], paths["sections"]])
+        result["query"] = time_queries(db_path, counts["stats"], repeat)
+        result["dashboard"] = time_dashboard(paths["stats"], repeat)
+    return result
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def flatten(results):
+    """{"1000/query/teams": seconds, ...} for every timing in a results file."""
+    flat = {}
+    for rows, metrics in results["scales"].items():
+        for name, value in metrics.items():
+            if isinstance(value, dict):
+                if name != "rows":
+                    flat.update({f"{rows}/{name}/{k}": v for k, v in value.items()})
+            else:
+                flat[f"{rows}/{name}"] = value
+    return flat
+
+def compare(old, new, threshold):
+    old_flat, new_flat = flatten(old), flatten(new)
+    print(f"\n{'metric':<40} {'before':>11} {'after':>11} {'ratio':>7}")
+    for key, after in new_flat.items():
+        before = old_flat.get(key)
+        if not before:
+            continue
+        ratio = after / before
+        flag = "  slower" if ratio > 1 + threshold else ""
+        print(f"{key:<40} {before * 1000:9.2f}ms {after * 1000:9.2f}ms {ratio:6.2f}x{flag}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 100_000],
+                        help="section-row counts to test, 10**3 to 10**7 (default: 1000 10000 100000)")
+    parser.add_argument("--repeat", type=int, default=20, help="runs per query shape (default: 20)")
+    parser.add_argument("--json", default="bench_results.json", help="where to write the results")
+    parser.add_argument("--compare", metavar="JSON", help="earlier results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="flag metrics more than this fraction slower (default: 0.2)")
+    args = parser.parse_args()
+
+    results = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+        },
+        "scales": {},
+    }
+    for rows in args.rows:
+        print(f"{rows:,} rows...", flush=True)
+        result = run_scale(rows, args.repeat)
+        results["scales"][str(rows)] = result
+        print(f"  import_to_db {result['import_to_db']:.2f} s, "
+              f"import_csvs_to_sqlite {result['import_csvs_to_sqlite']:.2f} s, "
+              f"slowest query {max(result['query'].values()) * 1000:.2f} ms, "
+              f"dashboard aggregates {result['dashboard']['aggregates'] * 1000:.1f} ms")
+
+    with open(args.json, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    print(f"Wrote {args.json}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(json.load(f), results, args.threshold)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+import csv
+from contextlib import contextmanager
+from itertools import islice
+
+from columnar import is_columnar, iter_rows
+from data_access import connect_writer
+
+BATCH_SIZE = 10_000
+
+# Load-only settings on top of connect_writer's; they end with the connection.
+# (connect_writer turns on WAL, so readers keep seeing the old data until we commit.)
+LOAD_PRAGMAS = [
+    ("synchronous", "OFF"),      # a crashed load is simply re-run from the CSVs
+    ("cache_size", "-65536"),    # 64 MB page cache (negative means KiB)
+    ("temp_store", "MEMORY"),    # index builds sort in memory
+]
+
+def apply_load_pragmas(conn):
+    for name, value in LOAD_PRAGMAS:
+        conn.execute(f"PRAGMA {name} = {value}")
+
+@contextmanager
+def bulk_load(db_path):
+    """Open db_path for a load and run everything inside one transaction.
+
+    Commits when the block finishes and rolls back if it raises.
+    """
+    # connect_writer leaves isolation_level None so we issue BEGIN/COMMIT
+    # ourselves instead of relying on sqlite3's implicit per-statement transactions.
+    conn = connect_writer(db_path)
+    try:
+        apply_load_pragmas(conn)
+        conn.execute("BEGIN")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+
+@contextmanager
+def savepoint(conn, name):
+    """Nested transaction: undo just this block on error, keep the outer one."""
+    conn.execute(f'SAVEPOINT "{name}"')
+    try:
+        yield
+    except BaseException:
+        conn.execute(f'ROLLBACK TO "{name}"')
+        conn.execute(f'RELEASE "{name}"')
+        raise
+    conn.execute(f'RELEASE "{name}"')
+
+def batches(rows, size=BATCH_SIZE):
+    rows = iter(rows)
+    while True:
+        batch = list(islice(rows, size))
+        if not batch:
+            return
+        yield batch
+
+def bulk_insert(conn, table, columns, rows, batch_size=BATCH_SIZE, on_conflict=None):
+    """Insert an iterable of row tuples in fixed-size executemany batches.
+
+    Only one batch is held in memory at a time, so rows can be a generator
+    over a file of any size. on_conflict ("REPLACE", "IGNORE", ...) turns
+    the statement into INSERT OR <on_conflict>. Returns the number of rows
+    inserted.
+    """
+    column_names = ", ".join(f'"{c}"' for c in columns)
+    placeholders = ", ".join("?" for _ in columns)
+    verb = f"INSERT OR {on_conflict}" if on_conflict else "INSERT"
+    insert_stmt = f'{verb} INTO "{table}" ({column_names}) VALUES ({placeholders})'
+    total = 0
+    for batch in batches(rows, batch_size):
+        conn.executemany(insert_stmt, batch)
+        total += len(batch)
+    return total
+
+def create_indexes(conn, table, indexed_columns):
+    # Called after the rows are in: one sorted build is far cheaper than
+    # updating the index on every insert.
+    for column in indexed_columns:
+        index_name = f"idx_{table}_{column}".replace(" ", "_").lower()
+        conn.execute(f'CREATE INDEX IF NOT EXISTS "{index_name}" ON "{table}" ("{column}")')
+
+def read_csv_rows(csv_path, convert):
+    """Yield convert(row) for each row of a CSV with a header, one at a time."""
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            yield convert(row)
+
+def read_rows(path, convert):
+    """read_csv_rows for a CSV, or the same dict rows from an .arrow/.parquet file."""
+    if is_columnar(path):
+        return iter_rows(path, convert)
+    return read_csv_rows(path, convert)
@@ -0,0 +1,133 @@
+import re
+from functools import lru_cache
+
+TEAM_SUFFIXES = [
+    "Athletics", "Red Stockings", "Wolves", "White Stockings",
+    "Browns", "Orioles", "Wolverines", "Blues",
+    "Metropolitans", "Alleghenys", "Giants", "Dodgers",
+    "Yankees", "Mets", "Cardinals", "Cubs", "Tigers",
+    "Phillies", "Indians", "Braves", "Red Sox",
+]
+
+# Every keyword get_yearly_stats used to test one by one ("world series
+# champion", "world champion", "league champion", ...) contains one of these.
+KEYWORDS = ("champion", "pennant winner")
+
+_LEAD_IN = r"(?P<kw>champion|pennant winner)(?:ship)?(?:\s*[\:\-–]?\s*)"
+
+# Confidence for each way a champion can be matched.
+KNOWN_TEAM = 1.0        # a full team name from the page's own standings
+SUFFIX_MATCH = 0.8      # "champion ... <something> Yankees"
+PENNANT_MATCH = 0.6     # only found after "pennant winner"
+
+def clean_champion_text(raw_text):
+    if not raw_text:
+        return "Not found"
+    text = raw_text.strip()
+    if not text:
+        return "Not found"
+
+    # Extract only letters and spaces up to where team name ends
+    match = re.match(r'^([A-Za-z\s]+)', text)
+    if match:
+        cleaned = match.group(1).strip()
+        if cleaned:
+            return cleaned
+    return text  # fallback if regex fails
+
+def mentions_champion(lowered):
+    return KEYWORDS[0] in lowered or KEYWORDS[1] in lowered
+
+@lru_cache(maxsize=256)
+def team_pattern(names):
+    """(pattern, {lowercased name: name}) matching a champion line naming one of names.
+
+    names is a frozenset of one page's standings teams. Seasons share their
+    teams, so most pages reuse an already compiled pattern.
+    """
+    # Longest names first so "Chicago White Sox" wins over "Chicago White".
+    alternatives = "|".join(re.escape(n) for n in sorted(names, key=lambda n: (-len(n), n)))
+    pattern = re.compile(rf"{_LEAD_IN}(?:the\s+)?({alternatives})\b", re.IGNORECASE)
+    return pattern, {n.lower(): n for n in names}
+
+class ChampionMatcher:
+    """Finds the champion team in page text using patterns compiled once.
+
+    The suffix pattern is shared by every page. Team names are not: match()
+    and find_champion() take the teams from the page's own standings, so a
+    page's champion never depends on which pages were parsed before it.
+    """
+
+    def __init__(self, team_suffixes=TEAM_SUFFIXES):
+        suffix_pattern = "|".join(re.escape(s) for s in team_suffixes)
+        self._suffix_re = re.compile(
+            rf"{_LEAD_IN}([A-Z][a-zA-Z\s]*?(?:{suffix_pattern}))\b", re.IGNORECASE
+        )
+
+    def candidate_lines(self, text):
+        """Lines of text that mention a champion or pennant winner, in order."""
+        # Lowercasing never adds or removes newlines, so the lines stay aligned.
+        return [
+            line.strip()
+            for line, lowered in zip(text.splitlines(), text.lower().splitlines())
+            if mentions_champion(lowered)
+        ]
+
+    def _keyword_positions(self, line):
+        lowered = line.lower()
+        if len(lowered) != len(line):
+            return None  # a few Unicode letters change length when lowercased
+        positions = []
+        for keyword in KEYWORDS:
+            pos = lowered.find(keyword)
+            while pos != -1:
+                positions.append(pos)
+                pos = lowered.find(keyword, pos + 1)
+        return sorted(positions)
+
+    def match(self, line, teams=None):
+        """Return (team, confidence) for one line, or ("Not found", 0.0).
+
+        teams are the full names from the page's standings; one of them after
+        a champion keyword is the strongest match.
+        """
+        names = frozenset(t.strip() for t in teams or () if t and t.strip())
+        team_re, known = team_pattern(names) if names else (None, {})
+        suffix_re = self._suffix_re
+        positions = self._keyword_positions(line)
+        if positions is None:
+            team_matches = [team_re.search(line)] if team_re is not None else []
+            suffix_matches = list(suffix_re.finditer(line))
+        else:
+            # Anchoring the patterns at each keyword is much cheaper than a
+            # case-insensitive search across the whole line.
+            team_matches = [team_re.match(line, p) for p in positions] if team_re is not None else []
+            suffix_matches = [suffix_re.match(line, p) for p in positions]
+
+        for m in team_matches:
+            if m:
+                return known.get(m.group(2).lower(), m.group(2)), KNOWN_TEAM
+        best = ("Not found", 0.0)
+        for m in suffix_matches:
+            if not m:
+                continue
+            confidence = PENNANT_MATCH if m.group("kw").lower() == "pennant winner" else SUFFIX_MATCH
+            if confidence > best[1]:
+                best = (clean_champion_text(m.group(2)), confidence)
+                if confidence == SUFFIX_MATCH:
+                    break
+        return best
+
+    def find_champion(self, text, teams=None):
+        """Best (team, confidence) across all candidate lines of a page, given its standings teams.
+
+        Ties go to the longest line, which is what the scraper used to pick.
+        """
+        best = ("Not found", 0.0, -1)
+        for line in self.candidate_lines(text):
+            team, confidence = self.match(line, teams)
+            if (confidence, len(line)) > (best[1], best[2]) and confidence > 0:
+                best = (team, confidence, len(line))
+        return best[0], best[1]
+
+default_matcher = ChampionMatcher()
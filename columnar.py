@@ -0,0 +1,149 @@
+"""Arrow IPC and Parquet copies of the scraped CSVs.
+
+Next to every CSV the scraper publishes, e.g. mlb_stats_summary.csv, this
+writes mlb_stats_summary.arrow (uncompressed Arrow IPC, meant to be
+memory-mapped) and mlb_stats_summary.parquet (compact, for archiving and
+other tools). Years are integers and team and section names are
+dictionary-encoded, so a reader gets typed columns without parsing text.
+
+pyarrow is optional: without it nothing is written and every consumer
+keeps reading the CSVs.
+
+    python columnar.py [CSV ...]
+"""
+import logging
+import os
+import sys
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+ARROW_SUFFIX = ".arrow"
+PARQUET_SUFFIX = ".parquet"
+DEFAULT_CSVS = ["mlb_stats_summary.csv", "mlb_history_sections.csv", "mlb_team_standings.csv"]
+
+logger = logging.getLogger(__name__)
+
+def available():
+    return pa is not None
+
+def _schemas():
+    # Keyed by the CSV header, so any of the scraper's files can be converted.
+    names = pa.dictionary(pa.int32(), pa.string())
+    return {
+        ("Year", "Most Wins", "Most Losses", "Champion"): pa.schema([
+            ("Year", pa.int32()),
+            ("Most Wins", names),
+            ("Most Losses", names),
+            ("Champion", names),
+        ]),
+        ("Year", "Section", "Content"): pa.schema([
+            ("Year", pa.int32()),
+            ("Section", names),
+            ("Content", pa.string()),
+        ]),
+        ("Year", "Team", "Wins", "Losses"): pa.schema([
+            ("Year", pa.int32()),
+            ("Team", names),
+            ("Wins", pa.int16()),
+            ("Losses", pa.int16()),
+        ]),
+    }
+
+def columnar_paths(csv_path):
+    base = os.path.splitext(csv_path)[0]
+    return base + ARROW_SUFFIX, base + PARQUET_SUFFIX
+
+def read_csv_table(csv_path):
+    """Read a scraper CSV into an Arrow table with the dataset's schema."""
+    # Every column is read as text first and then cast, so a stray value
+    # fails loudly here instead of silently producing a different type.
+    schemas = _schemas()
+    as_text = {name: pa.string() for header in schemas for name in header}
+    # Section text is often a quoted multi-line cell.
+    table = pa_csv.read_csv(csv_path, parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+                            convert_options=pa_csv.ConvertOptions(column_types=as_text))
+    schema = schemas.get(tuple(table.column_names))
+    if schema is None:
+        raise ValueError(f"{csv_path}: no columnar schema for columns {table.column_names}")
+    # The reader yields one chunk per block, each dictionary-encoded on its
+    # own; an IPC file allows one dictionary per column, so unify them.
+    return table.select(schema.names).cast(schema).unify_dictionaries()
+
+def write_columnar(csv_path):
+    """Write the .arrow and .parquet copies of csv_path; returns their paths."""
+    table = read_csv_table(csv_path)
+    arrow_path, parquet_path = columnar_paths(csv_path)
+    # Same tmp-then-rename as the CSVs: readers never see half a file.
+    with pa.OSFile(arrow_path + ".tmp", "wb") as sink:
+        with pa_ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(arrow_path + ".tmp", arrow_path)
+    pq.write_table(table, parquet_path + ".tmp", compression="zstd")
+    os.replace(parquet_path + ".tmp", parquet_path)
+    return arrow_path, parquet_path
+
+def export_datasets(csv_paths):
+    """Write columnar copies of every existing CSV in csv_paths."""
+    if not available():
+        logger.debug("pyarrow not installed; skipping Arrow/Parquet export")
+        return []
+    written = []
+    for csv_path in csv_paths:
+        if os.path.exists(csv_path):
+            written.extend(write_columnar(csv_path))
+    return written
+
+def open_table(path):
+    """Load an .arrow or .parquet file as an Arrow table.
+
+    .arrow files are memory-mapped: the table's buffers point into the page
+    cache, so nothing is copied or parsed up front.
+    """
+    if path.endswith(ARROW_SUFFIX):
+        return pa_ipc.open_file(pa.memory_map(path, "r")).read_all()
+    return pq.read_table(path, memory_map=True)
+
+def iter_rows(path, convert=lambda row: row):
+    """Yield convert(row) for each row as a column-name dict, one batch at a time."""
+    for batch in open_table(path).to_batches():
+        # Column-at-a-time conversion is much cheaper than RecordBatch.to_pylist().
+        names = batch.schema.names
+        for values in zip(*(column.to_pylist() for column in batch.columns)):
+            yield convert(dict(zip(names, values)))
+
+def is_columnar(path):
+    return path.endswith((ARROW_SUFFIX, PARQUET_SUFFIX))
+
+def fresh_columnar(csv_path):
+    """The .arrow copy of csv_path if it can be used in its place, else None.
+
+    It must exist, pyarrow must be installed, and it must be at least as new
+    as the CSV (a CSV edited by hand wins).
+    """
+    arrow_path = columnar_paths(csv_path)[0]
+    if not available() or not os.path.exists(arrow_path):
+        return None
+    if os.path.exists(csv_path) and os.path.getmtime(csv_path) > os.path.getmtime(arrow_path):
+        return None
+    return arrow_path
+
+def main(argv=None):
+    if not available():
+        print("pyarrow is required: pip install pyarrow")
+        return 1
+    for csv_path in (argv if argv is not None else sys.argv[1:]) or DEFAULT_CSVS:
+        if not os.path.exists(csv_path):
+            print(f"{csv_path} not found, skipping.")
+            continue
+        for path in write_columnar(csv_path):
+            print(f"Wrote {path} ({os.path.getsize(path):,} bytes)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
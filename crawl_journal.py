@@ -0,0 +1,50 @@
+import json
+import logging
+import os
+import threading
+
+DEFAULT_JOURNAL_PATH = "scrape_journal.jsonl"
+
+logger = logging.getLogger(__name__)
+
+class CrawlJournal:
+    """Append-only JSON-lines checkpoint of every year the crawl has finished.
+
+    Each line holds one year's stats and section rows and is flushed to disk
+    before the next year is recorded, so a crash loses at most the years that
+    were still in flight. When a year appears more than once the last line wins.
+    """
+
+    def __init__(self, path=DEFAULT_JOURNAL_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def reset(self):
+        with self._lock:
+            open(self.path, "w", encoding="utf-8").close()
+
+    def record(self, year, stats, sections):
+        line = json.dumps({"year": year, "stats": stats, "sections": sections})
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def load(self):
+        finished = {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line_no, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # A crash mid-write can leave a torn last line.
+                        logger.warning("Ignoring unreadable journal line %d in %s", line_no, self.path)
+                        continue
+                    finished[entry["year"]] = entry
+        except FileNotFoundError:
+            pass
+        return finished
@@ -0,0 +1,225 @@
+"""Pacing and retries for the crawl: a token bucket per host, adjusted as it goes.
+
+Every request to a host first takes a token from that host's bucket. The
+refill rate starts at the configured rate and follows what the server does:
+
+  - a response faster than target_latency adds RATE_STEP requests/second
+    (up to max_rate), so a quick server is crawled as fast as it answers;
+  - a slower response multiplies the rate by SLOW_FACTOR;
+  - a timeout, dropped connection or 408/429/5xx multiplies it by
+    ERROR_FACTOR, at most once per DECREASE_INTERVAL so that requests
+    failing together count as one slowdown; the rate then recovers step by
+    step as requests succeed again;
+  - a 429/503 with Retry-After stops the bucket for that long.
+
+Failed requests that can succeed on a second try (timeouts, dropped
+connections, 408/429/5xx, a page that failed the content check, a browser
+that timed out) are retried after a jittered exponential backoff: a random
+delay between 0 and min(max_delay, base_delay * 2**attempt), so threads that
+failed together do not retry together. Anything else, a 404 or a bug in the
+scraper alike, fails at once.
+"""
+import http.client
+import logging
+import random
+import threading
+import time
+import urllib.error
+from urllib.parse import urlsplit
+
+try:
+    import requests
+except ImportError:
+    requests = None
+try:
+    from selenium.common.exceptions import TimeoutException as WebDriverTimeout
+except ImportError:
+    WebDriverTimeout = None
+
+DEFAULT_RATE = 2.0         # requests per second per host at the start of a crawl
+DEFAULT_MAX_RATE = 10.0
+MIN_RATE = 0.5
+BURST = 4                  # tokens a host's bucket can save up
+TARGET_LATENCY = 2.0       # seconds; slower responses lower the rate
+RATE_STEP = 0.5
+SLOW_FACTOR = 0.8
+ERROR_FACTOR = 0.5
+DECREASE_INTERVAL = 1.0  # seconds
+DEFAULT_RETRIES = 3
+BASE_DELAY = 1.0
+MAX_DELAY = 30.0
+RETRYABLE_STATUS = {408, 425, 429, 500, 502, 503, 504}
+
+logger = logging.getLogger(__name__)
+
+def http_status(error):
+    """(status code, Retry-After seconds or None) for an HTTP error from requests or urllib, else (None, None)."""
+    response = getattr(error, "response", None)
+    if response is not None and hasattr(response, "status_code"):
+        status, headers = response.status_code, response.headers
+    elif isinstance(error, urllib.error.HTTPError):
+        status, headers = error.code, error.headers
+    else:
+        return None, None
+    retry_after = (headers or {}).get("Retry-After")
+    try:
+        retry_after = float(retry_after) if retry_after is not None else None
+    except ValueError:
+        retry_after = None   # an HTTP date; the backoff covers it
+    return status, retry_after
+
+class RetryableError(Exception):
+    """A failure that may go away on its own, such as a page cut off mid-transfer."""
+
+def _transient_types():
+    types = [RetryableError, TimeoutError, ConnectionError, http.client.IncompleteRead,
+             http.client.RemoteDisconnected]
+    if requests is not None:
+        types += [requests.exceptions.Timeout, requests.exceptions.ConnectionError,
+                  requests.exceptions.ChunkedEncodingError]
+    if WebDriverTimeout is not None:
+        types.append(WebDriverTimeout)
+    return tuple(types)
+
+TRANSIENT_ERRORS = _transient_types()
+
+def is_retryable(error):
+    status, _ = http_status(error)
+    if status is not None:
+        return status in RETRYABLE_STATUS
+    if isinstance(error, urllib.error.URLError):
+        # urllib wraps timeouts, refused connections and DNS failures in URLError.
+        return isinstance(error.reason, OSError)
+    return isinstance(error, TRANSIENT_ERRORS)
+
+def is_client_error(error):
+    """A 4xx the server will give again (not 408/429): the page is missing or refused."""
+    status, _ = http_status(error)
+    return status is not None and 400 <= status < 500 and status not in RETRYABLE_STATUS
+
+def backoff_delay(attempt, base_delay=BASE_DELAY, max_delay=MAX_DELAY):
+    """Seconds to wait before retry number attempt (0-based), with full jitter."""
+    return random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+
+class TokenBucket:
+    """Hands out one token per request at `rate` per second, saving up at most `burst`."""
+
+    def __init__(self, rate, burst=BURST):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.decreased = 0.0   # when the rate was last cut for an error
+
+    def reserve(self, now):
+        """Take a token and return how long to wait before using it (callers hold the lock)."""
+        start = max(now, self.paused_until)
+        self.tokens = min(self.burst, self.tokens + (start - self.updated) * self.rate)
+        self.updated = start
+        self.tokens -= 1
+        # A negative balance is a queue of requests already promised future tokens.
+        wait = start - now
+        if self.tokens < 0:
+            wait += -self.tokens / self.rate
+        return wait
+
+    def set_rate(self, rate, now):
+        # Settle the tokens earned at the old rate before switching.
+        if now > self.updated:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+        self.rate = rate
+
+class RateLimiter:
+    """One adaptive TokenBucket per host, shared by every fetch thread.
+
+    acquire(url) blocks until the request may go out; record(url, latency,
+    error) reports how it went so the host's rate can follow.
+    """
+
+    def __init__(self, rate=DEFAULT_RATE, max_rate=DEFAULT_MAX_RATE, target_latency=TARGET_LATENCY):
+        self.rate = rate
+        self.max_rate = max(rate, max_rate)
+        self.target_latency = target_latency
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, url):
+        host = urlsplit(url).netloc
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            bucket = self._buckets[host] = TokenBucket(self.rate)
+        return bucket
+
+    def acquire(self, url):
+        with self._lock:
+            wait = self._bucket(url).reserve(time.monotonic())
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def record(self, url, latency, error=None):
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._bucket(url)
+            if error is not None and not is_retryable(error):
+                return   # a 404 says nothing about load
+            if error is not None:
+                _, retry_after = http_status(error)
+                if retry_after:
+                    bucket.paused_until = max(bucket.paused_until, now + retry_after)
+                if now - bucket.decreased < DECREASE_INTERVAL:
+                    return
+                bucket.decreased = now
+                rate = bucket.rate * ERROR_FACTOR
+            elif latency > self.target_latency:
+                rate = bucket.rate * SLOW_FACTOR
+            else:
+                rate = bucket.rate + RATE_STEP
+            rate = min(self.max_rate, max(MIN_RATE, rate))
+            if rate != bucket.rate:
+                logger.debug("%s: %.2f -> %.2f requests/s", urlsplit(url).netloc, bucket.rate, rate)
+            bucket.set_rate(rate, now)
+
+    def current_rate(self, url):
+        with self._lock:
+            return self._bucket(url).rate
+
+    def timed(self, url, request):
+        """Run request() once its token is free, and record how it went."""
+        self.acquire(url)
+        start = time.monotonic()
+        try:
+            result = request()
+        except Exception as e:
+            self.record(url, time.monotonic() - start, e)
+            raise
+        self.record(url, time.monotonic() - start)
+        return result
+
+class RetryPolicy:
+    """Retries a failed call up to `retries` more times with jittered exponential backoff."""
+
+    def __init__(self, retries=DEFAULT_RETRIES, base_delay=BASE_DELAY, max_delay=MAX_DELAY, sleep=time.sleep):
+        self.retries = retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.sleep = sleep
+
+    def call(self, request, description, metrics):
+        for attempt in range(self.retries + 1):
+            try:
+                return request()
+            except Exception as e:
+                if attempt == self.retries or not is_retryable(e):
+                    raise
+                delay = backoff_delay(attempt, self.base_delay, self.max_delay)
+                _, retry_after = http_status(e)
+                delay = max(delay, retry_after or 0)
+                logger.warning("%s failed (%s); retry %d/%d in %.1fs", description, e,
+                               attempt + 1, self.retries, delay)
+                metrics.count("fetch_retries")
+                self.sleep(delay)
+
+NO_RETRIES = RetryPolicy(retries=0)
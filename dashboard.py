@@ -1,17 +1,56 @@
 import streamlit as st
-import pandas as pd
 import altair as alt
 
-# --- Load & Prepare Data ---
-df = pd.read_csv("mlb_stats_summary.csv")
-df.columns = df.columns.str.strip().str.lower()  # Normalize column names
+from dashboard_data import default_standings_source, is_database, load_standings, load_summary
 
-# Confirm data columns
-required_cols = ['year', 'most wins', 'most losses', 'champion']
-if not all(col in df.columns for col in required_cols):
-    st.error(f"CSV must contain columns: {required_cols}")
+# --- Load & Prepare Data ---
+# load_summary keeps the parsed data and its aggregates in memory across
+# reruns and only re-reads the source when it changes on disk. It reads
+# baseball.db through data_access's read-only pool when import_to_db.py has built it,
+# and otherwise the memory-mapped mlb_stats_summary.arrow (when fresh) or CSV.
+try:
+    data = load_summary()
+except ValueError as e:
+    st.error(str(e))
     st.stop()
 
+# Win percentages, games behind, rolling averages and streaks for every
+# team-season, computed in one pass (standings_analytics.py) and cached the
+# same way. Older scrapes have no standings; the summary views still work.
+standings_source = default_standings_source()
+try:
+    standings = load_standings(standings_source)
+    standings_error = "the standings are empty"
+except (OSError, ValueError) as e:
+    standings = None
+    standings_error = str(e)
+if standings is not None and not standings.years:
+    standings = None
+
+@st.cache_resource(max_entries=4)
+def base_charts(version, _data):
+    # Built once per data version; reruns only apply the chosen size.
+    return {
+        "champions": alt.Chart(_data.champion_counts).mark_bar().encode(
+            x=alt.X('champion:N', title='Champion Team', sort='-y'),
+            y=alt.Y('count:Q', title='Number of Championships'),
+            tooltip=['champion', 'count'],
+            color='champion:N'
+        ),
+        "mentions": alt.Chart(_data.mention_counts).mark_bar().encode(
+            x=alt.X('team:N', title='Team', sort='-y'),
+            y=alt.Y('mentions:Q', title='Mentions (Wins/Losses)'),
+            color='team:N',
+            tooltip=['team', 'mentions']
+        ),
+        "timeline": alt.Chart(_data.df).mark_line(point=True).encode(
+            x=alt.X('year:O', title='Year'),
+            y=alt.Y('champion:N', title='Champion'),
+            color='champion:N',
+            tooltip=['year', 'champion']
+        ),
+    }
+
 # --- Page Setup ---
 st.set_page_config(page_title="MLB Summary Dashboard", layout="centered")
 st.title("🏟️ MLB Season Summary Dashboard")
@@ -24,17 +63,17 @@ Explore Major League Baseball season summaries by year.
 - Visualizations will update automatically.
 """)
 
+charts = base_charts(data.version, data)
+
 # --- Sidebar Interactions ---
-year = st.sidebar.selectbox("Select Season Year", sorted(df['year'].unique()))
+year = st.sidebar.selectbox("Select Season Year", data.years)
 chart_size = st.sidebar.slider("Adjust Chart Size", min_value=200, max_value=600, value=400)
 
-# --- Filter Data ---
-year_data = df[df['year'] == year].copy()
-
 # --- Extract Key Info ---
-most_wins_team = year_data['most wins'].values[0]
-most_losses_team = year_data['most losses'].values[0]
-champion_team = year_data['champion'].values[0]
+year_data = data.by_year[year]
+most_wins_team = year_data['most wins']
+most_losses_team = year_data['most losses']
+champion_team = year_data['champion']
 
 # --- Display Summary Info ---
 st.subheader(f"📊 {year} Season Summary")
@@ -46,44 +85,69 @@ st.markdown(f"""
 
 # --- Visualization 1: Champion Count Over Time ---
 st.subheader("🏆 Champions Over Time")
-champ_counts = df['champion'].value_counts().reset_index()
-champ_counts.columns = ['champion', 'count']
-bar_chart = alt.Chart(champ_counts).mark_bar().encode(
-    x=alt.X('champion:N', title='Champion Team', sort='-y'),
-    y=alt.Y('count:Q', title='Number of Championships'),
-    tooltip=['champion', 'count'],
-    color='champion:N'
-).properties(width=chart_size, height=chart_size)
+bar_chart = charts["champions"].properties(width=chart_size, height=chart_size)
 st.altair_chart(bar_chart, use_container_width=True)
 
 # --- Visualization 2: Win vs Loss Team Mentions Over Time ---
 st.subheader("📈 Most Wins vs Losses Mentions")
-# Combine counts of teams that had most wins and most losses
-mentions = pd.concat([
-    df['most wins'].rename('team'),
-    df['most losses'].rename('team')
-])
-mention_counts = mentions.value_counts().reset_index()
-mention_counts.columns = ['team', 'mentions']
-
-team_mentions_chart = alt.Chart(mention_counts).mark_bar().encode(
-    x=alt.X('team:N', title='Team', sort='-y'),
-    y=alt.Y('mentions:Q', title='Mentions (Wins/Losses)'),
-    color='team:N',
-    tooltip=['team', 'mentions']
-).properties(width=chart_size, height=chart_size)
+team_mentions_chart = charts["mentions"].properties(width=chart_size, height=chart_size)
 st.altair_chart(team_mentions_chart, use_container_width=True)
 
 # --- Visualization 3: Year-by-Year Champions (Line Chart) ---
 st.subheader("📅 Yearly Champion Timeline")
-champ_line = alt.Chart(df).mark_line(point=True).encode(
-    x=alt.X('year:O', title='Year'),
-    y=alt.Y('champion:N', title='Champion'),
-    color='champion:N',
-    tooltip=['year', 'champion']
-).properties(width=chart_size + 200, height=300)
+champ_line = charts["timeline"].properties(width=chart_size + 200, height=300)
 st.altair_chart(champ_line, use_container_width=True)
 
+# --- Standings Views ---
+if standings is None:
+    if is_database(standings_source):
+        fix = f"Run import_to_db.py to load mlb_team_standings.csv into {standings_source}."
+    else:
+        fix = "Re-run web_scraping.py to collect them."
+    st.info(f"No team standings to show ({standings_error}). {fix}")
+else:
+    season = standings.season(year)
+    st.subheader(f"🏁 {year} Standings")
+    if season.empty:
+        st.write(f"No standings recorded for {year}.")
+    else:
+        st.dataframe(
+            season[['rank', 'team', 'wins', 'losses', 'win_pct', 'games_behind', 'streak']],
+            hide_index=True,
+            column_config={
+                'win_pct': st.column_config.NumberColumn('Win %', format='%.3f'),
+                'games_behind': st.column_config.NumberColumn('GB', format='%.1f'),
+                'streak': st.column_config.NumberColumn('Streak', help='Consecutive winning (+) or losing (-) seasons'),
+            },
+        )
+
+    st.subheader(f"📉 Win % Trends ({standings.window}-Season Rolling Average)")
+    totals = standings.franchises
+    default_teams = totals[totals['seasons'] >= standings.window]['franchise'].head(5).tolist()
+    picked = st.multiselect("Franchises", totals['franchise'].tolist(), default=default_teams)
+    if picked:
+        trend_chart = alt.Chart(standings.team_trends(picked)).mark_line(point=True).encode(
+            x=alt.X('year:O', title='Year'),
+            y=alt.Y('rolling_pct:Q', title='Rolling Win %', scale=alt.Scale(zero=False)),
+            color=alt.Color('franchise:N', title='Franchise'),
+            tooltip=['year', 'team', 'wins', 'losses',
+                     alt.Tooltip('win_pct:Q', format='.3f'), alt.Tooltip('rolling_pct:Q', format='.3f')]
+        ).properties(width=chart_size + 200, height=chart_size)
+        st.altair_chart(trend_chart, use_container_width=True)
+
+    st.subheader("🏛️ Franchise Records")
+    st.dataframe(
+        totals[['franchise', 'first_year', 'last_year', 'seasons', 'wins', 'losses', 'win_pct',
+                'first_places', 'longest_winning_streak', 'longest_losing_streak']],
+        hide_index=True,
+        column_config={
+            'win_pct': st.column_config.NumberColumn('Win %', format='%.3f'),
+            'first_places': 'Best Record',
+            'longest_winning_streak': 'Winning Seasons Streak',
+            'longest_losing_streak': 'Losing Seasons Streak',
+        },
+    )
+
 # --- Footer ---
 st.markdown("---")
 st.markdown("Made with ❤️ using Streamlit | Data: `mlb_stats_summary.csv`")
@@ -0,0 +1,178 @@
+import hashlib
+import os
+import sqlite3
+import threading
+
+import pandas as pd
+
+from columnar import fresh_columnar, is_columnar, open_table
+from data_access import DB_PATH, database_signature, has_tables, read_pool
+from standings_analytics import compute
+
+SUMMARY_CSV = "mlb_stats_summary.csv"
+STANDINGS_CSV = "mlb_team_standings.csv"
+REQUIRED_COLUMNS = ['year', 'most wins', 'most losses', 'champion']
+STANDINGS_COLUMNS = ['year', 'team', 'wins', 'losses']
+# What import_to_db.py builds today. An older database (like the one from
+# before standings were scraped) is passed over for the scraper's files.
+DATABASE_TABLES = ['team_stats', 'teams', 'standings', 'event_sections']
+
+class SummaryData:
+    """The season summary with everything the dashboard draws computed up front.
+
+    Streamlit re-runs dashboard.py on every widget change; with this object
+    cached, a rerun only does dictionary lookups.
+    """
+
+    def __init__(self, df, version):
+        self.df = df
+        self.version = version   # content hash; changes only when the data does
+        self.years = sorted(int(y) for y in df['year'].unique())
+        # Year-keyed index so selecting a season is a dict lookup, not a scan.
+        self.by_year = {
+            row['year']: row
+            for row in df[REQUIRED_COLUMNS].to_dict('records')
+        }
+
+        champ_counts = df['champion'].value_counts().reset_index()
+        champ_counts.columns = ['champion', 'count']
+        self.champion_counts = champ_counts
+
+        # Combine counts of teams that had most wins and most losses
+        mentions = pd.concat([
+            df['most wins'].rename('team'),
+            df['most losses'].rename('team')
+        ])
+        mention_counts = mentions.value_counts().reset_index()
+        mention_counts.columns = ['team', 'mentions']
+        self.mention_counts = mention_counts
+
+SUMMARY_QUERY = """
+    SELECT year, most_wins AS "most wins", most_losses AS "most losses", champion
+    FROM team_stats ORDER BY year
+"""
+
+def is_database(path):
+    return path.endswith(".db")
+
+def read_summary(path):
+    if is_database(path):
+        # A pooled read-only connection: sessions share a few connections and,
+        # with the database in WAL mode, keep reading while a load runs.
+        with read_pool(path).connection() as conn:
+            df = pd.read_sql_query(SUMMARY_QUERY, conn)
+    elif is_columnar(path):
+        # Typed columns straight from the memory-mapped file; teams arrive as
+        # categoricals instead of one Python string per row.
+        df = open_table(path).to_pandas()
+    else:
+        df = pd.read_csv(path)
+    df.columns = df.columns.str.strip().str.lower()  # Normalize column names
+    missing = [col for col in REQUIRED_COLUMNS if col not in df.columns]
+    if missing:
+        raise ValueError(f"CSV must contain columns: {REQUIRED_COLUMNS}")
+    return df
+
+STANDINGS_QUERY = """
+    SELECT s.year, t.name AS team, s.wins, s.losses
+    FROM standings s
+    JOIN teams t ON t.team_id = s.team_id
+"""
+
+def read_standings(path):
+    if is_database(path):
+        try:
+            with read_pool(path).connection() as conn:
+                df = pd.read_sql_query(STANDINGS_QUERY, conn)
+        except (sqlite3.Error, pd.errors.DatabaseError) as e:
+            raise ValueError(f"No standings in {path}: {e}")
+    elif is_columnar(path):
+        df = open_table(path).to_pandas()
+    else:
+        df = pd.read_csv(path)
+    df.columns = df.columns.str.strip().str.lower()
+    if any(col not in df.columns for col in STANDINGS_COLUMNS):
+        raise ValueError(f"Standings must contain columns: {STANDINGS_COLUMNS}")
+    return df
+
+def build_analytics(df, version):
+    analytics = compute(df)
+    analytics.version = version
+    return analytics
+
+def database_ready(path=DB_PATH):
+    return has_tables(path, DATABASE_TABLES)
+
+def default_standings_source():
+    if database_ready():
+        return DB_PATH
+    return fresh_columnar(STANDINGS_CSV) or STANDINGS_CSV
+
+def default_source():
+    """The canonical database once import_to_db.py has built it, else the scraper's files."""
+    if database_ready():
+        return DB_PATH
+    return fresh_columnar(SUMMARY_CSV) or SUMMARY_CSV
+
+def source_signature(path):
+    if is_database(path):
+        return database_signature(path)
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+def frame_hash(df):
+    return hashlib.sha256(pd.util.hash_pandas_object(df, index=False).values.tobytes()).hexdigest()
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+_lock = threading.Lock()
+_cache = {}   # (kind, path) -> (stat signature, loaded data)
+
+def load_summary(path=None):
+    """Return SummaryData for path, re-reading it only when it changed.
+
+    Without a path, default_source() picks the database or, before there is
+    one, the scraper's .arrow copy of SUMMARY_CSV when it is fresh and the CSV
+    otherwise.
+
+    The file's mtime and size are checked on every call. When they differ
+    from the cached copy the content hash decides: a rewrite with identical
+    bytes (e.g. a re-scrape that changed nothing) keeps the cached data.
+    """
+    return _load_cached("summary", path or default_source(), read_summary, SummaryData)
+
+def load_standings(path=None):
+    """StandingsAnalytics for every season's standings, cached like load_summary.
+
+    Without a path it reads the database's standings, or STANDINGS_CSV (its
+    .arrow copy when fresh) before there is a database.
+    """
+    return _load_cached("standings", path or default_standings_source(), read_standings, build_analytics)
+
+def _load_cached(kind, path, read, build):
+    # build(df, version) turns what read(path) returned into the cached object.
+    signature = source_signature(path)
+    with _lock:
+        cached = _cache.get((kind, path))
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    df = None
+    if is_database(path):
+        # Hash the rows: the file also changes with checkpoints and page reuse.
+        df = read(path)
+        version = frame_hash(df)
+    else:
+        version = file_hash(path)
+    if cached and cached[1].version == version:
+        data = cached[1]
+    else:
+        data = build(read(path) if df is None else df, version)
+    with _lock:
+        _cache[(kind, path)] = (signature, data)
+    return data
@@ -0,0 +1,153 @@
+"""Opening the project database: one canonical file, tuned connections.
+
+DB_PATH (baseball.db, or $BASEBALL_DB) is the database import_to_db.py
+builds and everything else reads. Readers open it through a read-only
+file:...?mode=ro URI, so a typo or a missing file is an error instead of a
+new empty database, and nothing but a loader can write to it. Writers turn
+on WAL, which the file keeps: from then on readers see the last committed
+data while a load runs instead of waiting for its lock.
+
+    conn = connect_writer()                loaders (bulk_loader.bulk_load, web_scraping --db)
+    conn = connect_readonly()              a REPL's long-lived connection
+    with read_pool().connection() as conn  short reads from many threads (the dashboard)
+"""
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from urllib.parse import quote
+
+DB_PATH = os.environ.get("BASEBALL_DB", "baseball.db")
+BUSY_TIMEOUT = 10.0   # seconds to wait on a lock before "database is locked"
+DEFAULT_POOL_SIZE = 4
+
+# Applied to every connection.
+READ_PRAGMAS = [
+    ("mmap_size", str(256 * 1024 * 1024)),   # read pages straight from the OS page cache
+    ("cache_size", "-16384"),                # 16 MB page cache (negative means KiB)
+    ("temp_store", "MEMORY"),                # ORDER BY / GROUP BY sorts stay in memory
+]
+# Applied on top for writers.
+WRITE_PRAGMAS = [
+    ("journal_mode", "WAL"),     # persistent: readers no longer block on (or block) a writer
+    ("synchronous", "NORMAL"),   # safe with WAL, and no fsync per commit
+]
+
+def resolve(path=None):
+    return os.path.abspath(path or DB_PATH)
+
+def database_signature(path=None):
+    """A value that changes whenever a commit may have changed the database at path.
+
+    Unlike PRAGMA data_version it means the same thing to every connection
+    and process. Commits land in the -wal file until a checkpoint copies
+    them into the main file, so both are stat'ed.
+    """
+    path = resolve(path)
+    signature = []
+    for p in (path, path + "-wal"):
+        try:
+            stat = os.stat(p)
+        except FileNotFoundError:
+            signature.append(None)
+            continue
+        signature.append((stat.st_ino, stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+def _apply(conn, pragmas):
+    for name, value in pragmas:
+        conn.execute(f"PRAGMA {name} = {value}")
+
+def connect_readonly(path=None, check_same_thread=True):
+    """A read-only connection to path (default DB_PATH); raises sqlite3.Error if it is missing."""
+    uri = f"file:{quote(resolve(path))}?mode=ro"
+    conn = sqlite3.connect(uri, uri=True, timeout=BUSY_TIMEOUT, check_same_thread=check_same_thread)
+    _apply(conn, READ_PRAGMAS)
+    return conn
+
+def connect_writer(path=None, isolation_level=None):
+    """A read-write connection in WAL mode, creating the database if needed.
+
+    isolation_level defaults to None so callers issue BEGIN/COMMIT themselves.
+    """
+    conn = sqlite3.connect(resolve(path), timeout=BUSY_TIMEOUT, isolation_level=isolation_level)
+    _apply(conn, READ_PRAGMAS + WRITE_PRAGMAS)
+    return conn
+
+def has_tables(path, tables):
+    """Whether the database at path exists and has every table (or view) in tables."""
+    if not os.path.exists(resolve(path)):
+        return False
+    try:
+        conn = connect_readonly(path)
+    except sqlite3.Error:
+        return False
+    try:
+        names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type IN ('table', 'view')")}
+    except sqlite3.Error:
+        return False
+    finally:
+        conn.close()
+    return set(tables) <= names
+
+class ConnectionPool:
+    """Up to size read-only connections to one database, shared between threads.
+
+    connection() lends one out for the length of a with block; when all are
+    in use the caller waits for one to come back.
+    """
+
+    def __init__(self, path=None, size=DEFAULT_POOL_SIZE):
+        self.path = resolve(path)
+        self.size = size
+        self._idle = queue.LifoQueue()   # most recently used first: its cache is warm
+        self._opened = 0
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self):
+        conn = self._acquire()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put(conn)
+
+    def _acquire(self):
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._opened < self.size:
+                self._opened += 1
+                try:
+                    return connect_readonly(self.path, check_same_thread=False)
+                except sqlite3.Error:
+                    self._opened -= 1
+                    raise
+        return self._idle.get()
+
+    def close(self):
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            conn.close()
+            with self._lock:
+                self._opened -= 1
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+def read_pool(path=None, size=DEFAULT_POOL_SIZE):
+    """The process-wide pool for path, created on first use."""
+    path = resolve(path)
+    with _pools_lock:
+        pool = _pools.get(path)
+        if pool is None:
+            pool = _pools[path] = ConnectionPool(path, size)
+        return pool
@@ -0,0 +1,92 @@
+import re
+
+YEAR_RANGE = re.compile(r"^(\d{4})(?:-(\d{4}))?$")
+
+FTS_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS event_text_fts_insert AFTER INSERT ON event_text BEGIN
+        INSERT INTO event_fts(rowid, content) VALUES (new.text_id, new.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS event_text_fts_delete AFTER DELETE ON event_text BEGIN
+        INSERT INTO event_fts(event_fts, rowid, content) VALUES ('delete', old.text_id, old.content);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS event_text_fts_update AFTER UPDATE ON event_text BEGIN
+        INSERT INTO event_fts(event_fts, rowid, content) VALUES ('delete', old.text_id, old.content);
+        INSERT INTO event_fts(rowid, content) VALUES (new.text_id, new.content);
+    END
+    """,
+]
+
+def create_event_fts(conn):
+    """Create the event_fts full-text index over event_text and keep it in sync.
+
+    event_fts is an external-content FTS5 table: it stores only the index and
+    reads content back from event_text by text_id, so a text shared by many
+    years is indexed once. Triggers mirror every insert, update and delete
+    on event_text. Call this after a bulk load; the 'rebuild' indexes the
+    rows already there in one pass.
+    """
+    conn.execute("DROP TABLE IF EXISTS event_fts")
+    conn.execute("""
+        CREATE VIRTUAL TABLE event_fts USING fts5(
+            content,
+            content='event_text',
+            content_rowid='text_id',
+            tokenize='porter unicode61'
+        )
+    """)
+    conn.execute("INSERT INTO event_fts(event_fts) VALUES ('rebuild')")
+    # Separate execute() calls: executescript() would commit the caller's transaction.
+    for trigger in FTS_TRIGGERS:
+        conn.execute(trigger)
+
+def fts_query(terms):
+    """Turn free text into an FTS5 query that ANDs every word.
+
+    Each word is quoted so punctuation and FTS operators in user input are
+    matched literally; a trailing * keeps its prefix-search meaning.
+    """
+    parts = []
+    for word in terms.split():
+        prefix = word.endswith("*")
+        word = word.rstrip("*").replace('"', '""')
+        if word:
+            parts.append(f'"{word}"' + ("*" if prefix else ""))
+    return " ".join(parts)
+
+def parse_search_args(text):
+    """Split 'search' arguments into (terms, first_year, last_year).
+
+    A trailing YEAR or FIRST-LAST token limits the years searched.
+    """
+    words = text.split()
+    first_year = last_year = None
+    if len(words) > 1:
+        match = YEAR_RANGE.match(words[-1])
+        if match:
+            first_year = int(match.group(1))
+            last_year = int(match.group(2) or match.group(1))
+            words = words[:-1]
+    return " ".join(words), first_year, last_year
+
+def search_query(terms, first_year=None, last_year=None, limit=20):
+    """SQL and parameters for a BM25-ranked search with highlighted snippets."""
+    sql = """
+        SELECT e.year, e.section,
+               snippet(event_fts, 0, '[', ']', '...', 16) AS snippet,
+               round(bm25(event_fts), 2) AS score
+        FROM event_fts
+        JOIN event_sections e ON e.text_id = event_fts.rowid
+        WHERE event_fts MATCH ?
+    """
+    params = [fts_query(terms)]
+    if first_year is not None:
+        sql += " AND e.year BETWEEN ? AND ?"
+        params += [first_year, last_year]
+    sql += " ORDER BY rank LIMIT ?"
+    params.append(limit)
+    return sql, tuple(params)
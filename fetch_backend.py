@@ -0,0 +1,217 @@
+"""How the scraper gets a page: plain HTTP first, a browser only when needed.
+
+The year pages are static HTML, so most of the time one keep-alive,
+compressed HTTP request returns exactly what the browser would have rendered,
+at a fraction of the cost of a headless Firefox. A response that fails
+looks_complete() (an error page, a JavaScript interstitial, a truncated body)
+is loaded again in the browser instead.
+
+Both kinds of request are paced by crawl_scheduler's per-host rate limiter,
+and a page that fails to load is retried with backoff before load() gives up.
+
+requests is used when installed, for its pooled keep-alive connections;
+otherwise the same interface falls back to urllib, one connection per request.
+"""
+import email.message
+import gzip
+import logging
+import re
+import urllib.error
+import urllib.request
+import zlib
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:
+    requests = None
+
+from crawl_scheduler import NO_RETRIES, RetryableError, is_client_error, is_retryable
+from scrape_metrics import NO_METRICS
+
+PAGE_LOAD_TIMEOUT = 30
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:89.0) Gecko/20100101 Firefox/89.0"
+ACCEPT_ENCODING = "gzip, deflate"
+MIN_PAGE_CHARS = 512
+SCRIPT_WALL_MARKERS = ("enable javascript", "javascript is disabled", "checking your browser")
+META_CHARSET = re.compile(rb"<meta[^>]+charset=[\"']?([A-Za-z0-9_.:-]+)", re.IGNORECASE)
+
+logger = logging.getLogger(__name__)
+
+def looks_complete(html):
+    """Content check: is this a whole, server-rendered page worth parsing?"""
+    if not html or len(html) < MIN_PAGE_CHARS:
+        return False
+    lowered = html.lower()
+    if "</body>" not in lowered and "</html>" not in lowered:
+        return False  # truncated
+    if any(marker in lowered for marker in SCRIPT_WALL_MARKERS):
+        return False
+    return "<table" in lowered or "<a " in lowered
+
+class IncompletePage(RetryableError, ValueError):
+    """The page failed looks_complete() and there is nothing left to load it with."""
+
+class HttpClient:
+    """HTTP GET/HEAD with conditional requests, shared by all fetch threads.
+
+    get() returns (html, etag, last_modified), or None when the server answers
+    304 Not Modified to the validators passed in. HTTP errors raise.
+    """
+
+    def __init__(self, pool_size=4, timeout=PAGE_LOAD_TIMEOUT):
+        self.timeout = timeout
+        self.headers = {"User-Agent": USER_AGENT, "Accept-Encoding": ACCEPT_ENCODING}
+        self._session = None
+        if requests is not None:
+            self._session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+            self._session.headers.update(self.headers)
+
+    def _request_headers(self, etag, last_modified):
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def get(self, url, etag=None, last_modified=None, metrics=NO_METRICS):
+        headers = self._request_headers(etag, last_modified)
+        if self._session is None:
+            return self._urllib_get(url, headers, metrics)
+        response = self._session.get(url, headers=headers, timeout=self.timeout, stream=True)
+        with response:
+            if response.status_code == 304:
+                return None
+            response.raise_for_status()
+            body = response.raw.read(decode_content=False)
+            metrics.count("bytes_on_wire", len(body))
+            body = decode_body(body, response.headers.get("Content-Encoding"))
+            # Not response.encoding: requests assumes ISO-8859-1 when no charset is declared.
+            return (decode_html(body, declared_charset(response.headers.get("Content-Type"))),
+                    response.headers.get("ETag"), response.headers.get("Last-Modified"))
+
+    def validators(self, url):
+        """(etag, last_modified) from a HEAD request, or (None, None) if it fails."""
+        try:
+            if self._session is None:
+                request = urllib.request.Request(url, method="HEAD", headers=self.headers)
+                with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                    return response.headers.get("ETag"), response.headers.get("Last-Modified")
+            response = self._session.head(url, timeout=self.timeout)
+            return response.headers.get("ETag"), response.headers.get("Last-Modified")
+        except Exception:
+            return None, None
+
+    def close(self):
+        if self._session is not None:
+            self._session.close()
+
+    def _urllib_get(self, url, headers, metrics):
+        request = urllib.request.Request(url, headers={**self.headers, **headers})
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                body = response.read()
+                metrics.count("bytes_on_wire", len(body))
+                body = decode_body(body, response.headers.get("Content-Encoding"))
+                return (decode_html(body, response.headers.get_content_charset()),
+                        response.headers.get("ETag"), response.headers.get("Last-Modified"))
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return None
+            raise
+
+def decode_body(body, encoding):
+    encoding = (encoding or "").lower()
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            return zlib.decompress(body, -zlib.MAX_WBITS)   # raw deflate, as some servers send
+    return body
+
+def declared_charset(content_type):
+    """The charset parameter of a Content-Type header, or None when there is none."""
+    if not content_type:
+        return None
+    message = email.message.Message()
+    message["Content-Type"] = content_type
+    return message.get_content_charset()
+
+def decode_html(body, charset=None):
+    """Text of an HTML body: the server's charset, else the page's <meta charset>, else UTF-8.
+
+    Without either declaration, bytes that are not valid UTF-8 are read as
+    Windows-1252, which is what browsers do with such pages.
+    """
+    if not charset:
+        match = META_CHARSET.search(body[:4096])
+        charset = match.group(1).decode("ascii") if match else None
+    if charset:
+        try:
+            return body.decode(charset, errors="replace")
+        except LookupError:
+            logger.warning("Unknown charset %r; decoding as UTF-8", charset)
+    try:
+        return body.decode("utf-8")
+    except UnicodeDecodeError:
+        return body.decode("windows-1252", errors="replace")
+
+class PageFetcher:
+    """Loads pages over HTTP, falling back to browser(url) for pages that need it.
+
+    With http_first False every page goes to the browser and HTTP is only used
+    for cache validators, as the scraper always did. limiter (a
+    crawl_scheduler.RateLimiter) paces every request; retry decides how often
+    a failed load is tried again.
+    """
+
+    def __init__(self, http, browser=None, http_first=True, limiter=None, retry=NO_RETRIES):
+        self.http = http
+        self.browser = browser
+        self.http_first = http_first
+        self.limiter = limiter
+        self.retry = retry
+
+    def _request(self, url, request):
+        if self.limiter is None:
+            return request()
+        return self.limiter.timed(url, request)
+
+    def load(self, url, metrics=NO_METRICS):
+        """(html, etag, last_modified) for url."""
+        return self.retry.call(lambda: self._load_once(url, metrics), f"Loading {url}", metrics)
+
+    def _load_once(self, url, metrics):
+        if self.http_first:
+            try:
+                html, etag, last_modified = self._request(url, lambda: self.http.get(url, metrics=metrics))
+            except Exception as e:
+                # A busy or unreachable server is not helped by a browser; back off
+                # instead. A 404 or 403 would only come back as the browser's error page.
+                if self.browser is None or is_retryable(e) or is_client_error(e):
+                    raise
+                logger.warning("HTTP fetch of %s failed (%s); loading it in the browser", url, e)
+            else:
+                if looks_complete(html):
+                    metrics.count("http_fetches")
+                    return html, etag, last_modified
+                if self.browser is None:
+                    raise IncompletePage(f"{url} failed the content check and no browser fallback is enabled")
+                logger.info("%s failed the content check; loading it in the browser", url)
+            metrics.count("browser_fallbacks")
+        html = self._request(url, lambda: self.browser(url))
+        metrics.count("browser_fetches")
+        if not looks_complete(html):
+            raise IncompletePage(f"{url} failed the content check in the browser too")
+        # The browser does not expose response headers, so ask for them separately.
+        return (html, *self.http.validators(url))
+
+    def revalidate(self, url, etag, last_modified, metrics=NO_METRICS):
+        """None if the cached copy is still current, else (html, etag, last_modified)."""
+        return self._request(url, lambda: self.http.get(url, etag, last_modified, metrics))
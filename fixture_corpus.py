@@ -0,0 +1,149 @@
+"""Offline corpus of year pages laid out like baseball-almanac's.
+
+Each page has what makes the real ones slow or tricky to parse: a layout
+table wrapping everything, nav menus built from nested tables and lists,
+stat-leader tables full of numbers that are not standings, the standings
+table itself, champion and pennant lines in running text, and menu and
+footer boilerplate repeated on every page. --size scales the amount of filler per page.
+
+The output directory mirrors the site, so it can also be served for an
+end-to-end crawl (python -m http.server, then --years-url .../yearmenu.shtml):
+
+    OUT/yearmenu.shtml
+    OUT/yearly/yr1901a.shtml ...
+    OUT/expected.json          what the parser should extract from each page
+
+    python fixture_corpus.py --years 1901-2025 --size 2 --out-dir fixtures
+"""
+import argparse
+import html
+import json
+import os
+import random
+
+from synthetic_data import CITIES, NICKNAMES, WORDS
+
+YEAR_PAGE = "yearly/yr{year}a.shtml"
+NAV_SECTIONS = {
+    "Almanac": ["Year by Year", "World Series", "All-Star Game", "Awards", "Ballparks", "Draft"],
+    "Players": ["Biographies", "Hall of Fame", "Famous Firsts", "Fabulous Feats", "Obituaries"],
+    "Teams": ["Team by Team", "Managers", "Trades Database", "Umpires", "Opening Day"],
+}
+LEADER_STATS = ["Home Runs", "Batting Average", "Runs Batted In", "Stolen Bases", "Wins", "Strikeouts"]
+FOOTER = [
+    "Copyright 1999-2025 Baseball Almanac, Inc. All Rights Reserved.",
+    "Where what happened yesterday is being preserved today.",
+    "Hosted by Example Hosting.",
+]
+
+def parse_years(text):
+    first, _, last = text.partition("-")
+    return range(int(first), int(last or first) + 1)
+
+def sentence(rng, words=(8, 24)):
+    return " ".join(rng.choices(WORDS, k=rng.randint(*words))).capitalize() + "."
+
+def nav_menu():
+    # Nested layout: a table per menu section, each holding a list of links.
+    cells = []
+    for title, links in NAV_SECTIONS.items():
+        cells.append(f'<td><table class="menu"><tr><th>{title}</th></tr>'
+                     f'<tr><td>{site_menu(links)}</td></tr></table></td>')
+    return f'<table class="nav"><tr>{"".join(cells)}</tr></table>'
+
+def site_menu(links):
+    return "<ul>" + "".join(f'<li><a href="/{name.lower().replace(" ", "-")}.shtml">{name}</a></li>'
+                            for name in links) + "</ul>"
+
+def leaders_table(rng, stat, teams):
+    # Numeric rows like a standings table, but not standings.
+    rows = "".join(
+        f"<tr><td>Player {rng.randint(1, 999)}</td><td>{rng.randint(1, 60)}</td>"
+        f"<td>{rng.randint(1, 200)}</td><td>{html.escape(rng.choice(teams))}</td></tr>"
+        for _ in range(rng.randint(10, 25))
+    )
+    return (f'<table class="boxed"><tr><td class="header" colspan="4">{stat} Leaders</td></tr>'
+            f"<tr><td>Name</td><td>G</td><td>Total</td><td>Team</td></tr>{rows}</table>")
+
+def standings_table(year, records):
+    rows = "".join(
+        f"<tr><td>{html.escape(team)}</td><td>{wins}</td><td>{losses}</td>"
+        f"<td>{wins / (wins + losses):.3f}</td><td>{(records[0][1] - wins + losses - records[0][2]) / 2:g}</td></tr>"
+        for team, wins, losses in records
+    )
+    return (f"<table class=\"boxed\"><caption>{year} American League Team Standings</caption>"
+            f"<tr><th>Team</th><th>W</th><th>L</th><th>WP</th><th>GB</th></tr>{rows}</table>")
+
+def year_page(year, rng, size=1):
+    """HTML for one year page and the stats the parser should extract from it."""
+    teams = [f"{city} {nick}" for city in rng.sample(CITIES, 8) for nick in rng.sample(NICKNAMES, 1)]
+    games = rng.choice((140, 154, 162))
+    records = []
+    for team in teams:
+        wins = rng.randint(games // 4, games * 3 // 4)
+        records.append((team, wins, games - wins))
+    records.sort(key=lambda r: -r[1])
+    champion = records[0][0] if rng.random() < 0.7 else None
+
+    body = [f"<h1>{year} American League</h1>"]
+    paragraphs = [sentence(rng) for _ in range(20 * size)]
+    if champion:
+        paragraphs.insert(rng.randint(0, len(paragraphs)),
+                          f"World Series Champion: {html.escape(champion)}")
+    paragraphs.insert(rng.randint(0, len(paragraphs)),
+                      f"The {html.escape(records[1][0])} finished second in the pennant race.")
+    body += [f"<p>{text}</p>" for text in paragraphs]
+    for _ in range(2 * size):
+        body.append("<ul>" + "".join(f"<li>{sentence(rng, (3, 8))}</li>" for _ in range(10)) + "</ul>")
+    for stat in rng.choices(LEADER_STATS, k=8 * size):
+        body.append(leaders_table(rng, stat, teams))
+    body.insert(rng.randint(len(body) // 2, len(body)), standings_table(year, records))
+    # The site repeats its link menus inside the content area on every page.
+    body += [site_menu(links) for links in NAV_SECTIONS.values()]
+    body += [f"<p>{text}</p>" for text in FOOTER]
+
+    page = (f"<html><head><title>{year} American League Season</title></head><body>"
+            f'<table class="layout"><tr><td>{nav_menu()}</td></tr>'
+            f'<tr><td><div class="main-content">{"".join(body)}</div></td></tr>'
+            f"<tr><td>{nav_menu()}</td></tr></table>"
+            f"</body></html>")
+    expected = {
+        "most_wins": records[0][0],
+        "most_losses": max(records, key=lambda r: r[2])[0],
+        "champion": champion or "Not found",
+        "teams": len(records),
+    }
+    return page, expected
+
+def write_corpus(out_dir, years, size=1, seed=0):
+    """Write the year pages, a year menu and expected.json; returns the page paths."""
+    rng = random.Random(seed)
+    os.makedirs(os.path.join(out_dir, "yearly"), exist_ok=True)
+    expected = {}
+    paths = []
+    for year in years:
+        page, expected[year] = year_page(year, rng, size)
+        path = os.path.join(out_dir, YEAR_PAGE.format(year=year))
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(page)
+        paths.append(path)
+    links = "".join(f'<a href="{YEAR_PAGE.format(year=year)}">{year}</a> ' for year in years)
+    with open(os.path.join(out_dir, "yearmenu.shtml"), "w", encoding="utf-8") as f:
+        f.write(f"<html><body>{nav_menu()}<div>{links}</div></body></html>")
+    with open(os.path.join(out_dir, "expected.json"), "w", encoding="utf-8") as f:
+        json.dump(expected, f, indent=1)
+    return paths
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--years", type=parse_years, default=parse_years("1901-2025"), metavar="FIRST-LAST")
+    parser.add_argument("--size", type=int, default=1, help="filler multiplier per page (default: 1)")
+    parser.add_argument("--out-dir", default="fixtures")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    paths = write_corpus(args.out_dir, args.years, args.size, args.seed)
+    megabytes = sum(os.path.getsize(p) for p in paths) / 1e6
+    print(f"Wrote {len(paths)} pages ({megabytes:.1f} MB) to {args.out_dir}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Serve a fixture corpus over HTTP with injected latency and failures.
+
+For exercising the crawl's rate limiter and retries (crawl_scheduler.py)
+against a site that misbehaves the way real ones do:
+
+    python fixture_corpus.py --years 1901-2025 --out-dir fixtures
+    python fixture_server.py fixtures --delay 0.2 --fail-rate 0.1 --fail-first 1 --max-rate 20
+    python web_scraping.py --years-url http://127.0.0.1:8765/yearmenu.shtml --workers 8 --no-cache
+
+--delay/--jitter slow every response down; --fail-rate answers that share of
+requests with 503 (with Retry-After when --retry-after is set) or, with
+--drop, closes the connection without answering; --fail-first makes every
+year page fail its first N requests, so each one needs a retry; --max-rate
+answers 429 once more than that many requests arrive in a second. Ctrl-C
+prints what was served.
+"""
+import argparse
+import os
+import random
+import threading
+import time
+from collections import Counter, deque
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+class FaultInjector:
+    """Decides, per request, whether to delay it and how (or whether) to fail it."""
+
+    def __init__(self, delay=0.0, jitter=0.0, fail_rate=0.0, fail_first=0, max_rate=None, retry_after=None,
+                 drop=False, seed=None):
+        self.delay = delay
+        self.jitter = jitter
+        self.fail_rate = fail_rate
+        self.fail_first = fail_first
+        self.max_rate = max_rate
+        self.retry_after = retry_after
+        self.drop = drop
+        self.rng = random.Random(seed)
+        self.seen = Counter()       # requests per path, for --fail-first
+        self.served = Counter()     # outcome -> requests
+        self._recent = deque()      # arrival times in the last second, for --max-rate
+        self._lock = threading.Lock()
+
+    def pause(self):
+        with self._lock:
+            seconds = self.delay + self.rng.uniform(0, self.jitter)
+        if seconds > 0:
+            time.sleep(seconds)
+
+    def fault(self, path):
+        """None to serve path normally, else "drop", 429 or 503."""
+        now = time.monotonic()
+        with self._lock:
+            self._recent.append(now)
+            while self._recent and self._recent[0] <= now - 1:
+                self._recent.popleft()
+            self.seen[path] += 1
+            if self.max_rate and len(self._recent) > self.max_rate:
+                outcome = HTTPStatus.TOO_MANY_REQUESTS
+            elif (self.fail_first and "/yearly/" in path and self.seen[path] <= self.fail_first
+                  or self.rng.random() < self.fail_rate):
+                outcome = "drop" if self.drop else HTTPStatus.SERVICE_UNAVAILABLE
+            else:
+                outcome = None
+            self.served[outcome or "ok"] += 1
+        return outcome
+
+def make_handler(root, faults):
+    class Handler(SimpleHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, directory=root, **kwargs)
+
+        def do_GET(self):
+            faults.pause()
+            outcome = faults.fault(self.path)
+            if outcome == "drop":
+                self.close_connection = True
+                return
+            if outcome is not None:
+                self.send_response(outcome)
+                if faults.retry_after is not None or outcome == HTTPStatus.TOO_MANY_REQUESTS:
+                    self.send_header("Retry-After", str(faults.retry_after or 1))
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            super().do_GET()
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("root", help="corpus directory written by fixture_corpus.py")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--delay", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="up to this many more seconds, at random")
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="share of requests that fail (0-1)")
+    parser.add_argument("--fail-first", type=int, default=0, help="failures before each year page succeeds")
+    parser.add_argument("--drop", action="store_true", help="fail by closing the connection instead of a 503")
+    parser.add_argument("--retry-after", type=int, help="Retry-After seconds sent with 503s")
+    parser.add_argument("--max-rate", type=float, help="answer 429 above this many requests per second")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+    if not os.path.isdir(args.root):
+        parser.error(f"{args.root} is not a directory; create it with fixture_corpus.py")
+
+    faults = FaultInjector(args.delay, args.jitter, args.fail_rate, args.fail_first, args.max_rate,
+                           args.retry_after, args.drop, args.seed)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(args.root, faults))
+    print(f"Serving {args.root} on http://{args.host}:{args.port}/yearmenu.shtml")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(", ".join(f"{outcome}: {n}" for outcome, n in sorted(faults.served.items(), key=str)))
+
+if __name__ == "__main__":
+    main()
@@ -1,42 +1,232 @@
-import sqlite3
-import csv
-
-conn = sqlite3.connect("baseball.db")
-cursor = conn.cursor()
-
-cursor.execute("DROP TABLE IF EXISTS team_stats")
-cursor.execute("""
-    CREATE TABLE team_stats (
-        year INTEGER,
-        most_wins TEXT,
-        most_losses TEXT,
-        champion TEXT
-    )
-""")
-
-with open("mlb_stats_summary.csv", "r", encoding="utf-8") as file:
-    reader = csv.DictReader(file)
-    rows = [(int(row["Year"]), row["Most Wins"], row["Most Losses"], row["Champion"]) for row in reader]
-
-cursor.executemany("INSERT INTO team_stats VALUES (?, ?, ?, ?)", rows)
-
-# Keep event_data as before
-cursor.execute("DROP TABLE IF EXISTS event_data")
-cursor.execute("""
-    CREATE TABLE event_data (
-        year INTEGER,
-        section TEXT,
-        content TEXT
-    )
-""")
-
-with open("mlb_history_sections.csv", "r", encoding="utf-8") as file:
-    reader = csv.DictReader(file)
-    rows = [(int(row["Year"]), row["Section"], row["Content"]) for row in reader]
-
-cursor.executemany("INSERT INTO event_data VALUES (?, ?, ?)", rows)
-
-conn.commit()
-conn.close()
-
-print("Database setup complete.")
+import argparse
+import os
+
+from aggregates import create_aggregates
+from bulk_loader import bulk_insert, bulk_load, create_indexes, read_rows
+from columnar import fresh_columnar
+from data_access import DB_PATH
+from event_search import YEAR_RANGE, create_event_fts
+from section_dedup import content_hash, read_boilerplate
+
+def load_team_stats(conn, csv_path):
+    conn.execute("DROP TABLE IF EXISTS team_stats")
+    conn.execute("""
+        CREATE TABLE team_stats (
+            year INTEGER PRIMARY KEY,
+            most_wins TEXT,
+            most_losses TEXT,
+            champion TEXT
+        )
+    """)
+    rows = read_rows(csv_path, lambda row: (int(row["Year"]), row["Most Wins"], row["Most Losses"], row["Champion"]))
+    return bulk_insert(conn, "team_stats", ["year", "most_wins", "most_losses", "champion"], rows)
+
+def load_event_data(conn, csv_path, boilerplate=None):
+    # Each distinct text is stored once in event_text, keyed by its content
+    # hash; event_sections lists which texts each year has. The event_data view
+    # joins them back into the old (year, section, content) rows for queries.
+    # The full-text index over event_text is rebuilt after loading.
+    conn.execute("DROP TABLE IF EXISTS event_fts")
+    conn.execute("DROP VIEW IF EXISTS event_data")
+    conn.execute("DROP TABLE IF EXISTS event_data")
+    conn.execute("DROP TABLE IF EXISTS event_sections")
+    conn.execute("DROP TABLE IF EXISTS event_text")
+    conn.execute("""
+        CREATE TABLE event_text (
+            text_id INTEGER PRIMARY KEY,
+            hash TEXT NOT NULL UNIQUE,
+            content TEXT NOT NULL
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE event_sections (
+            section_id INTEGER PRIMARY KEY,
+            year INTEGER NOT NULL,
+            section TEXT NOT NULL,
+            text_id INTEGER NOT NULL REFERENCES event_text(text_id)
+        )
+    """)
+    conn.execute("""
+        CREATE VIEW event_data AS
+        SELECT s.section_id AS id, s.year, s.section, t.content
+        FROM event_sections s
+        JOIN event_text t ON t.text_id = s.text_id
+    """)
+    rows = read_rows(csv_path, lambda row: (int(row["Year"]), row["Section"], row["Content"]))
+    return insert_sections(conn, rows, boilerplate)
+
+def insert_sections(conn, rows, boilerplate=None):
+    """Insert (year, section, content) rows, adding only texts not stored yet.
+
+    Rows whose content is in boilerplate ({hash: content}) are skipped.
+    Returns the number of event_sections rows inserted.
+    """
+    text_ids = dict(conn.execute("SELECT hash, text_id FROM event_text"))
+
+    def section_rows():
+        for year, section, content in rows:
+            digest = content_hash(content)
+            if boilerplate and digest in boilerplate:
+                continue
+            text_id = text_ids.get(digest)
+            if text_id is None:
+                text_id = conn.execute("INSERT INTO event_text (hash, content) VALUES (?, ?)",
+                                       (digest, content)).lastrowid
+                text_ids[digest] = text_id
+            yield year, section, text_id
+
+    return bulk_insert(conn, "event_sections", ["year", "section", "text_id"], section_rows())
+
+def delete_sections(conn, first_year, last_year):
+    conn.execute("DELETE FROM event_sections WHERE year BETWEEN ? AND ?", (first_year, last_year))
+    prune_texts(conn)
+
+def prune_texts(conn):
+    # Texts no year uses any more; the trigger drops them from event_fts too.
+    conn.execute("DELETE FROM event_text WHERE text_id NOT IN (SELECT text_id FROM event_sections)")
+
+def purge_boilerplate(conn, boilerplate):
+    """Remove every year's sections whose text is in boilerplate ({hash: content})."""
+    conn.executemany("DELETE FROM event_sections WHERE text_id IN (SELECT text_id FROM event_text WHERE hash = ?)",
+                     ((digest,) for digest in boilerplate))
+    prune_texts(conn)
+
+def load_standings(conn, csv_path):
+    # teams is a small dimension table; standings refers to it by integer id so
+    # the fact rows stay compact and team lookups are integer index probes.
+    conn.execute("DROP TABLE IF EXISTS standings")
+    conn.execute("DROP TABLE IF EXISTS teams")
+    conn.execute("""
+        CREATE TABLE teams (
+            team_id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL UNIQUE
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE standings (
+            year INTEGER NOT NULL,
+            team_id INTEGER NOT NULL REFERENCES teams(team_id),
+            wins INTEGER NOT NULL,
+            losses INTEGER NOT NULL,
+            PRIMARY KEY (year, team_id)
+        ) WITHOUT ROWID
+    """)
+    if not os.path.exists(csv_path):
+        print(f"{csv_path} not found; re-run web_scraping.py to collect standings.")
+        return 0, 0
+
+    team_ids = {}
+
+    def team_id(name):
+        if name not in team_ids:
+            team_ids[name] = len(team_ids) + 1
+        return team_ids[name]
+
+    rows = read_rows(csv_path, lambda row: (int(row["Year"]), team_id(row["Team"]), int(row["Wins"]), int(row["Losses"])))
+    # A team listed twice on one page keeps its last row rather than failing the load.
+    standings_count = bulk_insert(conn, "standings", ["year", "team_id", "wins", "losses"], rows,
+                                  on_conflict="REPLACE")
+    bulk_insert(conn, "teams", ["team_id", "name"], ((i, name) for name, i in team_ids.items()))
+    # The primary key already covers lookups by year; this one serves lookups by team.
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_standings_team ON standings (team_id, year)")
+    return len(team_ids), standings_count
+
+def replace_years(conn, first_year, last_year, stats_csv, sections_csv, standings_csv, boilerplate=None):
+    """Swap in the CSV rows for first_year..last_year and leave every other year alone.
+
+    Plain DELETE/INSERT on the existing tables, so the event_fts and
+    aggregate triggers adjust only the rows that changed.
+    """
+    def in_range(row):
+        return first_year <= int(row["Year"]) <= last_year
+
+    counts = {}
+    conn.execute("DELETE FROM team_stats WHERE year BETWEEN ? AND ?", (first_year, last_year))
+    rows = read_rows(stats_csv, lambda row: row)
+    counts["team_stats"] = bulk_insert(
+        conn, "team_stats", ["year", "most_wins", "most_losses", "champion"],
+        ((int(r["Year"]), r["Most Wins"], r["Most Losses"], r["Champion"]) for r in rows if in_range(r)))
+
+    delete_sections(conn, first_year, last_year)
+    rows = read_rows(sections_csv, lambda row: row)
+    counts["event_data"] = insert_sections(
+        conn, ((int(r["Year"]), r["Section"], r["Content"]) for r in rows if in_range(r)), boilerplate)
+
+    conn.execute("DELETE FROM standings WHERE year BETWEEN ? AND ?", (first_year, last_year))
+    counts["standings"] = 0
+    if os.path.exists(standings_csv):
+        rows = [r for r in read_rows(standings_csv, lambda row: row) if in_range(r)]
+        conn.executemany("INSERT OR IGNORE INTO teams (name) VALUES (?)", {(r["Team"],) for r in rows})
+        team_ids = dict(conn.execute("SELECT name, team_id FROM teams"))
+        counts["standings"] = bulk_insert(
+            conn, "standings", ["year", "team_id", "wins", "losses"],
+            ((int(r["Year"]), team_ids[r["Team"]], int(r["Wins"]), int(r["Losses"])) for r in rows),
+            on_conflict="REPLACE")
+    return counts
+
+def replace_year(conn, year, stats, sections):
+    """Swap in one freshly scraped year's rows (web_scraping.py --db).
+
+    Like a failed year in the CSVs, missing stats or sections leave that
+    part of the year's existing rows alone.
+    """
+    if stats:
+        conn.execute("DELETE FROM team_stats WHERE year = ?", (year,))
+        conn.execute("INSERT INTO team_stats (year, most_wins, most_losses, champion) VALUES (?, ?, ?, ?)",
+                     (year, stats["most_wins"], stats["most_losses"], stats["champion"]))
+        teams = stats.get("teams", [])
+        conn.execute("DELETE FROM standings WHERE year = ?", (year,))
+        conn.executemany("INSERT OR IGNORE INTO teams (name) VALUES (?)", {(t["team"],) for t in teams})
+        team_ids = dict(conn.execute("SELECT name, team_id FROM teams"))
+        conn.executemany("INSERT OR REPLACE INTO standings (year, team_id, wins, losses) VALUES (?, ?, ?, ?)",
+                         ((year, team_ids[t["team"]], t["wins"], t["losses"]) for t in teams))
+    if sections:
+        delete_sections(conn, year, year)
+        insert_sections(conn, ((year, row["Section"], row["Content"]) for row in sections))
+
+def main(db_path=DB_PATH, stats_csv="mlb_stats_summary.csv", sections_csv="mlb_history_sections.csv",
+         standings_csv="mlb_team_standings.csv", years=None, boilerplate_csv="mlb_boilerplate_sections.csv"):
+    # Use the memory-mapped .arrow copies when the scraper wrote fresh ones.
+    stats_csv = fresh_columnar(stats_csv) or stats_csv
+    sections_csv = fresh_columnar(sections_csv) or sections_csv
+    standings_csv = fresh_columnar(standings_csv) or standings_csv
+    # Sections web_scraping.py found to be boilerplate, in case the CSV predates it.
+    boilerplate = read_boilerplate(boilerplate_csv)
+    if years:
+        first_year, last_year = years
+        with bulk_load(db_path) as conn:
+            counts = replace_years(conn, first_year, last_year, stats_csv, sections_csv, standings_csv,
+                                   boilerplate)
+        print(f"Replaced {first_year}-{last_year}: {counts['team_stats']} team_stats, "
+              f"{counts['event_data']} event_data and {counts['standings']} standings rows.")
+        return
+
+    with bulk_load(db_path) as conn:
+        stats_count = load_team_stats(conn, stats_csv)
+        event_count = load_event_data(conn, sections_csv, boilerplate)
+        text_count = conn.execute("SELECT count(*) FROM event_text").fetchone()[0]
+        team_count, standings_count = load_standings(conn, standings_csv)
+        create_indexes(conn, "event_sections", ["year", "text_id"])
+        create_event_fts(conn)
+        create_aggregates(conn)
+        # Fresh statistics so the planner knows teams is tiny and standings is not.
+        conn.execute("ANALYZE")
+
+    print(f"Loaded {stats_count} team_stats rows and {event_count} event sections "
+          f"({text_count} distinct texts).")
+    print(f"Loaded {standings_count} standings rows for {team_count} teams.")
+    print("Database setup complete.")
+
+def parse_years(text):
+    match = YEAR_RANGE.match(text)
+    if not match:
+        raise argparse.ArgumentTypeError(f"expected YEAR or FIRST-LAST, got {text!r}")
+    first_year = int(match.group(1))
+    last_year = int(match.group(2) or match.group(1))
+    return min(first_year, last_year), max(first_year, last_year)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=f"Load the scraped CSVs into {DB_PATH}.")
+    parser.add_argument("--years", type=parse_years, metavar="FIRST-LAST",
+                        help="only replace these seasons in an existing database instead of rebuilding it")
+    main(years=parser.parse_args().years)
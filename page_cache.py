@@ -0,0 +1,93 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+DEFAULT_CACHE_DIR = "page_cache"
+
+logger = logging.getLogger(__name__)
+
+class PageCache:
+    """Content-addressed, gzip-compressed store of raw page HTML keyed by URL.
+
+    Page bodies live under objects/<sha256> so identical pages are stored once;
+    index.json maps each URL to its digest plus the ETag/Last-Modified
+    validators needed for conditional revalidation.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, offline=False, refresh=False):
+        self.cache_dir = cache_dir
+        self.offline = offline      # serve only from disk, never touch the network
+        self.refresh = refresh      # ignore cached entries and fetch everything again
+        self.objects_dir = os.path.join(cache_dir, "objects")
+        self.index_path = os.path.join(cache_dir, "index.json")
+        self._lock = threading.Lock()
+        os.makedirs(self.objects_dir, exist_ok=True)
+        self.index = self._load_index()
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except ValueError as e:
+            logger.warning("Ignoring unreadable cache index %s: %s", self.index_path, e)
+            return {}
+
+    def _save_index(self):
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.index, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.index_path)
+
+    def _object_path(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], digest[2:] + ".html.gz")
+
+    def lookup(self, url):
+        with self._lock:
+            entry = self.index.get(url)
+            return dict(entry) if entry else None
+
+    def get(self, url):
+        entry = self.lookup(url)
+        if not entry:
+            return None
+        try:
+            with open(self._object_path(entry["sha256"]), "rb") as f:
+                return gzip.decompress(f.read()).decode("utf-8")
+        except FileNotFoundError:
+            return None
+
+    def put(self, url, html, etag=None, last_modified=None):
+        data = html.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(gzip.compress(data))
+            os.replace(tmp_path, path)
+
+        with self._lock:
+            self.index[url] = {
+                "sha256": digest,
+                "etag": etag,
+                "last_modified": last_modified,
+                "checked_at": time.time(),
+            }
+            self._save_index()
+
+    def mark_checked(self, url):
+        with self._lock:
+            if url in self.index:
+                self.index[url]["checked_at"] = time.time()
+                self._save_index()
+
+    def urls(self):
+        with self._lock:
+            return sorted(self.index)
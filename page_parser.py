@@ -0,0 +1,211 @@
+import logging
+import re
+
+from bs4 import BeautifulSoup, NavigableString
+
+from champion_matcher import clean_champion_text, default_matcher
+from scrape_metrics import NO_METRICS, YearMetrics
+
+logger = logging.getLogger(__name__)
+
+try:
+    import lxml  # noqa: F401  (only needed as the BeautifulSoup backend)
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+STANDINGS_HEADER = re.compile(r"\b(?:team|w|l|won|lost|wins|losses)\b")
+
+def extract_champion_team(line, teams=None):
+    team, _ = default_matcher.match(line, teams)
+    return team
+
+def parse_page(html):
+    return BeautifulSoup(html, HTML_PARSER)
+
+class TableInfo:
+    """What one pass over a <table> learned about it, excluding nested tables."""
+
+    def __init__(self, index):
+        self.index = index
+        self.caption = ""
+        self.header_text = []
+        self.rows = []          # text of the <td> cells of each row
+        self.numeric_rows = 0   # rows shaped like "team, wins, losses"
+        self.score = 0
+
+    def add_row(self, cells):
+        header = [text for tag, text in cells if tag == "th"]
+        data = [text for tag, text in cells if tag == "td"]
+        self.header_text.extend(header)
+        if len(data) >= 3 and data[1].isdigit() and data[2].isdigit():
+            self.numeric_rows += 1
+        self.rows.append(data)
+
+def _scan(node, tables, table, row, cell):
+    for child in node.children:
+        if type(child) is NavigableString:
+            if cell is not None:
+                text = child.strip()
+                if text:
+                    cell.append(text)
+            continue
+        name = getattr(child, "name", None)
+        if name is None:
+            continue  # comments, doctypes, script text
+        if name == "table":
+            info = TableInfo(len(tables))
+            tables.append(info)
+            # A nested table starts fresh, so its text never leaks into the outer cell.
+            _scan(child, tables, info, None, None)
+        elif name == "tr" and table is not None:
+            cells = []
+            _scan(child, tables, table, cells, None)
+            table.add_row(cells)
+        elif name in ("td", "th") and row is not None:
+            text = []
+            _scan(child, tables, table, None, text)
+            row.append((name, "".join(text)))
+        elif name == "caption" and table is not None:
+            text = []
+            _scan(child, tables, table, None, text)
+            table.caption = " ".join(text)
+        else:
+            _scan(child, tables, table, row, cell)
+
+def classify_tables(soup):
+    """Score every table on the page in a single walk of the document.
+
+    Signals: a caption mentioning standings, header cells that look like a
+    standings header (team / W / L / standings), and rows whose second and
+    third cells are integers.
+    """
+    tables = []
+    _scan(soup, tables, None, None, None)
+    for info in tables:
+        caption = info.caption.lower()
+        header = " ".join(info.header_text).lower()
+        if "standings" in caption:
+            info.score += 10
+        if "standings" in header:
+            info.score += 5
+        if STANDINGS_HEADER.search(header):
+            info.score += 2
+        # Enough team rows outweighs a missing caption; cap it so a long
+        # unrelated numeric table cannot beat a captioned standings table.
+        info.score += min(info.numeric_rows, 8)
+    return tables
+
+def select_standings_table(tables):
+    candidates = [t for t in tables if t.numeric_rows > 0]
+    if not candidates:
+        return None
+    # max() keeps the first of equally scored tables, i.e. document order.
+    return max(candidates, key=lambda t: t.score)
+
+def extract_yearly_stats(soup, url, metrics=NO_METRICS):
+    all_teams = []
+    try:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Page title: %s", soup.title.get_text(strip=True) if soup.title else "")
+
+        with metrics.stage("tables"):
+            tables = classify_tables(soup)
+            team_table = select_standings_table(tables)
+        metrics.count("tables_scanned", len(tables))
+        logger.debug("Found %d tables on page", len(tables))
+
+        if not team_table:
+            logger.warning("No suitable team stats table found on %s", url)
+            return None
+        logger.debug("Selected Table %d (score %d): %s", team_table.index, team_table.score, team_table.caption)
+
+        for cells in team_table.rows:
+            if len(cells) >= 3:
+                try:
+                    wins = int(cells[1])
+                    losses = int(cells[2])
+                except ValueError:
+                    continue  # header or subtotal row
+                all_teams.append({"team": cells[0], "wins": wins, "losses": losses})
+        metrics.count("rows_parsed", len(team_table.rows))
+        logger.debug("Parsed %d teams from table %d", len(all_teams), team_table.index)
+
+        if not all_teams:
+            logger.warning("No team data found on %s", url)
+            return None
+
+        most_wins = max(all_teams, key=lambda x: x["wins"])
+        most_losses = max(all_teams, key=lambda x: x["losses"])
+
+        with metrics.stage("champion"):
+            # Teams from this page's standings make the strongest champion matches.
+            champion, confidence = default_matcher.find_champion(soup.get_text(separator="\n"),
+                                                                 [t["team"] for t in all_teams])
+        logger.debug("Champion: %s (confidence %s)", champion, confidence)
+
+        return {
+            "most_wins": most_wins["team"],
+            "most_losses": most_losses["team"],
+            "champion": champion,
+            "champion_confidence": confidence,
+            "teams": all_teams,
+        }
+
+    except Exception as e:
+        logger.error("Error scraping stats from %s: %s", url, e)
+        return None
+
+def extract_yearly_content(soup, year, writer, metrics=NO_METRICS):
+    try:
+        with metrics.stage("content"):
+            sections = 0
+            content_div = soup.find("div", class_="main-content") or soup.find("body")
+            if content_div:
+                paragraphs = content_div.find_all(["p", "ul", "ol"])
+                for para in paragraphs:
+                    section_text = para.get_text(strip=True)
+                    if not section_text:
+                        continue
+                    lowered = section_text.lower()
+                    if (
+                        lowered.startswith("copyright") or
+                        "preserved today" in lowered or
+                        "hosted by" in lowered
+                    ):
+                        continue  # skip footer/junk
+                    
+                    tag_name = para.name
+                    section_type = "Event Summary" if tag_name == "p" else "Event List"
+
+                    writer.writerow({
+                        "Year": year,
+                        "Section": section_type,
+                        "Content": section_text
+                    })
+                    sections += 1
+        metrics.count("sections", sections)
+    except Exception as e:
+        logger.error("Error fetching content for %s: %s", year, e)
+
+class RowBuffer(list):
+    # Stands in for the csv writer so a worker can collect a year's sections
+    # before they are checkpointed and written out.
+    def writerow(self, row):
+        self.append(row)
+
+def parse_year_page(year, url, html):
+    """Parse one fetched year page: (stats, section rows, YearMetrics).
+
+    Top-level and fed only plain values so it can run in a worker process;
+    everything it returns pickles.
+    """
+    metrics = YearMetrics(year)
+    rows = RowBuffer()
+    with metrics.stage("parse"):
+        soup = parse_page(html)
+    stats = extract_yearly_stats(soup, url, metrics)
+    if stats:
+        stats["year"] = year
+    extract_yearly_content(soup, year, rows, metrics)
+    return stats, list(rows), metrics
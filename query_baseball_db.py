@@ -1,30 +1,119 @@
 import sqlite3
 
-def print_rows(rows, headers):
-    # Print rows in a readable table format
-    col_widths = [max(len(str(cell)) for cell in col) for col in zip(*([headers] + rows))]
-    row_format = " | ".join(["{:<" + str(width) + "}" for width in col_widths])
-    print(row_format.format(*headers))
-    print("-" * (sum(col_widths) + 3 * (len(headers) - 1)))
-    for row in rows:
-        print(row_format.format(*row))
-
-def run_query(conn, query, params=()):
+from data_access import DB_PATH, connect_readonly
+from event_search import parse_search_args, search_query
+from repl_output import ResultPager, explain, parse_limit
+from result_cache import QueryResultCache
+
+def run_query(conn, query, params=(), show=None):
+    # show is pager.run (stream the rows) or explain (print the plan only).
     try:
-        cur = conn.cursor()
-        cur.execute(query, params)
-        rows = cur.fetchall()
-        headers = [desc[0] for desc in cur.description]
-        if rows:
-            print_rows(rows, headers)
-        else:
-            print("No results found.")
+        (show or ResultPager().run)(conn, query, params)
     except sqlite3.Error as e:
         print(f"An error occurred: {e}")
 
+def build_query(user_input):
+    """SQL and parameters for a REPL command; ValueError with usage if it's malformed."""
+    if user_input.startswith("teams "):
+        parts = user_input.split()
+        if len(parts) != 2 or not parts[1].isdigit():
+            raise ValueError("Invalid input. Usage: teams YEAR")
+        year = int(parts[1])
+        query = """
+        SELECT t.name AS team, s.wins, s.losses
+        FROM standings s
+        JOIN teams t ON t.team_id = s.team_id
+        WHERE s.year = ?
+        ORDER BY s.wins DESC
+        """
+        return query, (year,)
+    elif user_input.startswith("events "):
+        parts = user_input.split()
+        if len(parts) != 2 or not parts[1].isdigit():
+            raise ValueError("Invalid input. Usage: events YEAR")
+        year = int(parts[1])
+        query = "SELECT section, content FROM event_data WHERE year = ?"
+        return query, (year,)
+    elif user_input.startswith("join "):
+        parts = user_input.split()
+        if len(parts) != 2 or not parts[1].isdigit():
+            raise ValueError("Invalid input. Usage: join YEAR")
+        year = int(parts[1])
+        query = """
+        SELECT t.name AS team, s.wins, s.losses, ed.section, ed.content
+        FROM standings s
+        JOIN teams t ON t.team_id = s.team_id
+        LEFT JOIN event_data ed ON s.year = ed.year
+        WHERE s.year = ?
+        ORDER BY t.name
+        """
+        return query, (year,)
+    elif user_input.startswith("filterteam "):
+        parts = user_input.split(maxsplit=2)
+        if len(parts) != 3 or not parts[1].isdigit():
+            raise ValueError("Invalid input. Usage: filterteam YEAR TEAM_SUBSTRING")
+        year = int(parts[1])
+        team_sub = parts[2].lower()
+        # The substring match only scans the small teams table; standings
+        # rows are then fetched by their (year, team_id) primary key.
+        query = """
+        SELECT t.name AS team, s.wins, s.losses
+        FROM standings s
+        JOIN teams t ON t.team_id = s.team_id
+        WHERE s.year = ?
+          AND s.team_id IN (SELECT team_id FROM teams WHERE name LIKE ?)
+        ORDER BY s.wins DESC
+        """
+        return query, (year, f"%{team_sub}%")
+    elif user_input.startswith("teamhistory "):
+        parts = user_input.split(maxsplit=1)
+        if len(parts) != 2:
+            raise ValueError("Invalid input. Usage: teamhistory TEAM_SUBSTRING")
+        query = """
+        SELECT s.year, t.name AS team, s.wins, s.losses
+        FROM standings s
+        JOIN teams t ON t.team_id = s.team_id
+        WHERE s.team_id IN (SELECT team_id FROM teams WHERE name LIKE ?)
+        ORDER BY s.year, t.name
+        """
+        return query, (f"%{parts[1].lower()}%",)
+    elif user_input.startswith("search "):
+        terms, first_year, last_year = parse_search_args(user_input[len("search "):])
+        if not terms:
+            raise ValueError("Invalid input. Usage: search TERMS [YEAR or FIRST-LAST]")
+        query, params = search_query(terms, first_year, last_year)
+        return query, params
+    elif user_input == "champions":
+        # Read straight from the aggregate tables the importer maintains.
+        query = """
+        SELECT team, SUM(championships) AS championships,
+               SUM(most_wins) AS most_wins, SUM(most_losses) AS most_losses
+        FROM (
+            SELECT champion AS team, championships, 0 AS most_wins, 0 AS most_losses
+            FROM champion_counts WHERE champion <> 'Not found'
+            UNION ALL
+            SELECT team, 0, most_wins, most_losses FROM team_mentions
+        )
+        GROUP BY team
+        ORDER BY championships DESC, most_wins + most_losses DESC, team
+        """
+        return query, ()
+    elif user_input == "decades":
+        query = """
+        SELECT decade, seasons, champions_found, team_seasons, games
+        FROM decade_summary
+        ORDER BY decade
+        """
+        return query, ()
+    raise ValueError("Unknown command. Type 'help' for commands.")
+
 def main():
-    print("Connecting to baseball.db...")
-    conn = sqlite3.connect("baseball.db")
+    print(f"Connecting to {DB_PATH}...")
+    try:
+        conn = connect_readonly(DB_PATH)
+    except sqlite3.Error as e:
+        print(f"Could not open {DB_PATH}: {e}. Run import_to_db.py first.")
+        return
     print("Connected. Enter your queries or type 'help' or 'exit'.")
 
     help_text = """
@@ -46,10 +135,39 @@ Commands you can try:
    > filterteam YEAR TEAM_SUBSTRING
    Example: filterteam 1885 yankees
 
-5. Exit the program:
+5. Show every season on record for teams matching a name:
+   > teamhistory TEAM_SUBSTRING
+   Example: teamhistory red sox
+
+6. Full-text search of event text, best matches first:
+   > search TERMS [YEAR or FIRST-LAST]
+   Example: search world series 1900-1920
+   Example: search perfect game
+
+7. Championship and most-wins/most-losses counts per team:
+   > champions
+
+8. Seasons, champions found and games played per decade:
+   > decades
+
+9. Show the plan SQLite would use for any command above:
+   > explain COMMAND
+   Example: explain filterteam 1885 yankees
+
+Results are shown a page at a time:
+   > more          show the next page
+   > limit ROWS    rows per page (limit 0 shows everything)
+
+Repeated commands are answered from a result cache until the database changes:
+   > cache         show cache hit/miss statistics
+   > cache clear   empty the cache
+
+10. Exit the program:
    > exit
 """
 
+    cache = QueryResultCache()
+    pager = ResultPager(cache=cache)
     while True:
         user_input = input("Query> ").strip()
         if user_input.lower() in ("exit", "quit"):
@@ -58,49 +176,41 @@ Commands you can try:
         elif user_input.lower() == "help":
             print(help_text)
             continue
-        elif user_input.startswith("teams "):
-            parts = user_input.split()
-            if len(parts) != 2 or not parts[1].isdigit():
-                print("Invalid input. Usage: teams YEAR")
-                continue
-            year = int(parts[1])
-            query = "SELECT team, wins, losses FROM team_stats WHERE year = ?"
-            run_query(conn, query, (year,))
-        elif user_input.startswith("events "):
-            parts = user_input.split()
-            if len(parts) != 2 or not parts[1].isdigit():
-                print("Invalid input. Usage: events YEAR")
-                continue
-            year = int(parts[1])
-            query = "SELECT section, content FROM event_data WHERE year = ?"
-            run_query(conn, query, (year,))
-        elif user_input.startswith("join "):
-            parts = user_input.split()
-            if len(parts) != 2 or not parts[1].isdigit():
-                print("Invalid input. Usage: join YEAR")
-                continue
-            year = int(parts[1])
-            query = """
-            SELECT ts.team, ts.wins, ts.losses, ed.section, ed.content
-            FROM team_stats ts
-            LEFT JOIN event_data ed ON ts.year = ed.year
-            WHERE ts.year = ?
-            ORDER BY ts.team
-            """
-            run_query(conn, query, (year,))
-        elif user_input.startswith("filterteam "):
-            parts = user_input.split(maxsplit=2)
-            if len(parts) != 3 or not parts[1].isdigit():
-                print("Invalid input. Usage: filterteam YEAR TEAM_SUBSTRING")
+        elif user_input == "cache":
+            stats = cache.stats()
+            print(f"{stats['entries']} cached results, {stats['hits']} hits, {stats['misses']} misses "
+                  f"({stats['hit_rate']:.0%} hit rate), {stats['evictions']} evicted, "
+                  f"{stats['invalidations']} invalidated by database changes")
+            continue
+        elif user_input == "cache clear":
+            cache.clear()
+            print("Result cache cleared.")
+            continue
+        elif user_input == "more":
+            pager.more()
+            continue
+        elif user_input == "limit" or user_input.startswith("limit "):
+            page_size = parse_limit(user_input)
+            if page_size is None:
+                print(f"Showing {pager.page_size or 'all'} rows at a time. Usage: limit ROWS (0 for no paging)")
                 continue
-            year = int(parts[1])
-            team_sub = parts[2].lower()
-            query = "SELECT team, wins, losses FROM team_stats WHERE year = ? AND LOWER(team) LIKE ?"
-            run_query(conn, query, (year, f"%{team_sub}%"))
+            pager.page_size = page_size
+            continue
+        explain_only = user_input.startswith("explain ")
+        if explain_only:
+            user_input = user_input[len("explain "):].strip()
+        try:
+            query, params = build_query(user_input)
+        except ValueError as e:
+            print(e)
+            continue
+        if explain_only:
+            run_query(conn, query, params, explain)
         else:
-            print("Unknown command. Type 'help' for commands.")
+            run_query(conn, query, params, pager.run)
 
+    pager.close()
     conn.close()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
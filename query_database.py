@@ -1,29 +1,20 @@
 import sqlite3
 
-DB_FILE = "mlb_history.db"
+from data_access import DB_PATH, connect_readonly
+from repl_output import ResultPager, explain, parse_limit
 
 def connect_db():
     try:
-        conn = sqlite3.connect(DB_FILE)
+        conn = connect_readonly(DB_PATH)
         return conn
     except sqlite3.Error as e:
         print(f"Error connecting to database: {e}")
         return None
 
-def run_query(conn, query, params=()):
+def run_query(conn, query, params=(), show=None):
+    # show is pager.run (stream the rows) or explain (print the plan only).
     try:
-        cur = conn.cursor()
-        cur.execute(query, params)
-        rows = cur.fetchall()
-        if rows:
-            # Print column names
-            col_names = [desc[0] for desc in cur.description]
-            print("\t".join(col_names))
-            print("-" * 40)
-            for row in rows:
-                print("\t".join(str(cell) for cell in row))
-        else:
-            print("No results found.")
+        (show or ResultPager().run)(conn, query, params)
     except sqlite3.Error as e:
         print(f"Error executing query: {e}")
 
@@ -32,10 +23,14 @@ def main():
     if not conn:
         return
 
-    print("Connected to MLB SQLite database.")
+    print(f"Connected to {DB_PATH} (read-only).")
     print("Enter your SQL queries below (type 'exit' to quit).")
-    print("Example: SELECT * FROM mlb_stats_summary WHERE Year = 1920;")
-    print("You can join tables, filter by year, event, etc.\n")
+    print("Example: SELECT * FROM team_stats WHERE year = 1920;")
+    print("You can join tables, filter by year, event, etc.")
+    print("Results come a page at a time: 'more' shows the next page, 'limit ROWS' sets")
+    print("the page size (0 for no paging), 'explain QUERY' shows the query plan.\n")
+
+    pager = ResultPager()
 
     while True:
         user_input = input("SQL> ").strip()
@@ -44,9 +39,27 @@ def main():
             break
         if not user_input:
             continue
-        
-        run_query(conn, user_input)
+        if user_input.lower() == "more":
+            pager.more()
+            continue
+        if user_input.lower() == "limit" or user_input.lower().startswith("limit "):
+            page_size = parse_limit(user_input)
+            if page_size is None:
+                print(f"Showing {pager.page_size or 'all'} rows at a time. Usage: limit ROWS (0 for no paging)")
+                continue
+            pager.page_size = page_size
+            continue
+        if user_input.lower().startswith("explain "):
+            query = user_input[len("explain "):].strip()
+            # Accept SQLite's own spelling too.
+            if query.lower().startswith("query plan "):
+                query = query[len("query plan "):]
+            run_query(conn, query, show=explain)
+            continue
+
+        run_query(conn, user_input, show=pager.run)
 
+    pager.close()
     conn.close()
 
 if __name__ == "__main__":
@@ -0,0 +1,154 @@
+"""Paged, streaming result output shared by the SQL REPLs.
+
+Rows are pulled from the cursor with fetchmany() one page at a time and each
+page is printed as soon as it arrives, with column widths computed from that
+page alone, so a broad SELECT neither waits for nor holds the whole result.
+After a full page the cursor is kept open and the REPL's 'more' command
+prints the next one.
+
+With a result_cache.QueryResultCache attached, a result read to the end is
+kept, and running the same query again replays it without touching SQLite.
+"""
+import time
+from itertools import islice
+
+DEFAULT_PAGE_SIZE = 50
+
+def print_rows(rows, headers):
+    # Print rows in a readable table format
+    col_widths = [max(len(str(cell)) for cell in col) for col in zip(*([headers] + rows))]
+    row_format = " | ".join(["{:<" + str(width) + "}" for width in col_widths])
+    print(row_format.format(*headers))
+    print("-" * (sum(col_widths) + 3 * (len(headers) - 1)))
+    for row in rows:
+        print(row_format.format(*row))
+
+def print_plan(plan_rows):
+    """Print EXPLAIN QUERY PLAN rows (id, parent, notused, detail) as a tree."""
+    depth = {0: -1}
+    print("QUERY PLAN")
+    for node_id, parent, _, detail in plan_rows:
+        depth[node_id] = depth.get(parent, -1) + 1
+        print("   " * depth[node_id] + "--" + detail)
+
+class CachedRows:
+    """A cursor-like view over rows held in memory (a result cache hit)."""
+
+    def __init__(self, rows):
+        self._rows = iter(rows)
+
+    def fetchmany(self, size):
+        return list(islice(self._rows, size))
+
+    def close(self):
+        self._rows = iter(())
+
+class ResultPager:
+    """Runs queries and prints their results page_size rows at a time.
+
+    page_size 0 prints every page without stopping, still streaming.
+    """
+
+    def __init__(self, page_size=DEFAULT_PAGE_SIZE, cache=None):
+        self.page_size = page_size
+        self.cache = cache
+        self._cursor = None
+        self._headers = []
+        self._next_page = []
+        self._shown = 0
+        self._elapsed = 0.0
+        self._from_cache = False
+        self._collected = None   # rows kept for the cache while paging
+        self._query = None
+
+    @property
+    def pending(self):
+        return self._cursor is not None
+
+    def close(self):
+        if self._cursor is not None:
+            self._cursor.close()
+            self._cursor = None
+
+    def run(self, conn, query, params=()):
+        """Execute query and print its first page. sqlite3.Error propagates."""
+        self.close()
+        start = time.perf_counter()
+        self._shown = 0
+        self._collected = None
+        cached = self.cache.get(conn, query, params) if self.cache else None
+        self._from_cache = cached is not None
+        if cached:
+            self._headers, rows = cached
+            self._cursor = CachedRows(rows)
+            self._elapsed = time.perf_counter() - start
+        else:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(query, params)
+            except BaseException:
+                cursor.close()
+                raise
+            self._elapsed = time.perf_counter() - start
+            if cursor.description is None:
+                # Not a SELECT: nothing to page through.
+                print(f"({max(cursor.rowcount, 0)} rows affected, {self._elapsed:.3f} s)")
+                cursor.close()
+                return
+            self._cursor = cursor
+            self._headers = [desc[0] for desc in cursor.description]
+            if self.cache:
+                self._collected = []
+                self._query = (conn, query, params)
+        self._next_page = self._fetch()
+        if not self._next_page:
+            self.close()
+            print("No results found.")
+            return
+        self.more()
+
+    def more(self):
+        """Print the next page of the pending query (every page if page_size is 0)."""
+        if not self.pending:
+            print("No more rows.")
+            return
+        while True:
+            page = self._next_page
+            print_rows(page, self._headers)
+            self._shown += len(page)
+            # Fetch one page ahead so we know whether to offer 'more'.
+            self._next_page = self._fetch()
+            if not self._next_page:
+                self.close()
+                source = ", from cache" if self._from_cache else ""
+                print(f"({self._shown} rows, {self._elapsed:.3f} s{source})")
+                return
+            if self.page_size:
+                print(f"-- {self._shown} rows so far ({self._elapsed:.3f} s); "
+                      f"type 'more' for the next {self.page_size} --")
+                return
+
+    def _fetch(self):
+        start = time.perf_counter()
+        rows = self._cursor.fetchmany(self.page_size or DEFAULT_PAGE_SIZE)
+        self._elapsed += time.perf_counter() - start
+        if self._collected is not None:
+            if rows:
+                self._collected.extend(rows)
+                if len(self._collected) > self.cache.max_rows:
+                    self._collected = None   # too big to keep; just stream it
+            else:
+                # Read to the end: the complete result can be cached.
+                conn, query, params = self._query
+                self.cache.put(conn, query, params, self._headers, self._collected)
+                self._collected = None
+        return rows
+
+def explain(conn, query, params=()):
+    """Print SQLite's plan for query without running it."""
+    print_plan(conn.execute(f"EXPLAIN QUERY PLAN {query}", params).fetchall())
+
+def parse_limit(text):
+    """Page size from a 'limit N' command, or None if N is not a non-negative integer."""
+    value = text.split(maxsplit=1)[1:] or [""]
+    return int(value[0]) if value[0].isdigit() else None
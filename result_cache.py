@@ -0,0 +1,91 @@
+"""Bounded LRU cache of REPL query results.
+
+Entries are keyed on the query text with whitespace normalized plus its
+parameters. Every lookup first compares the database's current version with
+the one the cached entries were read at and drops them all if it moved:
+
+  PRAGMA data_version  changes when another connection commits (a re-import)
+  total_changes        changes when this connection writes
+  the file's stat      changes when the file is replaced or rewritten
+
+so a result is never served after the data under it changed.
+"""
+import os
+import re
+from collections import OrderedDict
+
+DEFAULT_MAX_ENTRIES = 128
+DEFAULT_MAX_ROWS = 10_000   # bigger results are streamed but not kept
+
+# Quoted strings are kept as-is; any other run of whitespace becomes one space.
+_SQL_TOKENS = re.compile(r"""('(?:[^']|'')*'|"(?:[^"]|"")*")|\s+""")
+
+def normalize_sql(query):
+    return _SQL_TOKENS.sub(lambda m: m.group(1) or " ", query).strip().rstrip(";").strip()
+
+def database_version(conn):
+    """A value that changes whenever the data visible to conn may have changed."""
+    version = conn.execute("PRAGMA data_version").fetchone()[0]
+    path = conn.execute("PRAGMA database_list").fetchone()[2]
+    try:
+        stat = os.stat(path)
+        file_state = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    except (OSError, TypeError):
+        file_state = None   # in-memory or temporary database
+    return version, conn.total_changes, file_state
+
+class QueryResultCache:
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, max_rows=DEFAULT_MAX_ROWS):
+        self.max_entries = max_entries
+        self.max_rows = max_rows
+        self._entries = OrderedDict()   # key -> (headers, rows)
+        self._version = None
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def key(self, query, params):
+        return normalize_sql(query), tuple(params)
+
+    def check(self, conn):
+        """Drop every entry if the database changed since they were stored."""
+        version = database_version(conn)
+        if version != self._version:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self._version = version
+
+    def get(self, conn, query, params):
+        """(headers, rows) for a cached query, or None (counted as a miss)."""
+        self.check(conn)
+        key = self.key(query, params)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, conn, query, params, headers, rows):
+        # Store only if nothing changed while the rows were being read.
+        if len(rows) > self.max_rows or database_version(conn) != self._version:
+            return
+        self._entries[self.key(query, params)] = (headers, rows)
+        self._entries.move_to_end(self.key(query, params))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
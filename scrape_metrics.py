@@ -0,0 +1,136 @@
+import json
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+
+class YearMetrics:
+    """Stage timings and counters for one year page (or the crawl itself when year is None).
+
+    Only touched by the worker handling that year, so it needs no locking, and
+    it pickles cleanly so it can be filled in by another process and sent back.
+    """
+
+    def __init__(self, year=None):
+        self.year = year
+        self.started = time.perf_counter()
+        self.wall_seconds = None
+        self.stages = defaultdict(float)
+        self.calls = defaultdict(int)
+        self.counters = defaultdict(int)
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] += time.perf_counter() - start
+            self.calls[name] += 1
+
+    def count(self, name, value=1):
+        self.counters[name] += value
+
+    def merge(self, other):
+        """Fold in stages and counters recorded elsewhere, e.g. by a parse worker process."""
+        for name, seconds in other.stages.items():
+            self.stages[name] += seconds
+        for name, n in other.calls.items():
+            self.calls[name] += n
+        for name, value in other.counters.items():
+            self.counters[name] += value
+
+    def finish(self):
+        self.wall_seconds = time.perf_counter() - self.started
+
+    def as_dict(self):
+        return {
+            "year": self.year,
+            "wall_seconds": round(self.wall_seconds or 0.0, 6),
+            "stages": {k: round(v, 6) for k, v in self.stages.items()},
+            "counters": dict(self.counters),
+        }
+
+class NullMetrics:
+    # Used when instrumentation is off; every call is a no-op.
+    year = None
+    _context = nullcontext()
+
+    def stage(self, name):
+        return self._context
+
+    def count(self, name, value=1):
+        pass
+
+    def merge(self, other):
+        pass
+
+    def finish(self):
+        pass
+
+NO_METRICS = NullMetrics()
+
+class ScrapeMetrics:
+    """Collects YearMetrics for a crawl and writes them as JSON lines or Prometheus text."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.run = YearMetrics()
+        self.years = []
+
+    def year(self, year):
+        return YearMetrics(year)
+
+    def add(self, year_metrics):
+        year_metrics.finish()
+        with self._lock:
+            self.years.append(year_metrics)
+
+    def totals(self):
+        stages = defaultdict(float)
+        calls = defaultdict(int)
+        counters = defaultdict(int)
+        with self._lock:
+            records = self.years + [self.run]
+        for record in records:
+            for name, seconds in record.stages.items():
+                stages[name] += seconds
+            for name, n in record.calls.items():
+                calls[name] += n
+            for name, value in record.counters.items():
+                counters[name] += value
+        return stages, calls, counters
+
+    def write_jsonl(self, path):
+        self.run.finish()
+        with self._lock:
+            records = sorted(self.years, key=lambda m: m.year)
+        with open(path, "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record.as_dict()) + "\n")
+            f.write(json.dumps(dict(self.run.as_dict(), year="total")) + "\n")
+
+    def write_prometheus(self, path):
+        self.run.finish()
+        stages, calls, counters = self.totals()
+        lines = [
+            "# HELP scrape_stage_seconds_total Wall time spent in each scraper stage.",
+            "# TYPE scrape_stage_seconds_total counter",
+        ]
+        lines += [f'scrape_stage_seconds_total{{stage="{name}"}} {stages[name]:.6f}' for name in sorted(stages)]
+        lines += [
+            "# HELP scrape_stage_calls_total Number of times each scraper stage ran.",
+            "# TYPE scrape_stage_calls_total counter",
+        ]
+        lines += [f'scrape_stage_calls_total{{stage="{name}"}} {calls[name]}' for name in sorted(calls)]
+        for name in sorted(counters):
+            lines.append(f"# TYPE scrape_{name}_total counter")
+            lines.append(f"scrape_{name}_total {counters[name]}")
+        lines += [
+            "# TYPE scrape_years_total counter",
+            f"scrape_years_total {len(self.years)}",
+            "# TYPE scrape_run_seconds gauge",
+            f"scrape_run_seconds {self.run.wall_seconds:.6f}",
+        ]
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
@@ -0,0 +1,126 @@
+"""Fetch -> parse -> write pipeline for the crawl.
+
+    fetch threads  --fetched-->  parse processes  --parsed-->  writer
+    (HTTP+browser) bounded       (one per core)                (caller's thread)
+
+Fetch threads only fetch: each page's HTML is handed to a bounded queue and
+the thread moves on to the next page. A dispatcher thread feeds the queue to a
+ProcessPoolExecutor running page_parser.parse_year_page, so BeautifulSoup and
+the champion matcher use every core instead of sharing one with the
+fetch threads. Finished years come back to the calling thread, the only writer.
+
+A semaphore caps the years that have been fetched but not yet written. When
+parsing or writing falls behind, the queue fills and the fetchers block on it
+instead of piling up pages in memory.
+"""
+import logging
+import os
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+from page_parser import parse_year_page
+from scrape_metrics import NO_METRICS
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+def _put(q, item, stop):
+    # A blocking put that still notices when the pipeline is shutting down.
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+def run_pipeline(year_links, fetch, write, fetch_workers=1, parse_workers=None, queue_size=None,
+                 metrics=None):
+    """Fetch, parse and write every (year, url) in year_links.
+
+    fetch(year, url, year_metrics) returns the page's HTML, or None if it
+    could not be fetched (and has logged why). It is called from fetch_workers
+    threads. write(year, stats, section_rows) is called once per year on the
+    calling thread, in the order years finish; stats is None and section_rows
+    is empty for a page that could not be fetched or parsed.
+    """
+    parse_workers = parse_workers or os.cpu_count() or 1
+    queue_size = queue_size or 2 * parse_workers
+    fetched = queue.Queue(maxsize=queue_size)
+    parsed = queue.Queue()
+    in_flight = threading.Semaphore(queue_size)
+    stop = threading.Event()
+
+    def fetch_one(link):
+        year, url = link
+        year_metrics = metrics.year(year) if metrics else NO_METRICS
+        try:
+            html = fetch(year, url, year_metrics)
+        except Exception as e:
+            logger.error("Error loading %s: %s", url, e)
+            html = None
+        _put(fetched, (year, url, html, year_metrics), stop)
+
+    def fetch_all():
+        with ThreadPoolExecutor(max_workers=max(1, fetch_workers)) as fetchers:
+            list(fetchers.map(fetch_one, year_links))
+        _put(fetched, _DONE, stop)
+
+    def dispatch(parsers):
+        while not stop.is_set():
+            item = fetched.get()
+            if item is _DONE:
+                return
+            year, url, html, year_metrics = item
+            # Released by the writer once the year is written.
+            while not in_flight.acquire(timeout=0.1):
+                if stop.is_set():
+                    return
+            if html is None:
+                parsed.put((year, None, year_metrics, None))
+                continue
+            future = parsers.submit(parse_year_page, year, url, html)
+            future.add_done_callback(partial(deliver, year=year, year_metrics=year_metrics))
+
+    def deliver(future, year, year_metrics):
+        if future.cancelled():
+            return  # shutting down
+        error = future.exception()
+        parsed.put((year, None if error else future.result(), year_metrics, error))
+
+    with ProcessPoolExecutor(max_workers=parse_workers) as parsers:
+        threads = [
+            threading.Thread(target=fetch_all, name="fetch", daemon=True),
+            threading.Thread(target=dispatch, args=(parsers,), name="dispatch", daemon=True),
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            # Every link produces exactly one parsed item, fetched or not.
+            for _ in range(len(year_links)):
+                item = parsed.get()
+                in_flight.release()
+                _write_item(item, write, metrics)
+        except BaseException:
+            stop.set()
+            parsers.shutdown(wait=False, cancel_futures=True)
+            raise
+        finally:
+            for thread in threads:
+                thread.join(timeout=1)
+
+def _write_item(item, write, metrics):
+    # (year, parse_year_page's result or None, fetch metrics, parse exception or None)
+    year, result, year_metrics, error = item
+    stats, rows = None, []
+    if error is not None:
+        logger.error("Error parsing %s: %s", year, error)
+    elif result is not None:
+        stats, rows, parse_metrics = result
+        year_metrics.merge(parse_metrics)
+    if metrics:
+        metrics.add(year_metrics)
+    write(year, stats, rows)
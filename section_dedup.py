@@ -0,0 +1,68 @@
+"""Content hashes for event sections, and finding the ones that are boilerplate.
+
+Every year page repeats the site's navigation menus and a few headings
+("All-Star GameA.L.C.S. & N.L.C.S.Awards...", "Hitting Statistics League
+Leaderboard") as <p>/<ul> blocks, so extract_yearly_content picks them up as
+sections for every season. A section whose text shows up in at least
+BOILERPLATE_SHARE of the seasons is treated as boilerplate: the scraper
+leaves it out of the sections CSV, the journal and the database, and records
+it once in the boilerplate CSV. Later crawls drop those sections as soon as a
+page is parsed.
+
+The database stores each remaining distinct text once, keyed by
+content_hash (see import_to_db.py).
+"""
+import csv
+import hashlib
+import os
+from collections import defaultdict
+
+BOILERPLATE_SHARE = 0.5
+MIN_YEARS = 10   # fewer seasons than this is too few to tell boilerplate from news
+BOILERPLATE_FIELDS = ["Hash", "Content"]
+
+def content_hash(text):
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+def find_boilerplate(results, known=None):
+    """{hash: content} for the sections repeated across most seasons of results.
+
+    results is {year: {"sections": rows, ...}} as the scraper builds it.
+    Entries of known (an earlier result) are always kept: once dropped from
+    the CSV, a menu no longer looks common there.
+    """
+    boilerplate = dict(known or {})
+    if len(results) < MIN_YEARS:
+        return boilerplate
+    years = defaultdict(set)
+    contents = {}
+    for year, result in results.items():
+        for row in result["sections"]:
+            digest = content_hash(row["Content"])
+            years[digest].add(year)
+            contents[digest] = row["Content"]
+    cutoff = BOILERPLATE_SHARE * len(results)
+    for digest, seen in years.items():
+        if len(seen) >= cutoff:
+            boilerplate[digest] = contents[digest]
+    return boilerplate
+
+def drop_boilerplate(rows, boilerplate):
+    if not boilerplate:
+        return list(rows)
+    return [row for row in rows if content_hash(row["Content"]) not in boilerplate]
+
+def read_boilerplate(path):
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, newline="", encoding="utf-8") as f:
+        return {row["Hash"]: row["Content"] for row in csv.DictReader(f)}
+
+def write_boilerplate(path, boilerplate):
+    tmp_name = path + ".tmp"
+    with open(tmp_name, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=BOILERPLATE_FIELDS)
+        writer.writeheader()
+        for digest, content in sorted(boilerplate.items(), key=lambda item: item[1]):
+            writer.writerow({"Hash": digest, "Content": content})
+    os.replace(tmp_name, path)
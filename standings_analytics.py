@@ -0,0 +1,147 @@
+"""Season-by-season team analytics from the standings, in whole-column operations.
+
+compute() takes every (year, team, wins, losses) row at once and derives, with
+no Python loop over teams or years:
+
+  win_pct        wins / games
+  games_behind   behind that season's best record ((lead W-L) - (W-L)) / 2
+  rank           place in that season's standings, 1 = best win_pct
+  rolling_pct    mean win_pct over the franchise's last ROLLING_SEASONS seasons played
+  streak         consecutive winning (+n) or losing (-n) seasons ending here; 0 at .500
+
+and per-franchise totals. A franchise is a team name with the renames in
+FRANCHISES folded together; names reused by unrelated clubs (the Washington
+Senators, the 1901 Milwaukee Brewers) stay separate.
+"""
+import numpy as np
+import pandas as pd
+
+ROLLING_SEASONS = 5
+
+# Historical names of the same club, by the name it plays under now.
+FRANCHISES = {
+    "Boston Americans": "Boston Red Sox",
+    "New York Highlanders": "New York Yankees",
+    "Cleveland Blues": "Cleveland Guardians",
+    "Cleveland Naps": "Cleveland Guardians",
+    "Cleveland Indians": "Cleveland Guardians",
+    "Philadelphia Athletics": "Athletics",
+    "Kansas City Athletics": "Athletics",
+    "Oakland Athletics": "Athletics",
+    "California Angels": "Los Angeles Angels",
+    "Anaheim Angels": "Los Angeles Angels",
+    "Los Angeles Angels of Anaheim": "Los Angeles Angels",
+    "Tampa Bay Devil Rays": "Tampa Bay Rays",
+    "Seattle Pilots": "Milwaukee Brewers",
+}
+
+class StandingsAnalytics:
+    """compute()'s output: seasons (one row per team-season) and franchises."""
+
+    def __init__(self, seasons, franchises, window):
+        self.seasons = seasons
+        self.franchises = franchises
+        self.window = window
+        self.version = None   # set by whoever caches it (dashboard_data)
+        self.years = sorted(int(y) for y in seasons["year"].unique())
+
+    def season(self, year):
+        return self.seasons[self.seasons["year"] == year].sort_values("rank")
+
+    def team_trends(self, franchises):
+        return self.seasons[self.seasons["franchise"].isin(franchises)]
+
+def rolling_mean(values, group_start, window):
+    """Mean of each row's last `window` values within its group, via one cumulative sum.
+
+    values must be sorted by group; group_start[i] is the index of the first
+    row of row i's group.
+    """
+    n = len(values)
+    csum = np.concatenate(([0.0], np.cumsum(values, dtype=np.float64)))
+    idx = np.arange(n)
+    start = np.maximum(idx - window + 1, group_start)
+    return (csum[idx + 1] - csum[start]) / (idx + 1 - start)
+
+def group_starts(keys):
+    """For keys sorted into groups: whether each row starts a group, and the index where its group starts."""
+    idx = np.arange(len(keys))
+    new_group = np.ones(len(keys), dtype=bool)
+    new_group[1:] = keys[1:] != keys[:-1]
+    return new_group, np.maximum.accumulate(np.where(new_group, idx, 0))
+
+def franchise_categories(team, franchises):
+    # Map each distinct name once, not each row.
+    team = team.astype("category")
+    mapped = [franchises.get(name, name) for name in team.cat.categories]
+    codes, names = pd.factorize(pd.Index(mapped))
+    return team, pd.Categorical.from_codes(codes[team.cat.codes.to_numpy()], names)
+
+def compute(standings, window=ROLLING_SEASONS, franchises=None):
+    """StandingsAnalytics for a DataFrame with year, team, wins and losses columns."""
+    franchises = FRANCHISES if franchises is None else franchises
+    team, franchise = franchise_categories(standings["team"], franchises)
+    df = pd.DataFrame({
+        "year": standings["year"].to_numpy(dtype=np.int32),
+        "team": team.to_numpy(),
+        "franchise": franchise,
+        "wins": standings["wins"].to_numpy(dtype=np.int32),
+        "losses": standings["losses"].to_numpy(dtype=np.int32),
+    })
+    wins, losses = df["wins"].to_numpy(), df["losses"].to_numpy()
+    games = wins + losses
+    win_pct = np.divide(wins, games, out=np.full(len(df), np.nan), where=games > 0)
+    margin = wins - losses
+    df["games"] = games
+    df["win_pct"] = win_pct
+
+    # Per season: sort by year, best record first, and work on runs of equal years.
+    order = np.lexsort((-np.nan_to_num(win_pct, nan=-1.0), df["year"].to_numpy()))
+    years = df["year"].to_numpy()[order]
+    idx = np.arange(len(df))
+    new_year, year_start = group_starts(years)
+    lead = np.maximum.reduceat(margin[order], np.flatnonzero(new_year)) if len(df) else margin
+    games_behind = np.empty(len(df))
+    games_behind[order] = (np.repeat(lead, np.diff(np.append(np.flatnonzero(new_year), len(df))))
+                           - margin[order]) / 2
+    pct = win_pct[order]
+    tie_start = np.maximum.accumulate(np.where(new_year | np.append(True, pct[1:] != pct[:-1]), idx, 0))
+    rank = np.empty(len(df), dtype=np.int32)
+    rank[order] = tie_start - year_start + 1   # ties share the better place
+    df["games_behind"] = games_behind
+    df["rank"] = rank
+
+    # Per franchise: sort by franchise and year, then run along each one's seasons.
+    df = df.sort_values(["franchise", "year"], kind="stable").reset_index(drop=True)
+    years = df["year"].to_numpy()
+    new_group, group_start = group_starts(df["franchise"].cat.codes.to_numpy())
+    df["rolling_pct"] = rolling_mean(np.nan_to_num(df["win_pct"].to_numpy(), nan=0.5), group_start, window)
+
+    # A streak breaks on a new franchise, a skipped season or a change of sign.
+    sign = np.sign(df["wins"].to_numpy() - df["losses"].to_numpy())
+    breaks = new_group.copy()
+    breaks[1:] |= (years[1:] != years[:-1] + 1) | (sign[1:] != sign[:-1])
+    run_start = np.maximum.accumulate(np.where(breaks, idx, 0))
+    df["streak"] = (idx - run_start + 1) * sign
+
+    return StandingsAnalytics(df, franchise_totals(df), window)
+
+def franchise_totals(seasons):
+    grouped = seasons.assign(first_place=seasons["rank"] == 1).groupby("franchise", observed=True)
+    totals = grouped.agg(
+        first_year=("year", "min"),
+        last_year=("year", "max"),
+        seasons=("year", "size"),
+        wins=("wins", "sum"),
+        losses=("losses", "sum"),
+        best_pct=("win_pct", "max"),
+        first_places=("first_place", "sum"),
+        longest_winning_streak=("streak", "max"),
+        longest_losing_streak=("streak", "min"),
+    )
+    names = seasons[["franchise", "team"]].drop_duplicates()
+    totals["names"] = names.groupby("franchise", observed=True).size()
+    totals["win_pct"] = totals["wins"] / (totals["wins"] + totals["losses"])
+    totals["longest_winning_streak"] = totals["longest_winning_streak"].clip(lower=0)
+    totals["longest_losing_streak"] = (-totals["longest_losing_streak"]).clip(lower=0)
+    return totals.sort_values("win_pct", ascending=False).reset_index()
@@ -0,0 +1,113 @@
+"""Synthetic datasets shaped like the scraper's output, at any size.
+
+Writes mlb_stats_summary.csv, mlb_history_sections.csv and
+mlb_team_standings.csv with the scraper's headers into a directory. rows is
+the number of section rows (the big table); there is one season per
+SECTIONS_PER_SEASON of them, as in the real data, and TEAMS_PER_SEASON
+standings rows per season. Seasons get consecutive year numbers from 1871,
+so keys stay unique at any size. The same seed always writes the same files.
+
+    python synthetic_data.py --rows 1000000 --out-dir /tmp/synthetic
+"""
+import argparse
+import csv
+import os
+import random
+
+# The scraper's headers (web_scraping.STATS_FIELDS etc.), repeated here so
+# benchmarks don't need Selenium installed.
+STATS_FIELDS = ["Year", "Most Wins", "Most Losses", "Champion"]
+SECTION_FIELDS = ["Year", "Section", "Content"]
+STANDINGS_FIELDS = ["Year", "Team", "Wins", "Losses"]
+
+FIRST_YEAR = 1871
+SECTIONS_PER_SEASON = 25
+TEAMS_PER_SEASON = 8
+NOT_FOUND_RATE = 0.3   # share of seasons whose champion the parser misses
+
+CITIES = [
+    "Baltimore", "Boston", "Brooklyn", "Chicago", "Cincinnati", "Cleveland", "Detroit",
+    "Houston", "Kansas City", "Los Angeles", "Milwaukee", "Minnesota", "New York",
+    "Oakland", "Philadelphia", "Pittsburgh", "San Diego", "Seattle", "St. Louis",
+    "Tampa Bay", "Texas", "Toronto", "Washington",
+]
+NICKNAMES = [
+    "Athletics", "Blue Jays", "Braves", "Browns", "Colonels", "Cubs", "Giants", "Highlanders",
+    "Indians", "Mariners", "Orioles", "Pirates", "Red Sox", "Red Stockings", "Senators",
+    "Tigers", "Twins", "White Sox", "Yankees",
+]
+SECTIONS = ["Event Summary"] * 4 + ["Event List"]
+WORDS = (
+    "season pennant world series home run no-hitter perfect game strikeout record "
+    "manager pitcher catcher shortstop outfielder rookie veteran trade ballpark stadium "
+    "opening day doubleheader inning extra innings walk-off grand slam batting title "
+    "triple crown hall of fame league champion fans crowd attendance contract holdout "
+    "strike lockout expansion franchise relocation umpire ejection suspension injury"
+).split()
+
+def team_names():
+    return [f"{city} {nickname}" for city in CITIES for nickname in NICKNAMES]
+
+def sentences(rng, count=2000):
+    # A fixed pool of sentences keeps generation fast at 10**7 rows.
+    pool = []
+    for _ in range(count):
+        words = rng.choices(WORDS, k=rng.randint(8, 30))
+        pool.append(" ".join(words).capitalize() + ".")
+    return pool
+
+def generate(out_dir, rows, seed=0):
+    """Write the three CSVs into out_dir; returns their paths and row counts."""
+    rng = random.Random(seed)
+    teams = team_names()
+    pool = sentences(rng)
+    seasons = max(1, rows // SECTIONS_PER_SEASON)
+    os.makedirs(out_dir, exist_ok=True)
+    paths = {
+        "stats": os.path.join(out_dir, "mlb_stats_summary.csv"),
+        "sections": os.path.join(out_dir, "mlb_history_sections.csv"),
+        "standings": os.path.join(out_dir, "mlb_team_standings.csv"),
+    }
+    counts = {"stats": 0, "sections": 0, "standings": 0}
+    with open(paths["stats"], "w", newline="", encoding="utf-8") as stats_f, \
+         open(paths["sections"], "w", newline="", encoding="utf-8") as sections_f, \
+         open(paths["standings"], "w", newline="", encoding="utf-8") as standings_f:
+        stats_w, sections_w, standings_w = csv.writer(stats_f), csv.writer(sections_f), csv.writer(standings_f)
+        stats_w.writerow(STATS_FIELDS)
+        sections_w.writerow(SECTION_FIELDS)
+        standings_w.writerow(STANDINGS_FIELDS)
+        for season in range(seasons):
+            year = FIRST_YEAR + season
+            league = rng.sample(teams, TEAMS_PER_SEASON)
+            games = rng.choice((140, 154, 162))
+            records = []
+            for team in league:
+                wins = rng.randint(games // 4, games * 3 // 4)
+                records.append((team, wins, games - wins))
+            records.sort(key=lambda r: -r[1])
+            for team, wins, losses in records:
+                standings_w.writerow((year, team, wins, losses))
+            champion = "Not found" if rng.random() < NOT_FOUND_RATE else rng.choice(records[:2])[0]
+            stats_w.writerow((year, records[0][0], records[-1][0], champion))
+            # The last season takes the remainder so the total is exactly rows.
+            n_sections = SECTIONS_PER_SEASON if season < seasons - 1 else rows - counts["sections"]
+            for _ in range(n_sections):
+                text = " ".join(rng.choices(pool, k=rng.randint(1, 3)))
+                sections_w.writerow((year, rng.choice(SECTIONS), text))
+            counts["stats"] += 1
+            counts["standings"] += len(records)
+            counts["sections"] += n_sections
+    return paths, counts
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000, help="section rows to write (default: 100000)")
+    parser.add_argument("--out-dir", default="synthetic")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    paths, counts = generate(args.out_dir, args.rows, args.seed)
+    for kind, path in paths.items():
+        print(f"Wrote {counts[kind]:,} rows to {path}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""End-to-end crawls of the fixture corpus through fixture_server, with injected failures.
+
+    python -m pytest -q test_crawl.py
+"""
+import re
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+import crawl_scheduler
+import web_scraping
+from champion_matcher import default_matcher
+from fixture_corpus import write_corpus
+from fixture_server import FaultInjector, make_handler
+from page_parser import extract_yearly_stats, parse_page
+
+YEARS = range(1901, 1916)
+OUTPUTS = ["stats.csv", "sections.csv", "standings.csv", "boilerplate.csv"]
+
+@pytest.fixture(scope="module")
+def corpus(tmp_path_factory):
+    root = tmp_path_factory.mktemp("corpus")
+    write_corpus(str(root), YEARS)
+    return str(root)
+
+@pytest.fixture(autouse=True)
+def fast_backoff(monkeypatch):
+    # Keep the retries, not the seconds of waiting between them.
+    monkeypatch.setattr(crawl_scheduler, "backoff_delay", lambda *args: 0.01)
+
+def serve(corpus, **faults):
+    injector = FaultInjector(seed=0, **faults)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(corpus, injector))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, injector
+
+def no_browser():
+    raise AssertionError("the fixture pages never need a browser")
+
+def crawl(corpus, out_dir, *args, **faults):
+    """Run web_scraping.main against a fault-injecting server; returns (outputs, Prometheus counters)."""
+    server, _ = serve(corpus, **faults)
+    try:
+        out_dir.mkdir(exist_ok=True)
+        web_scraping.main([
+            "--years-url", f"http://127.0.0.1:{server.server_address[1]}/yearmenu.shtml",
+            "--stats-csv", str(out_dir / "stats.csv"),
+            "--sections-csv", str(out_dir / "sections.csv"),
+            "--standings-csv", str(out_dir / "standings.csv"),
+            "--boilerplate-csv", str(out_dir / "boilerplate.csv"),
+            "--journal", str(out_dir / "journal.jsonl"),
+            "--metrics-prom", str(out_dir / "metrics.prom"),
+            "--no-cache", "--no-columnar", "--rate", "100", "--max-rate", "500",
+            *args,
+        ], driver_factory=no_browser)
+    finally:
+        server.shutdown()
+        server.server_close()
+    outputs = {name: (out_dir / name).read_bytes() for name in OUTPUTS}
+    counters = dict(re.findall(r"^scrape_(\w+)_total (\d+)$", (out_dir / "metrics.prom").read_text(), re.M))
+    return outputs, {name: int(value) for name, value in counters.items()}
+
+@pytest.fixture(scope="module")
+def baseline(corpus, tmp_path_factory):
+    outputs, _ = crawl(corpus, tmp_path_factory.mktemp("baseline"), "--workers", "1", "--parse-workers", "0")
+    return outputs
+
+def test_baseline_has_every_year(baseline):
+    years = [line.split(b",")[0] for line in baseline["stats.csv"].splitlines()[1:]]
+    assert years == [str(year).encode() for year in YEARS]
+
+@pytest.mark.parametrize("workers, parse_workers", [(1, 0), (4, 0), (4, 2)])
+def test_outputs_do_not_depend_on_workers_or_failures(corpus, baseline, tmp_path, workers, parse_workers):
+    outputs, counters = crawl(corpus, tmp_path, "--workers", str(workers), "--parse-workers", str(parse_workers),
+                              fail_rate=0.2)
+    assert counters["fetch_retries"] > 0
+    assert "years_failed" not in counters
+    assert outputs == baseline
+
+def test_failed_years_are_requeued(corpus, baseline, tmp_path):
+    # Every year page fails twice; one retry is not enough, the re-queue is.
+    outputs, counters = crawl(corpus, tmp_path, "--workers", "4", "--parse-workers", "0", "--retries", "1",
+                              fail_first=2)
+    assert counters["years_requeued"] == len(YEARS)
+    assert "years_failed" not in counters
+    assert outputs == baseline
+
+def test_years_given_up_on_are_resumed(corpus, baseline, tmp_path):
+    _, counters = crawl(corpus, tmp_path, "--workers", "4", "--parse-workers", "0", "--retries", "0",
+                        "--requeue-rounds", "0", fail_first=1)
+    assert counters["years_failed"] == len(YEARS)
+    assert (tmp_path / "journal.jsonl").read_text() == ""
+
+    outputs, counters = crawl(corpus, tmp_path, "--workers", "4", "--parse-workers", "0", "--resume")
+    assert "years_failed" not in counters
+    assert outputs == baseline
+
+def standings_page(teams):
+    rows = "".join(f"<tr><td>{team}</td><td>{90 - i}</td><td>{60 + i}</td></tr>" for i, team in enumerate(teams))
+    return f"<html><body><table><tr><th>Team</th><th>W</th><th>L</th></tr>{rows}</table></body></html>"
+
+def test_champion_ignores_teams_from_other_pages():
+    line = "1917 World Series champion Chicago White Sox beat the New York Giants"
+    before = default_matcher.find_champion(line)
+    for teams in (["Chicago White Sox", "Boston Red Sox"], ["Chicago", "Boston"]):
+        assert extract_yearly_stats(parse_page(standings_page(teams)), "other page")["teams"]
+        assert default_matcher.find_champion(line) == before
@@ -1,231 +1,153 @@
-import re
+import argparse
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urljoin
 from selenium import webdriver
 from selenium.webdriver.firefox.options import Options  
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
 
-from bs4 import BeautifulSoup
 import csv
-import time
+
+from page_parser import (
+    RowBuffer, clean_champion_text, extract_champion_team, extract_yearly_content,
+    extract_yearly_stats, parse_page,
+)
+from bulk_loader import savepoint
+from columnar import export_datasets
+from crawl_journal import DEFAULT_JOURNAL_PATH, CrawlJournal
+from crawl_scheduler import DEFAULT_MAX_RATE, DEFAULT_RATE, DEFAULT_RETRIES, RateLimiter, RetryPolicy
+from data_access import connect_writer
+from fetch_backend import PAGE_LOAD_TIMEOUT, USER_AGENT, HttpClient, PageFetcher
+from import_to_db import purge_boilerplate, replace_year
+from page_cache import DEFAULT_CACHE_DIR, PageCache
+from scrape_metrics import NO_METRICS, ScrapeMetrics
+from scrape_pipeline import run_pipeline
+from section_dedup import drop_boilerplate, find_boilerplate, read_boilerplate, write_boilerplate
 
 MAIN_YEARS_URL = "https://www.baseball-almanac.com/yearmenu.shtml"
+REQUEUE_ROUNDS = 1
 
-def clean_champion_text(raw_text):
-    if not raw_text:
-        return "Not found"
-    text = raw_text.strip()
-    if not text:
-        return "Not found"
-
-    # Extract only letters and spaces up to where team name ends
-    match = re.match(r'^([A-Za-z\s]+)', text)
-    if match:
-        cleaned = match.group(1).strip()
-        if cleaned:
-            return cleaned
-    return text  # fallback if regex fails
-
-def extract_champion_team(line):
-    team_suffixes = [
-        "Athletics", "Red Stockings", "Wolves", "White Stockings",
-        "Browns", "Orioles", "Wolverines", "Blues",
-        "Metropolitans", "Alleghenys", "Giants", "Dodgers",
-        "Yankees", "Mets", "Cardinals", "Cubs", "Tigers",
-        "Phillies", "Indians", "Braves", "Red Sox",
-    ]
-    suffix_pattern = "|".join(team_suffixes)
-    pattern = re.compile(
-        rf"champion(?:ship)?(?:\s*[\:\-–]?\s*)([A-Z][a-zA-Z\s]*?(?:{suffix_pattern}))\b", 
-        re.IGNORECASE
-    )
-    match = pattern.search(line)
-    if match:
-        team_name = clean_champion_text(match.group(1))
-        print(f"[DEBUG] Matched champion team: '{team_name}' in line: '{line}'")
-        return team_name
-
-    alt_pattern = re.compile(
-        rf"(?:champion|pennant winner|league champion)(?:ship)?(?:\s*[\:\-–]?\s*)([A-Z][a-zA-Z\s]*?(?:{suffix_pattern}))\b",
-        re.IGNORECASE
-    )
-    alt_match = alt_pattern.search(line)
-    if alt_match:
-        team_name = clean_champion_text(alt_match.group(1))
-        print(f"[DEBUG] Matched alternate champion team: '{team_name}' in line: '{line}'")
-        return team_name
-
-    print(f"[DEBUG] No champion found in line: '{line}'")
-    return "Not found"
-
-def get_year_links(driver):
-    driver.get(MAIN_YEARS_URL)
-    print(f"Loading main page {MAIN_YEARS_URL}")
-    try:
-        WebDriverWait(driver, 30).until(
-            EC.presence_of_element_located((By.TAG_NAME, "a"))
-        )
-    except TimeoutException:
-        print("Timeout loading main years page")
-        return []
+logger = logging.getLogger(__name__)
 
+def get_year_links(fetcher, years_url=MAIN_YEARS_URL, cache=None, metrics=NO_METRICS):
+    logger.info("Loading main page %s", years_url)
+    with metrics.stage("year_links"):
+        try:
+            html = fetch_page(years_url, fetcher, cache, metrics)
+        except Exception as e:
+            logger.error("Error loading main years page: %s", e)
+            return []
+
+        links = parse_year_links(html, years_url)
+    logger.info("Found %d year links", len(links))
+    return links
+
+def parse_year_links(html, base_url):
     links = []
-    anchor_tags = driver.find_elements(By.TAG_NAME, "a")
-    for a in anchor_tags:
-        href = a.get_attribute("href")
-        if href and "yr" in href and href.endswith("a.shtml"):
+    soup = parse_page(html)
+    for a in soup.find_all("a", href=True):
+        href = urljoin(base_url, a["href"])
+        if "yr" in href and href.endswith("a.shtml"):
             year_part = href.split("/")[-1]
             year_str = year_part[2:6]
             if year_str.isdigit():
                 year = int(year_str)
                 links.append((year, href))
-    print(f"Found {len(links)} year links")
     return sorted(links, key=lambda x: x[0])
 
-def get_yearly_stats(url, driver):
-    all_teams = []
-    try:
-        print(f"\nScraping {url}")
-        driver.get(url)
-        time.sleep(2)  # wait for full load
-        print(f"Page title: {driver.title}")
-
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        tables = soup.find_all("table")
-        print(f"Found {len(tables)} tables on page")
-
-        team_table = None
-
-        # Try to find table by caption or table text containing "standings"
-        for i, table in enumerate(tables):
-            caption = table.find("caption")
-            caption_text = caption.get_text(strip=True).lower() if caption else ""
-            table_text = table.get_text(separator=" ").lower()
-
-            if "standings" in caption_text or "team standings" in caption_text:
-                team_table = table
-                print(f"Selected Table {i} by caption: {caption_text}")
-                break
-            elif "standings" in table_text or "team standings" in table_text:
-                team_table = table
-                print(f"Selected Table {i} by table text containing 'standings'")
-                break
-
-        # Fallback heuristic if no table found yet
-        if not team_table:
-            for i, table in enumerate(tables):
-                rows = table.find_all("tr")
-                if len(rows) < 5:
-                    continue
-                for row in rows[1:]:
-                    cols = row.find_all("td")
-                    if len(cols) >= 3:
-                        first_col = cols[0].get_text(strip=True)
-                        try:
-                            wins = int(cols[1].get_text(strip=True))
-                            losses = int(cols[2].get_text(strip=True))
-                            team_table = table
-                            print(f"Selected Table {i} by heuristic on row: {first_col}")
-                            break
-                        except ValueError:
-                            continue
-                if team_table:
-                    break
-
-        if not team_table:
-            print(f"No suitable team stats table found on {url}")
-            return None
-
-        rows = team_table.find_all("tr")[1:]
-        print(f"Found {len(rows)} rows in team table")
-
-        for row in rows:
-            cols = row.find_all("td")
-            if len(cols) >= 3:
-                team = cols[0].get_text(strip=True)
-                try:
-                    wins = int(cols[1].get_text(strip=True))
-                    losses = int(cols[2].get_text(strip=True))
-                    print(f"Parsed wins: {wins}, losses: {losses} for team {team}")
-                    all_teams.append({"team": team, "wins": wins, "losses": losses})
-                except ValueError as ve:
-                    print(f"ValueError parsing wins/losses: {ve} in row: {[c.get_text(strip=True) for c in cols]}")
-                    continue
-
-        if not all_teams:
-            print(f"No team data found on {url}")
-            return None
-
-        most_wins = max(all_teams, key=lambda x: x["wins"])
-        most_losses = max(all_teams, key=lambda x: x["losses"])
-
-        # Improved champion line search
-        body_text = soup.get_text(separator="\n")
-        keywords = ["world series champion", "world champion", "champion", "pennant winner", "league champion"]
-        candidate_lines = []
-
-        for line in body_text.splitlines():
-            lowered = line.lower()
-            if any(kw in lowered for kw in keywords):
-                candidate_lines.append(line.strip())
-
-        if candidate_lines:
-            # Pick the longest line as champion description
-            champion_line = max(candidate_lines, key=len)
-            champion_line = extract_champion_team(champion_line)
+def load_page(url, driver, timeout=PAGE_LOAD_TIMEOUT):
+    """Load a page once and wait until the browser reports it fully loaded."""
+    driver.get(url)
+    WebDriverWait(driver, timeout).until(
+        lambda d: d.execute_script("return document.readyState") == "complete"
+    )
+    return driver.page_source
+
+def as_fetcher(source):
+    """A PageFetcher for source, which may also be a bare WebDriver (or None offline)."""
+    if source is None or isinstance(source, PageFetcher):
+        return source
+    return PageFetcher(HttpClient(), lambda url: load_page(url, source), http_first=False)
+
+def fetch_page(url, fetcher, cache=None, metrics=NO_METRICS):
+    """Return a page's HTML, going through the on-disk cache when one is given."""
+    fetcher = as_fetcher(fetcher)
+    if cache is None:
+        html, _, _ = fetcher.load(url, metrics)
+        metrics.count("bytes_fetched", len(html.encode("utf-8")))
+        return html
+
+    entry = cache.lookup(url)
+    if cache.offline:
+        html = cache.get(url) if entry else None
+        if html is None:
+            raise LookupError(f"{url} is not in the page cache")
+        metrics.count("cache_hits")
+        return html
+
+    if entry and not cache.refresh:
+        if not (entry.get("etag") or entry.get("last_modified")):
+            # Nothing to revalidate against; past seasons do not change.
+            html = cache.get(url)
+            if html is not None:
+                metrics.count("cache_hits")
+                return html
         else:
-            champion_line = "Not found"
-
-        print(f"Champion line: {champion_line}")
-
-        return {
-            "most_wins": most_wins["team"],
-            "most_losses": most_losses["team"],
-            "champion": champion_line
-        }
-
+            try:
+                fresh = fetcher.revalidate(url, entry.get("etag"), entry.get("last_modified"), metrics)
+            except Exception as e:
+                logger.warning("Revalidation failed for %s, using cached copy: %s", url, e)
+                fresh = None
+            html = cache.get(url)
+            if fresh is None and html is not None:
+                cache.mark_checked(url)
+                metrics.count("cache_revalidated")
+                return html
+            if fresh is not None:
+                cache.put(url, *fresh)
+                metrics.count("bytes_fetched", len(fresh[0].encode("utf-8")))
+                return fresh[0]
+
+    html, etag, last_modified = fetcher.load(url, metrics)
+    metrics.count("bytes_fetched", len(html.encode("utf-8")))
+    cache.put(url, html, etag, last_modified)
+    return html
+
+def load_and_parse(url, fetcher, cache=None, metrics=NO_METRICS):
+    with metrics.stage("fetch"):
+        html = fetch_page(url, fetcher, cache, metrics)
+    with metrics.stage("parse"):
+        return parse_page(html)
+
+def get_yearly_stats(url, driver, metrics=NO_METRICS):
+    logger.info("Scraping %s", url)
+    try:
+        soup = load_and_parse(url, driver, metrics=metrics)
     except Exception as e:
-        print(f"Error scraping stats from {url}: {e}")
+        logger.error("Error scraping stats from %s: %s", url, e)
         return None
+    return extract_yearly_stats(soup, url, metrics)
 
-def get_yearly_content(url, year, writer, driver):
+def get_yearly_content(url, year, writer, driver, metrics=NO_METRICS):
+    logger.info("Scraping content: %s", url)
     try:
-        print(f"Scraping content: {url}")
-        driver.get(url)
-        time.sleep(2)
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        
-        content_div = soup.find("div", class_="main-content") or soup.find("body")
-        if content_div:
-            paragraphs = content_div.find_all(["p", "ul", "ol"])
-            for para in paragraphs:
-                section_text = para.get_text(strip=True)
-                if not section_text:
-                    continue
-                lowered = section_text.lower()
-                if (
-                    lowered.startswith("copyright") or
-                    "preserved today" in lowered or
-                    "hosted by" in lowered
-                ):
-                    continue  # skip footer/junk
-                
-                tag_name = para.name
-                section_type = "Event Summary" if tag_name == "p" else "Event List"
-
-                writer.writerow({
-                    "Year": year,
-                    "Section": section_type,
-                    "Content": section_text
-                })
+        soup = load_and_parse(url, driver, metrics=metrics)
     except Exception as e:
-        print(f"Error fetching content for {year}: {e}")
-
-def save_stats_csv(stats_list, filename="mlb_stats_summary.csv"):
-    with open(filename, "w", newline="", encoding="utf-8") as statsfile:
-        fieldnames = ["Year", "Most Wins", "Most Losses", "Champion"]
-        writer = csv.DictWriter(statsfile, fieldnames=fieldnames)
+        logger.error("Error fetching content for %s: %s", year, e)
+        return
+    extract_yearly_content(soup, year, writer, metrics)
+
+STATS_FIELDS = ["Year", "Most Wins", "Most Losses", "Champion"]
+SECTION_FIELDS = ["Year", "Section", "Content"]
+STANDINGS_FIELDS = ["Year", "Team", "Wins", "Losses"]
+
+def save_stats_csv(stats_list, filename="mlb_stats_summary.csv", metrics=NO_METRICS):
+    # Write to a temp file first so an interrupted run never leaves a half-written CSV.
+    tmp_name = filename + ".tmp"
+    with metrics.stage("save_csv"), open(tmp_name, "w", newline="", encoding="utf-8") as statsfile:
+        writer = csv.DictWriter(statsfile, fieldnames=STATS_FIELDS)
         writer.writeheader()
         for stats in stats_list:
             writer.writerow({
@@ -234,49 +156,392 @@ def save_stats_csv(stats_list, filename="mlb_stats_summary.csv"):
                 "Most Losses": stats["most_losses"],
                 "Champion": stats["champion"]
             })
+    os.replace(tmp_name, filename)
+    metrics.count("stats_rows_written", len(stats_list))
 
-def main():
+def save_sections_csv(section_rows, filename="mlb_history_sections.csv", metrics=NO_METRICS):
+    tmp_name = filename + ".tmp"
+    with metrics.stage("save_csv"), open(tmp_name, "w", newline="", encoding="utf-8") as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=SECTION_FIELDS)
+        writer.writeheader()
+        writer.writerows(section_rows)
+    os.replace(tmp_name, filename)
+    metrics.count("section_rows_written", len(section_rows))
+
+def save_standings_csv(stats_list, filename="mlb_team_standings.csv", metrics=NO_METRICS):
+    tmp_name = filename + ".tmp"
+    rows = 0
+    with metrics.stage("save_csv"), open(tmp_name, "w", newline="", encoding="utf-8") as csvfile:
+        writer = csv.DictWriter(csvfile, fieldnames=STANDINGS_FIELDS)
+        writer.writeheader()
+        for stats in stats_list:
+            for team in stats.get("teams", []):
+                writer.writerow({
+                    "Year": stats["year"],
+                    "Team": team["team"],
+                    "Wins": team["wins"],
+                    "Losses": team["losses"]
+                })
+                rows += 1
+    os.replace(tmp_name, filename)
+    metrics.count("standings_rows_written", rows)
+
+def load_existing_results(stats_csv, sections_csv, standings_csv=None):
+    """Read previously published CSVs back into {year: {"stats", "sections"}}."""
+    results = {}
+    if os.path.exists(stats_csv):
+        with open(stats_csv, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                year = int(row["Year"])
+                results.setdefault(year, {"stats": None, "sections": []})["stats"] = {
+                    "year": year,
+                    "most_wins": row["Most Wins"],
+                    "most_losses": row["Most Losses"],
+                    "champion": row["Champion"],
+                }
+    if os.path.exists(sections_csv):
+        with open(sections_csv, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                year = int(row["Year"])
+                row["Year"] = year
+                results.setdefault(year, {"stats": None, "sections": []})["sections"].append(row)
+    if standings_csv and os.path.exists(standings_csv):
+        with open(standings_csv, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                stats = results.get(int(row["Year"]), {}).get("stats")
+                if stats is not None:
+                    stats.setdefault("teams", []).append({
+                        "team": row["Team"],
+                        "wins": int(row["Wins"]),
+                        "losses": int(row["Losses"]),
+                    })
+    return results
+
+def merge_results(base, updates):
+    """Upsert per-year results; a failed scrape never wipes data we already have."""
+    merged = dict(base)
+    for year, update in updates.items():
+        current = merged.get(year, {"stats": None, "sections": []})
+        merged[year] = {
+            "stats": update["stats"] or current["stats"],
+            "sections": update["sections"] or current["sections"],
+        }
+    return merged
+
+def save_results(results, stats_csv, sections_csv, standings_csv, metrics=NO_METRICS, columnar=True,
+                 boilerplate=None):
+    """Write the CSVs, leaving out sections whose hash is in boilerplate."""
+    years = sorted(results)
+    stats_list = [results[y]["stats"] for y in years if results[y]["stats"]]
+    save_stats_csv(stats_list, stats_csv, metrics)
+    save_standings_csv(stats_list, standings_csv, metrics)
+    sections = [row for y in years for row in results[y]["sections"]]
+    kept = drop_boilerplate(sections, boilerplate)
+    metrics.count("boilerplate_sections_dropped", len(sections) - len(kept))
+    save_sections_csv(kept, sections_csv, metrics)
+    if columnar:
+        # Typed .arrow/.parquet copies for readers that can skip CSV parsing.
+        with metrics.stage("save_columnar"):
+            export_datasets([stats_csv, sections_csv, standings_csv])
+
+def parse_year_range(text):
+    """Parse "2020-2025" or "2024" into an inclusive (first, last) pair."""
+    first, sep, last = text.partition("-")
+    try:
+        first = int(first)
+        last = int(last) if sep else first
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected YEAR or FIRST-LAST, got {text!r}")
+    if first > last:
+        raise argparse.ArgumentTypeError(f"empty year range {text!r}")
+    return first, last
+
+def make_driver():
     options = Options()
     options.add_argument("--headless")
-    options.set_preference("general.useragent.override", 
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:89.0) Gecko/20100101 Firefox/89.0"
-    )
+    options.set_preference("general.useragent.override", USER_AGENT)
 
     driver = webdriver.Firefox(options=options)
-    print("Browser opened using:", driver.capabilities["browserName"])
-
-    all_stats = []
-
-    with open("mlb_history_sections.csv", "w", newline="", encoding="utf-8") as csvfile:
-        fieldnames = ["Year", "Section", "Content"]
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
+    logger.info("Browser opened using: %s", driver.capabilities["browserName"])
+    return driver
+
+class DriverPool:
+    """Gives every worker thread its own browser and quits them all on close."""
+
+    def __init__(self, factory=make_driver):
+        self.factory = factory
+        self._local = threading.local()
+        self._drivers = []
+        self._lock = threading.Lock()
+
+    def get(self):
+        driver = getattr(self._local, "driver", None)
+        if driver is None:
+            driver = self.factory()
+            self._local.driver = driver
+            with self._lock:
+                self._drivers.append(driver)
+        return driver
+
+    def close(self):
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.warning("Error closing browser: %s", e)
+
+def scrape_year(year, url, fetcher, cache=None, metrics=NO_METRICS):
+    """Load and parse a year page once, then run both extractors on it."""
+    rows = RowBuffer()
+    logger.info("Scraping %s", url)
+    try:
+        soup = load_and_parse(url, fetcher, cache, metrics)
+    except Exception as e:
+        logger.error("Error loading %s: %s", url, e)
+        return None, rows
+
+    stats = extract_yearly_stats(soup, url, metrics)
+    if stats:
+        stats["year"] = year
+    extract_yearly_content(soup, year, rows, metrics)
+    return stats, rows
+
+def make_fetcher(pool, backend="http", workers=1, limiter=None, retry=None):
+    """A PageFetcher for the crawl; browsers come from pool, and only when a page needs one.
+
+    backend "http" fetches over keep-alive HTTP and falls back to a browser for
+    pages that fail the content check; "browser" loads every page in a browser.
+    Requests are paced by limiter and failed loads retried by retry (see
+    crawl_scheduler); both default to the crawl_scheduler defaults.
+    """
+    http = HttpClient(pool_size=max(1, workers))
+    return PageFetcher(http, lambda url: load_page(url, pool.get()), http_first=backend == "http",
+                       limiter=limiter or RateLimiter(), retry=retry or RetryPolicy())
+
+def crawl(fetcher, year_links, workers=1, cache=None, journal=None, metrics=None, parse_workers=0, db=None,
+          boilerplate=None, requeue_rounds=REQUEUE_ROUNDS):
+    """Scrape the given years with up to `workers` fetch threads.
+
+    fetcher is a PageFetcher (see make_fetcher). With parse_workers 0 each
+    fetch thread also parses its pages. Otherwise pages go through
+    scrape_pipeline: the threads only fetch, parse_workers processes parse
+    (None means one per core), and this thread writes.
+
+    Returns {year: {"stats", "sections"}}. Every finished year is checkpointed
+    to the journal as soon as it completes, in whatever order workers finish,
+    and upserted into db (an open sqlite3 connection) when one is given;
+    outputs are sorted by year when they are written. Sections whose hash is
+    in boilerplate are dropped before any of that.
+
+    A year whose page still fails after the fetcher's own retries goes back
+    on the queue once the rest are done, up to requeue_rounds times. Years
+    that never load are logged together at the end and left out of the
+    journal, so --resume picks them up.
+    """
+    results = {}
+    failed = set()
+    run_metrics = metrics.run if metrics else NO_METRICS
+
+    def write(year, stats, rows):
+        if stats:
+            logger.info("%s: most wins %s, most losses %s, champion %s (%d teams)", year,
+                        stats["most_wins"], stats["most_losses"], stats["champion"], len(stats["teams"]))
+        elif rows:
+            logger.warning("Skipping %s due to missing stats.", year)
+        else:
+            failed.add(year)
+            return  # the error is logged; leave it out of the journal so it is retried
+        sections = drop_boilerplate(rows, boilerplate)
+        run_metrics.count("boilerplate_sections_dropped", len(rows) - len(sections))
+        results[year] = {"stats": stats, "sections": sections}
+        if journal is not None:
+            with run_metrics.stage("journal"):
+                journal.record(year, stats, results[year]["sections"])
+        if db is not None:
+            with run_metrics.stage("db"), savepoint(db, "year"):
+                replace_year(db, year, stats, results[year]["sections"])
+
+    def fetch(year, url, year_metrics):
+        logger.info("Scraping %s", url)
+        with year_metrics.stage("fetch"):
+            return fetch_page(url, fetcher, cache, year_metrics)
+
+    def work(link):
+        year, url = link
+        year_metrics = metrics.year(year) if metrics else NO_METRICS
+        result = scrape_year(year, url, fetcher, cache, year_metrics)
+        if metrics:
+            metrics.add(year_metrics)
+        return result
+
+    def run(links):
+        if parse_workers != 0:
+            run_pipeline(links, fetch, write, fetch_workers=workers, parse_workers=parse_workers,
+                         metrics=metrics)
+            return
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            futures = {executor.submit(work, link): link[0] for link in links}
+            for future in as_completed(futures):
+                write(futures[future], *future.result())
+
+    pending = list(year_links)
+    for attempt in range(requeue_rounds + 1):
+        if attempt:
+            logger.warning("Re-queueing %d failed years: %s", len(pending), format_years(pending))
+            run_metrics.count("years_requeued", len(pending))
+        failed.clear()
+        run(pending)
+        pending = [link for link in pending if link[0] in failed]
+        if not pending:
+            break
+    if pending:
+        logger.error("Gave up on %d years: %s. Run again with --resume to retry them.",
+                     len(pending), format_years(pending))
+        run_metrics.count("years_failed", len(pending))
+
+    return results
+
+def format_years(links):
+    return ", ".join(str(year) for year, _ in sorted(links))
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Scrape MLB season history from baseball-almanac.")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="number of threads fetching year pages in parallel (default: 1)")
+    parser.add_argument("--fetch", choices=["http", "browser"], default="http",
+                        help="http: plain keep-alive HTTP, opening a browser only for pages that fail "
+                             "the content check; browser: load every page in Firefox (default: http)")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE,
+                        help="requests per second to start each host at; the rate then adapts to "
+                             "response times and errors (default: %(default)s)")
+    parser.add_argument("--max-rate", type=float, default=DEFAULT_MAX_RATE,
+                        help="never send more than this many requests per second to a host (default: %(default)s)")
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES,
+                        help="times to retry a failed page, with jittered exponential backoff (default: %(default)s)")
+    parser.add_argument("--requeue-rounds", type=int, default=REQUEUE_ROUNDS,
+                        help="times to re-queue years still failing at the end of the crawl (default: %(default)s)")
+    parser.add_argument("--parse-workers", type=int, default=None,
+                        help="processes parsing fetched pages (default: one per CPU core; "
+                             "0 parses on the browser threads)")
+    parser.add_argument("--db", metavar="PATH",
+                        help="also upsert every finished year straight into this database "
+                             "(built beforehand by import_to_db.py)")
+    parser.add_argument("--years-url", default=MAIN_YEARS_URL,
+                        help="year menu page to start from (point at a local server for testing)")
+    parser.add_argument("--max-year", type=int, default=2025,
+                        help="last season to scrape (default: 2025)")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--resume", action="store_true",
+                      help="continue an interrupted crawl, skipping years already in the journal")
+    mode.add_argument("--years", type=parse_year_range, metavar="FIRST-LAST",
+                      help="re-scrape only these seasons (e.g. 2020-2025) from the site, not the page "
+                           "cache, and update them in the CSVs")
+    parser.add_argument("--journal", default=DEFAULT_JOURNAL_PATH,
+                        help="checkpoint file recording finished years (default: %(default)s)")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR,
+                        help="directory for the on-disk page cache (default: %(default)s)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="always load pages from the site and do not cache them")
+    parser.add_argument("--offline", action="store_true",
+                        help="replay pages from the cache only, without network access")
+    parser.add_argument("--refresh", action="store_true",
+                        help="reload every page from the site and overwrite the cache")
+    parser.add_argument("--sections-csv", default="mlb_history_sections.csv")
+    parser.add_argument("--stats-csv", default="mlb_stats_summary.csv")
+    parser.add_argument("--standings-csv", default="mlb_team_standings.csv",
+                        help="every team's wins and losses per season (default: %(default)s)")
+    parser.add_argument("--boilerplate-csv", default="mlb_boilerplate_sections.csv",
+                        help="sections repeated across most seasons (menus, headings), kept once here "
+                             "and left out of the other outputs (default: %(default)s)")
+    parser.add_argument("--no-columnar", action="store_true",
+                        help="don't write .arrow/.parquet copies of the CSVs (needs pyarrow otherwise)")
+    parser.add_argument("--log-level", default="INFO",
+                        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+                        help="DEBUG also logs per-table and per-champion details (default: INFO)")
+    parser.add_argument("--metrics-jsonl", metavar="PATH",
+                        help="write per-year stage timings and counters as JSON lines")
+    parser.add_argument("--metrics-prom", metavar="PATH",
+                        help="write crawl totals in Prometheus text exposition format")
+    return parser.parse_args(argv)
+
+def main(argv=None, driver_factory=make_driver):
+    args = parse_args(argv)
+    logging.basicConfig(level=args.log_level, format="%(asctime)s %(levelname)s %(message)s")
+    if args.offline and args.no_cache:
+        logger.error("--offline needs the page cache; drop --no-cache.")
+        return
+    # --years exists to pick up changes to those seasons, so it never trusts the cached pages.
+    refresh = args.refresh or bool(args.years)
+    cache = None if args.no_cache else PageCache(args.cache_dir, offline=args.offline, refresh=refresh)
+    journal = CrawlJournal(args.journal)
+    pool = DriverPool(driver_factory)
+    # Replaying from the cache never needs the network or a browser.
+    fetcher = None if args.offline else make_fetcher(pool, args.fetch, args.workers,
+                                                     RateLimiter(args.rate, args.max_rate),
+                                                     RetryPolicy(args.retries))
+    metrics = ScrapeMetrics() if args.metrics_jsonl or args.metrics_prom else None
+    run_metrics = metrics.run if metrics else NO_METRICS
+    known_boilerplate = read_boilerplate(args.boilerplate_csv)
+
+    if args.resume or args.years:
+        # Start from what was already published and upsert on top of it.
+        results = load_existing_results(args.stats_csv, args.sections_csv, args.standings_csv)
+    else:
+        results = {}
+        journal.reset()
+
+    finished = {}
+    if args.resume:
+        finished = journal.load()
+        results = merge_results(results, finished)
+        logger.info("Resuming: %d years already in %s", len(finished), args.journal)
 
+    try:
+        year_links = get_year_links(fetcher, args.years_url, cache, run_metrics)
+        if not year_links:
+            logger.error("No year links found. Exiting.")
+            return
+
+        selected = [(year, url) for year, url in year_links if year <= args.max_year]
+        if len(selected) < len(year_links):
+            logger.info("Stopping after year %s as requested.", args.max_year)
+        if args.years:
+            first, last = args.years
+            selected = [(year, url) for year, url in selected if first <= year <= last]
+        selected = [(year, url) for year, url in selected if year not in finished]
+        logger.info("Scraping %d years", len(selected))
+
+        db = connect_writer(args.db) if args.db else None
         try:
-            year_links = get_year_links(driver)
-            if not year_links:
-                print("No year links found. Exiting.")
-                return
-            
-            for year, url in year_links:
-                if year > 2025:
-                    print(f"Reached year {year}, stopping as requested.")
-                    break
-
-                stats = get_yearly_stats(url, driver)
-                if stats:
-                    stats["year"] = year
-                    all_stats.append(stats)
-                    print(f"{year}: {stats}")
-                else:
-                    print(f"Skipping {year} due to missing stats.")
-
-                get_yearly_content(url, year, writer, driver)
-
+            scraped = crawl(fetcher, selected, workers=args.workers, cache=cache, journal=journal, metrics=metrics,
+                            parse_workers=args.parse_workers, db=db, boilerplate=known_boilerplate,
+                            requeue_rounds=args.requeue_rounds)
+            results = merge_results(results, scraped)
+            # Now that every season is in, look for menus and headings new to this crawl.
+            boilerplate = find_boilerplate(results, known_boilerplate)
+            if db is not None and len(boilerplate) > len(known_boilerplate):
+                with savepoint(db, "boilerplate"):
+                    purge_boilerplate(db, boilerplate)
         finally:
-            driver.quit()
-
-    save_stats_csv(all_stats)
+            if db is not None:
+                db.close()
+
+    finally:
+        if fetcher is not None:
+            fetcher.http.close()
+        pool.close()
+
+    save_results(results, args.stats_csv, args.sections_csv, args.standings_csv, run_metrics,
+                 columnar=not args.no_columnar, boilerplate=boilerplate)
+    write_boilerplate(args.boilerplate_csv, boilerplate)
+
+    if metrics:
+        if args.metrics_jsonl:
+            metrics.write_jsonl(args.metrics_jsonl)
+        if args.metrics_prom:
+            metrics.write_prometheus(args.metrics_prom)
 
 if __name__ == "__main__":
     main()